@@ -104,6 +104,10 @@ async def startup_event():
     logger.info("Starting AI-Nihongo API...")
     try:
         await agent.initialize()
+        if settings.jlpt_warmup_on_startup:
+            # Load the JLPT RAG in the background so the first vocabulary
+            # request doesn't pay for the model load and index sync
+            agent.start_jlpt_warmup()
         logger.info("AI-Nihongo API started successfully")
     except Exception as e:
         logger.error(f"Failed to start AI-Nihongo API: {e}")
@@ -114,6 +118,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down AI-Nihongo API...")
+    agent.japanese_processor.close()
 
 
 @app.get("/")
@@ -125,7 +130,13 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "agent_initialized": agent.is_initialized}
+    return {
+        "status": "healthy",
+        "agent_initialized": agent.is_initialized,
+        "jlpt_rag": agent.get_jlpt_status(),
+        "analysis_cache": agent.japanese_processor.cache_stats(),
+        "tokenizer_pool": agent.japanese_processor.pool_stats()
+    }
 
 
 @app.post("/chat", response_model=MessageResponse)
@@ -174,7 +185,7 @@ async def analyze_text(
     """
     try:
         analysis = await ai_agent.analyze_japanese_text(request.text)
-        return analysis
+        return analysis.to_dict()
         
     except Exception as e:
         logger.error(f"Analysis error: {e}")
@@ -237,6 +248,29 @@ async def explain_grammar(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/jlpt/autocomplete")
+async def jlpt_autocomplete(q: str, limit: int = 10, level: Optional[str] = None):
+    """
+    As-you-type vocabulary suggestions.
+    
+    Args:
+        q: Typed prefix (kana, kanji or English)
+        limit: Number of suggestions
+        level: Optional JLPT level filter (N1-N5)
+    
+    Returns:
+        Suggestions ranked easiest JLPT level first; empty while the
+        vocabulary index is still loading
+    """
+    try:
+        suggestions = agent.autocomplete_jlpt_vocabulary(q, limit=min(max(limit, 1), 50), level=level)
+        return {"prefix": q, "suggestions": suggestions}
+    
+    except Exception as e:
+        logger.error(f"Autocomplete error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -2,7 +2,9 @@
 
 import asyncio
 import sys
-from typing import Optional
+import threading
+import time
+from typing import Callable, Optional
 
 import typer
 try:
@@ -71,6 +73,36 @@ def print_info(message: str):
         print(f"Info: {message}")
 
 
+async def read_input(read: Callable[[], str]) -> str:
+    """Wait for a blocking prompt without stopping the event loop.
+    
+    The prompt runs on a daemon thread, so background tasks such as the JLPT
+    warmup keep running while the user types and an abandoned prompt does
+    not hold up exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result: Optional[str], error: Optional[BaseException]):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def run():
+        try:
+            result = read()
+        except BaseException as e:  # EOFError / KeyboardInterrupt reach the caller
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, result, None)
+    
+    threading.Thread(target=run, name="cli-input", daemon=True).start()
+    return await future
+
+
 @app.command()
 def chat(
     message: Optional[str] = typer.Argument(None, help="Message to send to the AI"),
@@ -117,12 +149,17 @@ def chat(
             print_info("Starting interactive chat mode. Type 'quit' to exit.")
             print_info(f"Using provider: {provider or 'simple'}")
             
+            # Load JLPT vocabulary in the background while the user types
+            if settings.jlpt_warmup_on_startup:
+                agent.start_jlpt_warmup()
+            
             while True:
                 try:
+                    # The loop keeps running while the user types, so the warmup progresses
                     if console:
-                        user_input = console.input("\n[bold blue]You:[/bold blue] ")
+                        user_input = await read_input(lambda: console.input("\n[bold blue]You:[/bold blue] "))
                     else:
-                        user_input = input("\nYou: ")
+                        user_input = await read_input(lambda: input("\nYou: "))
                     
                     if user_input.lower() in ['quit', 'exit', 'bye']:
                         print_info("Goodbye! またね！")
@@ -136,7 +173,8 @@ def chat(
                             style="green"
                         )
                 
-                except KeyboardInterrupt:
+                except (EOFError, KeyboardInterrupt, asyncio.CancelledError):
+                    # Ctrl+C at the prompt cancels this task on Python 3.11+
                     print_info("\nGoodbye! またね！")
                     break
                 except Exception as e:
@@ -147,7 +185,11 @@ def chat(
             print_info("Try using the simple provider: ai-nihongo chat --provider simple")
             sys.exit(1)
     
-    asyncio.run(run_chat())
+    try:
+        asyncio.run(run_chat())
+    except KeyboardInterrupt:
+        # Before 3.11, Ctrl+C at the prompt interrupts the event loop itself
+        print_info("\nGoodbye! またね！")
 
 
 @app.command()
@@ -821,12 +863,61 @@ def jlpt_search(
     asyncio.run(run_search())
 
 
+@app.command()
+def jlpt_autocomplete(
+    prefix: str = typer.Argument(..., help="Beginning of a word, reading or English gloss"),
+    count: int = typer.Option(10, "--count", "-c", help="Number of suggestions"),
+    level: Optional[str] = typer.Option(None, "--level", "-l", help="Filter by JLPT level (N1-N5)")
+):
+    """Suggest JLPT vocabulary starting with a prefix."""
+    
+    async def run_autocomplete():
+        try:
+            from ai_nihongo.services.jlpt_rag_service import get_jlpt_rag
+            
+            rag = await get_jlpt_rag()
+            
+            start = time.perf_counter()
+            suggestions = rag.autocomplete(prefix, limit=count, jlpt_levels=[level] if level else None)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            
+            if suggestions:
+                if console:
+                    table = Table(title=f"Completions for '{prefix}' ({elapsed_ms:.3f} ms)")
+                    table.add_column("Japanese", style="cyan")
+                    table.add_column("Reading", style="magenta")
+                    table.add_column("English", style="green")
+                    table.add_column("Level", style="yellow")
+                    
+                    for suggestion in suggestions:
+                        table.add_row(
+                            suggestion['original'],
+                            suggestion['furigana'],
+                            suggestion['english'],
+                            suggestion['jlpt_level']
+                        )
+                    
+                    console.print(table)
+                else:
+                    print(f"\n{len(suggestions)} completions ({elapsed_ms:.3f} ms):")
+                    for i, suggestion in enumerate(suggestions, 1):
+                        print(f"{i:2d}. {suggestion['original']} ({suggestion['furigana']}) - {suggestion['english']} [{suggestion['jlpt_level']}]")
+            else:
+                print_warning("No completions found")
+        
+        except Exception as e:
+            print_error(f"Autocomplete failed: {e}")
+            sys.exit(1)
+    
+    asyncio.run(run_autocomplete())
+
+
 @app.command()
 def jlpt_quiz(
     level: Optional[str] = typer.Option(None, "--level", "-l", help="JLPT level (N1-N5)"),
-    count: int = typer.Option(5, "--count", "-c", help="Number of words")
+    count: int = typer.Option(5, "--count", "-c", help="Number of questions")
 ):
-    """Random JLPT vocabulary quiz."""
+    """Multiple-choice JLPT vocabulary quiz."""
     
     async def run_quiz():
         try:
@@ -836,32 +927,36 @@ def jlpt_quiz(
             print_info(f"Random vocabulary quiz{level_text}")
             
             rag = await get_jlpt_rag()
-            vocab = rag.get_random_vocabulary(jlpt_level=level, count=count)
+            questions = rag.generate_quiz(jlpt_level=level, count=count)
             
-            if vocab:
-                for i, word in enumerate(vocab, 1):
+            if questions:
+                correct = 0
+                for i, question in enumerate(questions, 1):
+                    word = question['word']
+                    options = "\n".join(
+                        f"  {n}. {choice}" for n, choice in enumerate(question['choices'], 1)
+                    )
+                    
                     if console:
-                        panel_content = f"""
-Japanese: {word['original']}
-Reading: {word['furigana']}
-English: {word['english']}
-Level: {word['jlpt_level']}
-                        """.strip()
-                        
                         console.print(Panel(
-                            panel_content,
-                            title=f"Word {i}/{len(vocab)}",
+                            f"Japanese: {word['original']}\nReading: {word['furigana']}\n\n{options}",
+                            title=f"Question {i}/{len(questions)} - {word['jlpt_level']}",
                             border_style="green"
                         ))
                     else:
-                        print(f"\nWord {i}/{len(vocab)}:")
+                        print(f"\nQuestion {i}/{len(questions)} ({word['jlpt_level']}):")
                         print(f"  Japanese: {word['original']}")
                         print(f"  Reading: {word['furigana']}")
-                        print(f"  English: {word['english']}")
-                        print(f"  Level: {word['jlpt_level']}")
+                        print(options)
                     
-                    if i < len(vocab):
-                        input("Press Enter for next word...")
+                    answer = input("Your answer: ").strip()
+                    if answer == str(question['answer'] + 1):
+                        correct += 1
+                        print_success("Correct!")
+                    else:
+                        print_warning(f"Answer: {question['answer'] + 1}. {word['english']}")
+                
+                print_info(f"Score: {correct}/{len(questions)}")
             else:
                 print_warning("No vocabulary found")
         
@@ -872,6 +967,60 @@ Level: {word['jlpt_level']}
     asyncio.run(run_quiz())
 
 
+@app.command()
+def jlpt_build_artifacts(
+    output: str = typer.Option("data/artifacts", "--output", "-o", help="Directory to write the bundle into"),
+    bundle_version: Optional[str] = typer.Option(None, "--version", "-v", help="Bundle version (defaults to a content hash)")
+):
+    """Package the JLPT vocabulary, embedding model and vectors into an offline bundle."""
+    
+    async def run_build():
+        try:
+            from ai_nihongo.services.jlpt_rag_service import get_jlpt_rag
+            
+            print_info("Initializing JLPT vocabulary system...")
+            rag = await get_jlpt_rag()
+            
+            print_info("Building artifact bundle...")
+            bundle_path = rag.build_artifacts(output, version=bundle_version)
+            
+            print_success(f"Artifact bundle written to {bundle_path}")
+            print_info(f"Start workers offline with: JLPT_ARTIFACT_PATH={bundle_path}")
+        
+        except Exception as e:
+            print_error(f"Failed to build artifacts: {e}")
+            sys.exit(1)
+    
+    asyncio.run(run_build())
+
+
+@app.command()
+def jlpt_load_artifacts(
+    path: str = typer.Argument(..., help="Bundle directory created by jlpt-build-artifacts")
+):
+    """Verify an offline JLPT artifact bundle and show its manifest."""
+    try:
+        from ai_nihongo.services.jlpt_artifacts import load_artifact_bundle
+        
+        bundle = load_artifact_bundle(path, verify=True)
+        manifest = bundle.manifest
+        
+        print_formatted(
+            f"Version: {manifest['version']}\n"
+            f"Created: {manifest['created_at']}\n"
+            f"Model: {manifest['model_name']}\n"
+            f"Entries: {manifest['entries']:,}\n"
+            f"Dimension: {manifest['dimension']}\n"
+            f"Files: {len(manifest['files'])} (checksums verified)",
+            title="JLPT Artifact Bundle",
+            style="green"
+        )
+    
+    except Exception as e:
+        print_error(f"Invalid artifact bundle: {e}")
+        sys.exit(1)
+
+
 @app.command()
 def version():
     """Show version information."""
@@ -18,7 +18,13 @@ from ..services.model_orchestrator import ModelOrchestrator, TaskType
 
 # Import JLPT RAG service
 try:
-    from ..services.jlpt_rag_service import get_jlpt_rag
+    from ..services.jlpt_rag_service import (
+        get_jlpt_rag,
+        get_jlpt_rag_if_ready,
+        get_jlpt_rag_status,
+        start_jlpt_rag_warmup,
+    )
+    from ..services.federated_retrieval import get_federated_retriever
     JLPT_RAG_AVAILABLE = True
 except ImportError:
     logger.warning("JLPT RAG service not available (missing dependencies: chromadb, sentence-transformers)")
@@ -105,8 +111,11 @@ class AIAgent(BaseAgent):
                     # Extract search terms from the message
                     search_terms = self._extract_search_terms(message)
                     if search_terms:
-                        jlpt_results = await self.search_jlpt_vocabulary(search_terms, n_results=5)
-                        logger.info(f"Found {len(jlpt_results)} JLPT vocabulary matches")
+                        rag = await self._get_jlpt_rag_for_chat()
+                        if rag is not None:
+                            # Vocabulary, kanji, grammar and examples in one concurrent round-trip
+                            jlpt_results = await get_federated_retriever(rag).search(search_terms, n_results=8)
+                            logger.info(f"Found {len(jlpt_results)} JLPT context matches")
                 except Exception as e:
                     logger.warning(f"JLPT search failed: {e}")
             
@@ -183,20 +192,41 @@ class AIAgent(BaseAgent):
         return " ".join(search_words[:3])  # Use first 3 words
     
     async def _generate_jlpt_enhanced_response(self, message: str, jlpt_results: List[Dict[str, Any]], japanese_analysis: Dict[str, Any]) -> str:
-        """Generate a response enhanced with JLPT vocabulary information."""
+        """Generate a response enhanced with JLPT vocabulary, kanji, grammar and example context."""
         if not jlpt_results:
             return await self.llm_service.generate_response(message, context=japanese_analysis)
         
-        # Build enhanced prompt with JLPT vocabulary context
-        vocab_context = "JLPT Vocabulary Context:\n"
-        for i, result in enumerate(jlpt_results[:3], 1):  # Use top 3 results
-            vocab_context += f"{i}. {result['original']} ({result['furigana']}) - {result['english']} [JLPT {result['jlpt_level']}]\n"
+        # Build enhanced prompt with one section per corpus, best matches first
+        sections = {}
+        for result in jlpt_results:
+            corpus = result.get('corpus', 'vocabulary')
+            if corpus == 'kanji':
+                words = ", ".join(f"{w['original']} ({w['furigana']})" for w in result['examples'][:3])
+                line = f"{result['kanji']} - used in {words} [JLPT {result['jlpt_level']}]"
+            elif corpus == 'grammar':
+                line = f"{result.get('pattern', '')} - {result.get('meaning', '')} [JLPT {result.get('jlpt_level', '?')}]"
+            elif corpus == 'examples':
+                line = f"{result.get('japanese', '')} - {result.get('english', '')}"
+            else:
+                line = f"{result['original']} ({result['furigana']}) - {result['english']} [JLPT {result['jlpt_level']}]"
+            sections.setdefault(corpus, []).append(line)
+        
+        titles = {
+            'vocabulary': "JLPT Vocabulary Context",
+            'kanji': "Kanji Context",
+            'grammar': "Grammar Points",
+            'examples': "Example Sentences"
+        }
+        jlpt_context = "\n\n".join(
+            f"{titles.get(corpus, corpus.title())}:\n" + "\n".join(f"{i}. {line}" for i, line in enumerate(lines, 1))
+            for corpus, lines in sections.items()
+        )
         
         enhanced_message = f"""User query: {message}
 
-{vocab_context}
+{jlpt_context}
 
-Please provide a helpful response incorporating the relevant JLPT vocabulary information above. If the user is asking about specific vocabulary, explain the words with their readings, meanings, and JLPT levels. Be educational and helpful."""
+Please provide a helpful response incorporating the relevant JLPT information above. If the user is asking about specific vocabulary, explain the words with their readings, meanings, and JLPT levels. Be educational and helpful."""
         
         return await self.llm_service.generate_response(enhanced_message, context=japanese_analysis)
     
@@ -277,6 +307,28 @@ Please provide a helpful response incorporating the relevant JLPT vocabulary inf
             logger.error(f"Grammar explanation failed: {e}")
             return f"Grammar explanation failed: {str(e)}"
     
+    async def _get_jlpt_rag_for_chat(self):
+        """Return the JLPT RAG if it is ready in time, otherwise None so chat can answer without it."""
+        try:
+            return await get_jlpt_rag(timeout=settings.jlpt_rag_wait_timeout)
+        except asyncio.TimeoutError:
+            logger.info("JLPT RAG still loading, answering without vocabulary context")
+            return None
+    
+    def start_jlpt_warmup(self) -> bool:
+        """Start loading the JLPT RAG in the background; returns False if it is unavailable."""
+        if not JLPT_RAG_AVAILABLE:
+            return False
+        
+        start_jlpt_rag_warmup()
+        return True
+    
+    def get_jlpt_status(self) -> Dict[str, Any]:
+        """Get the JLPT RAG loading state and timings."""
+        if not JLPT_RAG_AVAILABLE:
+            return {"state": "unavailable"}
+        return get_jlpt_rag_status()
+    
     async def search_jlpt_vocabulary(self, query: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """Search JLPT vocabulary using RAG system."""
         if not JLPT_RAG_AVAILABLE:
@@ -285,11 +337,39 @@ Please provide a helpful response incorporating the relevant JLPT vocabulary inf
         
         try:
             rag = await get_jlpt_rag()
-            return rag.search_vocabulary(query, n_results=n_results)
+            return await rag.search_vocabulary_async(query, n_results=n_results)
         except Exception as e:
             logger.error(f"JLPT vocabulary search failed: {e}")
             return []
     
+    async def search_jlpt_vocabulary_batch(self, queries: List[str], n_results: int = 5) -> List[List[Dict[str, Any]]]:
+        """Search JLPT vocabulary for many queries at once, aligned with the input order."""
+        if not JLPT_RAG_AVAILABLE:
+            logger.warning("JLPT RAG service not available")
+            return [[] for _ in queries]
+        
+        try:
+            rag = await get_jlpt_rag()
+            # One encode and one vector query for the whole batch, off the event loop
+            return await rag.search_vocabulary_batch_async(queries, n_results=n_results)
+        except Exception as e:
+            logger.error(f"JLPT batch vocabulary search failed: {e}")
+            return [[] for _ in queries]
+        
+    def autocomplete_jlpt_vocabulary(
+        self, prefix: str, limit: int = 10, level: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Suggest vocabulary completing ``prefix``; empty while the JLPT RAG is still loading."""
+        if not JLPT_RAG_AVAILABLE:
+            return []
+        
+        # Keystrokes never wait for the RAG to load
+        rag = get_jlpt_rag_if_ready()
+        if rag is None:
+            start_jlpt_rag_warmup()
+            return []
+        return rag.autocomplete(prefix, limit=limit, jlpt_levels=[level] if level else None)
+    
     async def get_jlpt_vocabulary_by_level(self, level: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Get vocabulary entries for a specific JLPT level."""
         if not JLPT_RAG_AVAILABLE:
@@ -337,6 +417,7 @@ Please provide a helpful response incorporating the relevant JLPT vocabulary inf
             "japanese_processor_ready": self.japanese_processor.is_initialized,
             "orchestrator_ready": self.orchestrator.is_initialized,
             "jlpt_rag_available": JLPT_RAG_AVAILABLE,
+            "jlpt_rag": self.get_jlpt_status(),
             "available_models": await self.orchestrator.get_available_models() if self.orchestrator.is_initialized else [],
             "conversation_count": len(self.conversation_history),
             "supported_tasks": [task.value for task in TaskType]
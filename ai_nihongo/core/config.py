@@ -35,6 +35,37 @@ class Settings:
         # Japanese Language Processing
         self.tokenizer_model: str = os.getenv("TOKENIZER_MODEL", "mecab")
         self.sudachi_dict_type: str = os.getenv("SUDACHI_DICT_TYPE", "core")
+        self.tokenizer_workers: int = int(os.getenv("TOKENIZER_WORKERS", "0"))
+        self.analysis_cache_size: int = int(os.getenv("ANALYSIS_CACHE_SIZE", "4096"))
+        self.analysis_cache_bytes: int = int(os.getenv("ANALYSIS_CACHE_BYTES", str(32 * 1024 * 1024)))
+        self.analysis_chunk_size: int = int(os.getenv("ANALYSIS_CHUNK_SIZE", "64"))
+        self.analysis_max_in_flight: int = int(os.getenv("ANALYSIS_MAX_IN_FLIGHT", "4"))
+        
+        # JLPT Vocabulary RAG
+        self.embedding_backend: str = os.getenv("EMBEDDING_BACKEND", "sentence-transformers")
+        self.hashing_embedding_dim: int = int(os.getenv("HASHING_EMBEDDING_DIM", "512"))
+        self.embedding_cache_dir: str = os.getenv("EMBEDDING_CACHE_DIR", "data/embeddings")
+        self.query_cache_size: int = int(os.getenv("QUERY_CACHE_SIZE", "2048"))
+        self.query_cache_ttl: float = float(os.getenv("QUERY_CACHE_TTL", "3600"))
+        self.embedding_max_batch_size: int = int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "64"))
+        self.embedding_batch_window_ms: float = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+        self.jlpt_search_backend: str = os.getenv("JLPT_SEARCH_BACKEND", "chroma")
+        self.jlpt_artifact_path: str = os.getenv("JLPT_ARTIFACT_PATH", "")
+        self.jlpt_vector_compression: str = os.getenv("JLPT_VECTOR_COMPRESSION", "none")
+        self.jlpt_rerank_factor: int = int(os.getenv("JLPT_RERANK_FACTOR", "10"))
+        self.jlpt_pca_components: int = int(os.getenv("JLPT_PCA_COMPONENTS", "0"))
+        self.jlpt_fuzzy_max_distance: int = int(os.getenv("JLPT_FUZZY_MAX_DISTANCE", "2"))
+        self.jlpt_neighbor_k: int = int(os.getenv("JLPT_NEIGHBOR_K", "16"))
+        self.jlpt_neighbor_max_entries: int = int(os.getenv("JLPT_NEIGHBOR_MAX_ENTRIES", "50000"))
+        self.jlpt_field_vectors: bool = os.getenv("JLPT_FIELD_VECTORS", "False").lower() == "true"
+        self.jlpt_ivf_nlist: int = int(os.getenv("JLPT_IVF_NLIST", "0"))
+        self.jlpt_ivf_nprobe: int = int(os.getenv("JLPT_IVF_NPROBE", "8"))
+        self.jlpt_build_chunk_size: int = int(os.getenv("JLPT_BUILD_CHUNK_SIZE", "1024"))
+        self.jlpt_build_workers: int = int(os.getenv("JLPT_BUILD_WORKERS", "0"))
+        self.jlpt_grammar_path: str = os.getenv("JLPT_GRAMMAR_PATH", "")
+        self.jlpt_examples_path: str = os.getenv("JLPT_EXAMPLES_PATH", "")
+        self.jlpt_warmup_on_startup: bool = os.getenv("JLPT_WARMUP_ON_STARTUP", "True").lower() == "true"
+        self.jlpt_rag_wait_timeout: float = float(os.getenv("JLPT_RAG_WAIT_TIMEOUT", "0"))
     
     def _load_env(self):
         """Load environment variables from .env file if it exists."""
@@ -0,0 +1,150 @@
+"""
+Prefix autocomplete over JLPT vocabulary.
+
+Surface forms, readings and English glosses are normalized and kept in one
+sorted array. The keys starting with a prefix form a contiguous range found
+with two binary searches (a romaji prefix also searches the kana it
+spells), and the best completions in that range are picked
+from a parallel rank array (easiest JLPT level first, then shortest key), so
+a keystroke costs microseconds instead of a vector search.
+"""
+
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .kana import fold_kana, romaji_to_kana
+from .lexical_index import GLOSS_SEPARATORS, normalize_text
+from .vocabulary_store import level_rank
+
+# Sorts after every character a key can contain
+_PREFIX_END = "\U0010ffff"
+
+# Keys longer than this share the lowest length rank
+_MAX_RANKED_LENGTH = 255
+
+
+def completion_key(text: str) -> str:
+    """Normalize text the same way for keys and typed prefixes."""
+    text = normalize_text(text)
+    return text if text.isascii() else fold_kana(text)
+
+
+def romaji_prefix(prefix: str) -> str:
+    """Kana typed so far in a romaji prefix ("tabe" -> "たべ", "tab" -> "た").
+
+    Trailing letters that do not yet spell a syllable are dropped; returns an
+    empty string when the prefix is not romaji.
+    """
+    kana = romaji_to_kana(prefix).rstrip("abcdefghijklmnopqrstuvwxyz")
+    if not kana or any(ch.isascii() and ch.isalpha() for ch in kana):
+        return ""
+    return fold_kana(kana)
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over the vocabulary fields.
+
+    Rows are the index rows produced by ``JLPTVocabularyRAG``; completions
+    return positions into that list.
+
+    Args:
+        rows: Index rows (``id``, ``document``, ``metadata``)
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        level_names = sorted({str(row["metadata"]["jlpt_level"]) for row in rows})
+        self.level_codes = {level: code for code, level in enumerate(level_names)}
+        # Easiest level first: N5 gets the smallest rank
+        difficulty = {level: i for i, level in enumerate(sorted(level_names, key=level_rank, reverse=True))}
+
+        entries: Dict[Tuple[str, int], None] = {}
+        for position, row in enumerate(rows):
+            metadata = row["metadata"]
+            keys = {completion_key(metadata["original"]), completion_key(metadata["furigana"])}
+            for gloss in GLOSS_SEPARATORS.split(normalize_text(metadata["english"])):
+                keys.add(gloss)
+                if gloss.startswith("to ") and len(gloss) > 3:
+                    keys.add(gloss[3:])
+            for key in keys:
+                if key:
+                    entries[(key, position)] = None
+
+        ordered = sorted(entries)
+        self.keys: List[str] = [key for key, _ in ordered]
+        self.positions = np.array([position for _, position in ordered], dtype=np.int32)
+
+        levels = [str(rows[position]["metadata"]["jlpt_level"]) for _, position in ordered]
+        self.levels = np.array([self.level_codes[level] for level in levels], dtype=np.uint8)
+        self.ranks = np.array([
+            difficulty[level] * (_MAX_RANKED_LENGTH + 1) + min(len(key), _MAX_RANKED_LENGTH)
+            for (key, _), level in zip(ordered, levels)
+        ], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def complete(
+        self,
+        prefix: str,
+        limit: int = 10,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> List[Tuple[int, str]]:
+        """
+        Best entries with a field starting with ``prefix``.
+
+        Args:
+            prefix: Typed text (Japanese, romaji or English)
+            limit: Most entries to return
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+
+        Returns:
+            ``(position, completed key)`` pairs, one per entry, best first
+        """
+        prefix = completion_key(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        # Romaji prefixes also complete the kana they spell
+        prefixes = [prefix]
+        if prefix.isascii():
+            kana = romaji_prefix(prefix)
+            if kana:
+                prefixes.append(kana)
+
+        ranges = []
+        for key in prefixes:
+            start = bisect.bisect_left(self.keys, key)
+            stop = bisect.bisect_left(self.keys, key + _PREFIX_END, lo=start)
+            if start < stop:
+                ranges.append(np.arange(start, stop))
+        if not ranges:
+            return []
+
+        candidates = np.concatenate(ranges)
+        if jlpt_levels:
+            codes = [self.level_codes[level] for level in jlpt_levels if level in self.level_codes]
+            candidates = candidates[np.isin(self.levels[candidates], codes)]
+        ranks = self.ranks[candidates]
+
+        # An entry can match through several fields, so over-fetch before
+        # deduplicating and widen until enough distinct entries are found
+        wanted = limit * 3
+        while True:
+            if wanted < len(candidates):
+                best = np.argpartition(ranks, wanted - 1)[:wanted]
+            else:
+                best = np.arange(len(candidates))
+            best = best[np.lexsort((best, ranks[best]))]
+
+            results: Dict[int, str] = {}
+            for i in candidates[best]:
+                position = int(self.positions[i])
+                if position not in results:
+                    results[position] = self.keys[i]
+                    if len(results) == limit:
+                        break
+            if len(results) == limit or wanted >= len(candidates):
+                return list(results.items())
+            wanted *= 2
@@ -0,0 +1,175 @@
+"""
+Embedding backends for the JLPT vocabulary RAG.
+
+``SentenceTransformerBackend`` wraps a (multilingual) sentence-transformers
+model. ``HashingNgramEmbedder`` is a dependency-free alternative: character
+n-grams and words are feature-hashed into a fixed-size vector, so it needs no
+download, starts instantly and is fully deterministic. It captures lexical
+rather than semantic similarity, which suits dictionary-style lookups, tests
+and low-memory instances.
+"""
+
+import json
+import math
+import re
+import unicodedata
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+DEFAULT_SENTENCE_TRANSFORMER = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+
+class EmbeddingBackend(ABC):
+    """Base class for text embedding backends."""
+
+    name = "base"
+
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """Identifier stored in index manifests and embedding caches."""
+        pass
+
+    @abstractmethod
+    def encode(self, texts: Sequence[str], show_progress_bar: bool = False) -> np.ndarray:
+        """Embed texts into a ``(len(texts), dimension)`` float32 array."""
+        pass
+
+    @abstractmethod
+    def save(self, path: str) -> None:
+        """Write everything needed to load this backend offline into ``path``."""
+        pass
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """Embeddings from a sentence-transformers model (imported on first use)."""
+
+    name = "sentence-transformers"
+
+    def __init__(self, source: str = DEFAULT_SENTENCE_TRANSFORMER, model_name: Optional[str] = None):
+        from sentence_transformers import SentenceTransformer
+
+        self.source = source
+        self._model_name = model_name or source
+        self.model = SentenceTransformer(source)
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    def encode(self, texts: Sequence[str], show_progress_bar: bool = False) -> np.ndarray:
+        embeddings = self.model.encode(list(texts), show_progress_bar=show_progress_bar)
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def save(self, path: str) -> None:
+        self.model.save(path)
+
+
+class HashingNgramEmbedder(EmbeddingBackend):
+    """Signed feature hashing of character n-grams and words.
+
+    Text is NFKC-normalized and casefolded; every character n-gram of the
+    space-padded text and every Latin word is hashed (CRC32) to a dimension
+    and a sign, weighted by ``1 + log(count)``, and the vector is
+    L2-normalized so dot products are cosine similarities.
+    """
+
+    name = "hashing"
+
+    CONFIG_FILE = "hashing_embedder.json"
+
+    def __init__(self, dimension: int = 512, min_n: int = 1, max_n: int = 3):
+        if dimension <= 0 or not 0 < min_n <= max_n:
+            raise ValueError("Hashing embedder needs dimension > 0 and 0 < min_n <= max_n")
+        self.dimension = dimension
+        self.min_n = min_n
+        self.max_n = max_n
+
+    @property
+    def model_name(self) -> str:
+        return f"hashing-ngram-{self.min_n}-{self.max_n}-d{self.dimension}"
+
+    def _features(self, text: str) -> Counter:
+        text = unicodedata.normalize("NFKC", str(text)).casefold()
+        text = " ".join(text.split())
+        padded = f" {text} "
+
+        features: Counter = Counter()
+        for n in range(self.min_n, self.max_n + 1):
+            for i in range(len(padded) - n + 1):
+                gram = padded[i:i + n]
+                if not gram.isspace():
+                    features[gram] += 1
+        for word in WORD_PATTERN.findall(text):
+            features["w:" + word] += 1
+        return features
+
+    def encode(self, texts: Sequence[str], show_progress_bar: bool = False) -> np.ndarray:
+        if isinstance(texts, str):
+            texts = [texts]
+
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vector = embeddings[row]
+            for feature, count in self._features(text).items():
+                h = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if h & 0x80000000 else -1.0
+                vector[h % self.dimension] += sign * (1.0 + math.log(count))
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    def save(self, path: str) -> None:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        config = {"dimension": self.dimension, "min_n": self.min_n, "max_n": self.max_n}
+        with open(Path(path) / self.CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+
+    @classmethod
+    def load(cls, path: str) -> "HashingNgramEmbedder":
+        with open(Path(path) / cls.CONFIG_FILE, "r", encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+
+def create_embedding_backend(
+    backend: str,
+    model_name: str = DEFAULT_SENTENCE_TRANSFORMER,
+    hashing_dimension: int = 512
+) -> EmbeddingBackend:
+    """
+    Create an embedding backend by name.
+
+    Args:
+        backend: ``sentence-transformers`` or ``hashing``
+        model_name: Model to load for the sentence-transformers backend
+        hashing_dimension: Vector size for the hashing backend
+
+    Returns:
+        The embedding backend
+    """
+    if backend == HashingNgramEmbedder.name:
+        return HashingNgramEmbedder(dimension=hashing_dimension)
+    if backend != SentenceTransformerBackend.name:
+        raise ValueError(f"Unknown embedding backend: {backend}")
+    return SentenceTransformerBackend(model_name)
+
+
+def load_embedding_backend(path: str, model_name: Optional[str] = None) -> EmbeddingBackend:
+    """Load a backend saved with ``EmbeddingBackend.save``, e.g. from an artifact bundle."""
+    if (Path(path) / HashingNgramEmbedder.CONFIG_FILE).is_file():
+        return HashingNgramEmbedder.load(path)
+    return SentenceTransformerBackend(path, model_name=model_name)
@@ -0,0 +1,200 @@
+"""
+Persistent embedding cache shared across processes.
+
+Vectors are appended to a raw float32 file and read back through a
+read-only memory map, so every API worker and CLI run on a host shares the
+same page-cache copy instead of re-encoding or holding private arrays.
+Rows are keyed by a hash of the embedded text and partitioned by model.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked appends
+    fcntl = None
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Append-only, memory-mapped embedding store keyed by text hash and model name.
+
+    Layout per model (``<slug>`` is the sanitized model name):
+
+    - ``<slug>.f32``: row-major float32 vectors
+    - ``<slug>.keys``: one text hash per line, in row order
+    - ``<slug>.json``: model name and vector dimension
+
+    Vectors are always written before their keys, so a reader that only trusts
+    rows with a complete key line never sees a half-written vector.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model_name = model_name
+
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+        self.vectors_path = self.cache_dir / f"{slug}.f32"
+        self.keys_path = self.cache_dir / f"{slug}.keys"
+        self.meta_path = self.cache_dir / f"{slug}.json"
+        self.lock_path = self.cache_dir / f"{slug}.lock"
+
+        self.dimension: Optional[int] = None
+        # Set when the files belong to another model whose name maps to the same slug
+        self.disabled = False
+        self._index: Dict[str, int] = {}
+        self._row_count = 0
+        self._keys_offset = 0
+        self._vectors: Optional[np.memmap] = None
+
+        self.refresh()
+
+    @staticmethod
+    def text_key(text: str) -> str:
+        """Return the cache key for a piece of text."""
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def vectors(self) -> Optional[np.memmap]:
+        """Read-only memory map over every cached vector, in row order."""
+        return self._vectors
+
+    def refresh(self) -> None:
+        """Pick up rows appended by other processes since the last refresh."""
+        if self.dimension is None and not self.disabled and self.meta_path.exists():
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("model", self.model_name) != self.model_name:
+                logger.warning(f"Embedding cache {self.vectors_path} holds vectors for {meta['model']}, "
+                               f"not {self.model_name}; caching disabled")
+                self.disabled = True
+                return
+            self.dimension = int(meta["dimension"])
+
+        if self.disabled or self.dimension is None or not self.keys_path.exists():
+            return
+
+        with open(self.keys_path, "rb") as f:
+            f.seek(self._keys_offset)
+            tail = f.read()
+
+        # Ignore a trailing partial line; it is completed by the next refresh
+        complete = tail[:tail.rfind(b"\n") + 1]
+        if not complete:
+            return
+
+        for line in complete.decode("ascii").splitlines():
+            self._index.setdefault(line, self._row_count)
+            self._row_count += 1
+        self._keys_offset += len(complete)
+
+        self._vectors = np.memmap(
+            self.vectors_path,
+            dtype=np.float32,
+            mode="r",
+            shape=(self._row_count, self.dimension)
+        )
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Return cached vectors for ``texts``, with ``None`` for misses."""
+        self.refresh()
+        if self.disabled:
+            return [None] * len(texts)
+
+        results: List[Optional[np.ndarray]] = []
+        for text in texts:
+            row = self._index.get(self.text_key(text))
+            results.append(self._vectors[row] if row is not None else None)
+        return results
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray) -> int:
+        """Append vectors for ``texts`` that are not cached yet.
+
+        Returns:
+            Number of rows actually written
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if len(texts) != len(vectors):
+            raise ValueError("texts and vectors must have the same length")
+        if len(texts) == 0 or self.disabled:
+            return 0
+
+        with open(self.lock_path, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                # Another process may have written the metadata or some of
+                # these rows while we waited
+                self.refresh()
+                if self.disabled:
+                    return 0
+                if self.dimension is None:
+                    self.dimension = int(vectors.shape[1])
+                    self._write_meta()
+                elif vectors.shape[1] != self.dimension:
+                    raise ValueError(
+                        f"Vector dimension {vectors.shape[1]} does not match cache dimension {self.dimension}"
+                    )
+
+                new_keys = []
+                new_rows = []
+                pending = set()
+                for i, text in enumerate(texts):
+                    key = self.text_key(text)
+                    if key not in self._index and key not in pending:
+                        pending.add(key)
+                        new_keys.append(key)
+                        new_rows.append(i)
+
+                if not new_keys:
+                    return 0
+
+                self._truncate_torn_rows()
+
+                with open(self.vectors_path, "ab") as f:
+                    f.write(vectors[new_rows].tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                with open(self.keys_path, "a", encoding="ascii") as f:
+                    f.write("".join(f"{key}\n" for key in new_keys))
+
+                self.refresh()
+                return len(new_keys)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _write_meta(self) -> None:
+        """Record the model and dimension the vector file was written with."""
+        tmp_path = self.meta_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"model": self.model_name, "dimension": self.dimension}, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def _truncate_torn_rows(self) -> None:
+        """Drop vector bytes left behind by a writer that died before writing its keys."""
+        if not self.vectors_path.exists():
+            return
+
+        expected = self._row_count * self.dimension * np.dtype(np.float32).itemsize
+        if self.vectors_path.stat().st_size > expected:
+            logger.warning(f"Truncating incomplete rows in {self.vectors_path}")
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(expected)
@@ -0,0 +1,150 @@
+"""
+Micro-batching embedding executor.
+
+Encoding runs on one dedicated worker thread instead of the asyncio event
+loop. Requests that arrive within a short batching window are merged into a
+single ``encode`` call, so concurrent searches share one forward pass and the
+loop keeps serving other requests while the model runs.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EmbeddingExecutor:
+    """Collects encode requests from any thread and runs them in batches.
+
+    Args:
+        encode: Function mapping a list of texts to a ``(len(texts), dim)`` array
+        max_batch_size: Most texts encoded in one call
+        batch_window: Seconds to wait for more requests after the first arrives
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 64,
+        batch_window: float = 0.005
+    ):
+        self.encode = encode
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = max(0.0, batch_window)
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self._batches = 0
+        self._requests = 0
+        self._texts = 0
+        self._encoded = 0
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="embedding-executor", daemon=True)
+                self._thread.start()
+
+    def submit(self, texts: Sequence[str]) -> "Future[np.ndarray]":
+        """Queue texts for encoding; the future resolves to their embeddings in order."""
+        future: "Future[np.ndarray]" = Future()
+        if not texts:
+            future.set_result(np.empty((0, 0), dtype=np.float32))
+            return future
+
+        self._ensure_started()
+        self._queue.put((list(texts), future))
+        return future
+
+    async def encode_async(self, texts: Sequence[str]) -> np.ndarray:
+        """Encode texts without blocking the running event loop."""
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def encode_sync(self, texts: Sequence[str]) -> np.ndarray:
+        """Encode texts, blocking the caller until the batch containing them is done."""
+        return self.submit(texts).result()
+
+    def _collect(self, first: Tuple[List[str], Future]) -> Tuple[List[Tuple[List[str], Future]], bool]:
+        """Gather requests that arrive within the batching window."""
+        batch = [first]
+        size = len(first[0])
+        deadline = time.monotonic() + self.batch_window
+
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+            size += len(item[0])
+
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stopping = self._collect(item)
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[List[str], Future]]) -> None:
+        """Encode each distinct text in the batch once and resolve every future."""
+        batch = [(texts, future) for texts, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        unique = list(dict.fromkeys(text for texts, _ in batch for text in texts))
+        try:
+            embeddings = np.asarray(self.encode(unique))
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(unique)} texts failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        rows = {text: i for i, text in enumerate(unique)}
+        for texts, future in batch:
+            future.set_result(embeddings[[rows[text] for text in texts]])
+
+        self._batches += 1
+        self._requests += len(batch)
+        self._texts += sum(len(texts) for texts, _ in batch)
+        self._encoded += len(unique)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Finish queued work and stop the worker thread."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batching counters."""
+        return {
+            "batches": self._batches,
+            "requests": self._requests,
+            "texts": self._texts,
+            "encoded": self._encoded,
+            "mean_batch_requests": round(self._requests / self._batches, 2) if self._batches else 0.0,
+            "pending": self._queue.qsize()
+        }
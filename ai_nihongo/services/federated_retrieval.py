@@ -0,0 +1,379 @@
+"""
+Federated retrieval across several JLPT corpora.
+
+A ``FederatedRetriever`` owns a set of corpora (vocabulary, kanji, grammar
+points, example sentences), each with its own index. A query is encoded once,
+fanned out to every corpus concurrently, and the per-corpus results are merged
+after min-max score normalization, with a quota guaranteeing each corpus a
+share of the context.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+from ..core.config import settings
+from .japanese_scripts import script_profile
+from .vector_backends import NumpySearchBackend
+from .vocabulary_store import level_rank
+
+# Context slots reserved per corpus when merging; scaled down by
+# ``fit_quotas`` when the corpora present reserve more than a search returns
+DEFAULT_QUOTAS = {"vocabulary": 4, "kanji": 2, "grammar": 2, "examples": 2}
+
+
+def fit_quotas(quotas: Dict[str, int], n_results: int) -> Dict[str, int]:
+    """Scale quotas down proportionally so they reserve at most ``n_results`` slots.
+
+    Leftover slots from rounding go to the corpora with the largest
+    fractional share, earlier corpora first on ties.
+    """
+    total = sum(max(0, quota) for quota in quotas.values())
+    if total <= n_results:
+        return dict(quotas)
+
+    shares = {name: max(0, quota) * n_results / total for name, quota in quotas.items()}
+    fitted = {name: int(share) for name, share in shares.items()}
+    remainder = n_results - sum(fitted.values())
+    for name in sorted(shares, key=lambda name: fitted[name] - shares[name])[:remainder]:
+        fitted[name] += 1
+    return fitted
+
+
+class Corpus(ABC):
+    """A searchable collection of study material."""
+
+    name = "corpus"
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Return up to ``n_results`` entries with a ``similarity_score``, best first."""
+        pass
+
+
+class VocabularyCorpus(Corpus):
+    """The JLPT vocabulary served by ``JLPTVocabularyRAG`` and its vector backend."""
+
+    name = "vocabulary"
+
+    def __init__(self, rag):
+        self.rag = rag
+
+    def search(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        return self.rag.search_with_embedding(query, query_embedding, n_results, jlpt_levels)
+
+
+class DocumentCorpus(Corpus):
+    """In-memory corpus of records with its own exact vector index.
+
+    The index is built by ``build_index`` or on first search, whichever comes
+    first. With ``index_path`` the vectors are persisted and reused while the
+    model and the embedded texts are unchanged.
+
+    Args:
+        name: Corpus name, reported on every result
+        records: Entries to index; ``jlpt_level`` enables level filtering
+        text: Builds the embedded text of a record
+        encode_documents: Embeds a list of texts with the query model
+        model_name: Embedding model, part of the persisted fingerprint
+        index_path: ``.npz`` file to persist the vectors to
+    """
+
+    def __init__(
+        self,
+        name: str,
+        records: List[Dict[str, Any]],
+        text: Callable[[Dict[str, Any]], str],
+        encode_documents: Callable[[List[str]], np.ndarray],
+        model_name: str = "",
+        index_path: Optional[str] = None
+    ):
+        self.name = name
+        self.records = records
+        self.text = text
+        self.encode_documents = encode_documents
+        self.model_name = model_name
+        self.index_path = index_path
+        self.backend: Optional[NumpySearchBackend] = None
+        self._build_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def build_index(self) -> NumpySearchBackend:
+        """Build (or load) the vector index if it is not ready yet."""
+        if self.backend is None:
+            with self._build_lock:
+                if self.backend is None:
+                    documents = [self.text(record) for record in self.records]
+                    self.backend = NumpySearchBackend(
+                        [str(i) for i in range(len(self.records))],
+                        self._document_vectors(documents),
+                        [{"jlpt_level": str(record.get("jlpt_level", ""))} for record in self.records],
+                        documents
+                    )
+                    logger.info(f"Indexed {len(self.records)} entries in the {self.name} corpus")
+        return self.backend
+
+    def _document_vectors(self, documents: List[str]) -> np.ndarray:
+        """Persisted vectors for ``documents`` when still current, else freshly encoded ones."""
+        digest = hashlib.sha1(self.model_name.encode("utf-8"))
+        digest.update("\x1e".join(documents).encode("utf-8"))
+        fingerprint = digest.hexdigest()
+
+        if self.index_path and os.path.exists(self.index_path):
+            try:
+                with np.load(self.index_path) as data:
+                    if str(data["fingerprint"]) == fingerprint:
+                        logger.info(f"Loaded {self.name} vectors from {self.index_path}")
+                        return data["vectors"]
+                logger.info(f"{self.name.capitalize()} vectors are stale, re-encoding")
+            except Exception as e:
+                logger.warning(f"Could not read {self.name} vectors {self.index_path}: {e}")
+
+        vectors = np.asarray(self.encode_documents(documents), dtype=np.float32)
+        if self.index_path:
+            # Written atomically so concurrent workers never read a partial file
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez(f, fingerprint=fingerprint, vectors=vectors)
+            os.replace(tmp_path, self.index_path)
+        return vectors
+
+    def search(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        if not self.records:
+            return []
+
+        results = self.build_index().query(query_embedding[np.newaxis, :], n_results, jlpt_levels)
+        return [
+            {**self.records[int(record_id)], 'similarity_score': 1.0 - distance}
+            for record_id, distance in zip(results["ids"][0], results["distances"][0])
+        ]
+
+
+def kanji_records(vocabulary) -> List[Dict[str, Any]]:
+    """Derive one entry per kanji from the vocabulary words that use it.
+
+    The kanji's level is the easiest level of any word containing it, and its
+    example words are listed easiest first.
+    """
+    words: Dict[str, List[int]] = defaultdict(list)
+    for row_id, original in enumerate(vocabulary.original):
+        for char in dict.fromkeys(script_profile(original).kanji_chars()):
+            words[char].append(row_id)
+
+    records = []
+    for kanji, row_ids in words.items():
+        row_ids.sort(key=lambda row_id: -level_rank(vocabulary.level(row_id)))
+        examples = [vocabulary.entry(row_id) for row_id in row_ids[:5]]
+        records.append({
+            'kanji': kanji,
+            'jlpt_level': examples[0]['jlpt_level'],
+            'word_count': len(row_ids),
+            'examples': examples
+        })
+    return records
+
+
+def _kanji_text(record: Dict[str, Any]) -> str:
+    words = "; ".join(f"{w['original']} ({w['furigana']}) {w['english']}" for w in record['examples'])
+    return f"Kanji: {record['kanji']} Words: {words}"
+
+
+def _grammar_text(record: Dict[str, Any]) -> str:
+    return (f"Grammar: {record.get('pattern', '')} "
+            f"Meaning: {record.get('meaning', '')} "
+            f"{record.get('explanation', '')}").strip()
+
+
+def _example_text(record: Dict[str, Any]) -> str:
+    return f"Japanese: {record.get('japanese', '')} English: {record.get('english', '')}"
+
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    """Load a JSON list of corpus records; a missing or empty path yields none."""
+    if not path:
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    except FileNotFoundError:
+        logger.warning(f"Corpus file not found: {path}")
+        return []
+    if not isinstance(records, list):
+        raise ValueError(f"Corpus file {path} must contain a JSON list")
+    return records
+
+
+class FederatedRetriever:
+    """Fans a query out to several corpora and merges the results.
+
+    Args:
+        corpora: Corpora to search, keyed by their ``name``
+        encode_query: Async function embedding one query with the shared model
+        quotas: Results reserved per corpus in the merged list
+    """
+
+    def __init__(
+        self,
+        corpora: List[Corpus],
+        encode_query: Callable[[str], Any],
+        quotas: Optional[Dict[str, int]] = None
+    ):
+        self.corpora = {corpus.name: corpus for corpus in corpora}
+        self.encode_query = encode_query
+        self.quotas = dict(DEFAULT_QUOTAS if quotas is None else quotas)
+
+    def build_indexes(self) -> None:
+        """Build every corpus index now rather than on the first search."""
+        for corpus in self.corpora.values():
+            if isinstance(corpus, DocumentCorpus):
+                corpus.build_index()
+
+    @staticmethod
+    def _normalize_scores(results: List[Dict[str, Any]]) -> None:
+        """Min-max scale a corpus's scores to [0, 1] so corpora are comparable."""
+        if not results:
+            return
+        scores = [result['similarity_score'] for result in results]
+        low, high = min(scores), max(scores)
+        for result, score in zip(results, scores):
+            result['normalized_score'] = 1.0 if high == low else (score - low) / (high - low)
+
+    async def _search_corpus(self, corpus: Corpus, query: str, embedding: np.ndarray, limit: int, jlpt_levels):
+        try:
+            # Index scans release the GIL, so corpora really are searched in parallel
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(None, corpus.search, query, embedding, limit, jlpt_levels)
+        except Exception as e:
+            logger.warning(f"Search in the {corpus.name} corpus failed: {e}")
+            return []
+        for result in results:
+            result['corpus'] = corpus.name
+        return results
+
+    async def search(
+        self,
+        query: str,
+        n_results: int = 8,
+        jlpt_levels: Optional[List[str]] = None,
+        quotas: Optional[Dict[str, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search every corpus concurrently and merge the results.
+
+        Args:
+            query: Search query
+            n_results: Total number of results to return
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+            quotas: Per-corpus reserved slots, overriding the defaults; scaled
+                down when they add up to more than ``n_results``
+
+        Returns:
+            Results from all corpora, each tagged with ``corpus`` and
+            ``normalized_score``, quota picks first and then the best remaining
+        """
+        quotas = self.quotas if quotas is None else quotas
+        # Only corpora that exist compete for the n_results slots
+        quotas = fit_quotas({name: quotas.get(name, 0) for name in self.corpora}, n_results)
+        embedding = await self.encode_query(query)
+
+        searches = [
+            self._search_corpus(corpus, query, embedding, max(quotas.get(name, 0), n_results), jlpt_levels)
+            for name, corpus in self.corpora.items()
+        ]
+        per_corpus = dict(zip(self.corpora, await asyncio.gather(*searches)))
+
+        merged, leftovers = [], []
+        for name, results in per_corpus.items():
+            self._normalize_scores(results)
+            quota = quotas.get(name, 0)
+            merged.extend(results[:quota])
+            leftovers.extend(results[quota:])
+
+        merged.sort(key=lambda result: result['normalized_score'], reverse=True)
+        merged = merged[:n_results]
+        if len(merged) < n_results:
+            leftovers.sort(key=lambda result: result['normalized_score'], reverse=True)
+            merged.extend(leftovers[:n_results - len(merged)])
+
+        logger.info(f"Federated search for '{query}': " + ", ".join(
+            f"{name}={sum(1 for r in merged if r['corpus'] == name)}" for name in self.corpora
+        ))
+        return merged
+
+
+def build_federated_retriever(rag) -> FederatedRetriever:
+    """Create the retriever for an initialized ``JLPTVocabularyRAG``.
+
+    Kanji entries are derived from the vocabulary; grammar points and example
+    sentences are loaded from ``JLPT_GRAMMAR_PATH`` / ``JLPT_EXAMPLES_PATH``
+    when configured.
+    """
+    def encode_documents(texts: List[str]) -> np.ndarray:
+        return rag._encode_documents(texts, show_progress_bar=False)
+
+    def document_corpus(name: str, records: List[Dict[str, Any]], text) -> DocumentCorpus:
+        # Vectors persist next to the collection, like the field and neighbour indexes
+        index_path = str(rag.db_path / f"{rag.collection_name}_{name}.npz")
+        return DocumentCorpus(name, records, text, encode_documents, rag.model_name, index_path)
+
+    corpora: List[Corpus] = [VocabularyCorpus(rag)]
+    corpora.append(document_corpus("kanji", kanji_records(rag.vocabulary), _kanji_text))
+
+    grammar = load_records(settings.jlpt_grammar_path)
+    if grammar:
+        corpora.append(document_corpus("grammar", grammar, _grammar_text))
+    examples = load_records(settings.jlpt_examples_path)
+    if examples:
+        corpora.append(document_corpus("examples", examples, _example_text))
+
+    async def encode_query(query: str) -> np.ndarray:
+        return (await rag._encode_queries_async([query]))[0]
+
+    return FederatedRetriever(corpora, encode_query)
+
+
+_retriever: Optional[FederatedRetriever] = None
+_retriever_rag = None
+
+
+def get_federated_retriever(rag) -> FederatedRetriever:
+    """Get the retriever for ``rag``, creating it on first use."""
+    global _retriever, _retriever_rag
+
+    if _retriever is None or _retriever_rag is not rag:
+        _retriever = build_federated_retriever(rag)
+        _retriever_rag = rag
+    return _retriever
@@ -0,0 +1,228 @@
+"""
+Field-specific vectors for the JLPT vocabulary.
+
+Instead of one vector per entry for the whole "Japanese: ... Reading: ...
+English: ..." document, each entry gets one vector per field: its surface
+form, its reading and its English gloss. A query is routed by script to the
+fields it can match (Japanese text to surface and reading, Latin text to the
+English gloss), so every search scans fewer, denser vectors than the mixed
+document index.
+"""
+
+import hashlib
+import os
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+from .japanese_scripts import script_profile
+from .vector_backends import NumpySearchBackend
+
+FIELDS = ("surface", "reading", "english")
+
+# Metadata key holding each field's text
+FIELD_KEYS = {"surface": "original", "reading": "furigana", "english": "english"}
+
+BackendFactory = Callable[[str, List[str], np.ndarray, List[Dict[str, Any]], List[str]], NumpySearchBackend]
+
+
+def route_query(query: str) -> Tuple[str, ...]:
+    """
+    Pick the fields a query should be matched against from its script.
+
+    Args:
+        query: Search query
+
+    Returns:
+        ``("surface", "reading")`` for Japanese text, ``("english",)`` for
+        Latin text, and every field for mixed or script-less queries
+    """
+    profile = script_profile(unicodedata.normalize("NFKC", query))
+    japanese = profile.japanese > 0
+    latin = profile.latin > 0
+    if japanese and not latin:
+        return ("surface", "reading")
+    if latin and not japanese:
+        return ("english",)
+    return FIELDS
+
+
+class FieldVectorIndex:
+    """One search backend per vocabulary field, queried by script.
+
+    Readings identical to the surface form (kana-only words) are stored once,
+    in the surface matrix. Vectors are persisted to ``index_path`` and reused
+    while the field texts and the model are unchanged.
+
+    Args:
+        rows: Index rows (``id``, ``document``, ``metadata``) from the RAG
+        encode_documents: Embeds a list of texts with the query model
+        model_name: Embedding model, part of the persisted fingerprint
+        index_path: ``.npz`` file to persist the field vectors to
+        backend_factory: Creates the backend for one field; exact numpy search by default
+    """
+
+    def __init__(
+        self,
+        rows: List[Dict[str, Any]],
+        encode_documents: Callable[[List[str]], np.ndarray],
+        model_name: str = "",
+        index_path: Optional[str] = None,
+        backend_factory: Optional[BackendFactory] = None
+    ):
+        field_rows = self._field_rows(rows)
+        texts = {
+            field: [str(rows[i]["metadata"][FIELD_KEYS[field]]) for i in positions]
+            for field, positions in field_rows.items()
+        }
+
+        fingerprint = self._fingerprint(model_name, texts)
+        vectors = self._load_vectors(index_path, fingerprint) if index_path else None
+        if vectors is None:
+            vectors = self._encode_fields(texts, encode_documents)
+            if index_path:
+                self._save_vectors(index_path, fingerprint, vectors)
+        else:
+            logger.info(f"Loaded field vectors from {index_path}")
+
+        factory = backend_factory or (lambda field, *args: NumpySearchBackend(*args))
+        self.backends: Dict[str, NumpySearchBackend] = {}
+        for field, positions in field_rows.items():
+            self.backends[field] = factory(
+                field,
+                [rows[i]["id"] for i in positions],
+                vectors[field],
+                [rows[i]["metadata"] for i in positions],
+                [rows[i]["document"] for i in positions]
+            )
+
+        logger.info("Field vector index: " + ", ".join(
+            f"{field}={backend.count()}" for field, backend in self.backends.items()
+        ))
+
+    @staticmethod
+    def _field_rows(rows: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        """Row positions indexed per field; readings equal to the surface form are skipped."""
+        everything = list(range(len(rows)))
+        readings = [
+            i for i, row in enumerate(rows)
+            if row["metadata"]["furigana"] and row["metadata"]["furigana"] != row["metadata"]["original"]
+        ]
+        return {"surface": everything, "reading": readings, "english": everything}
+
+    @staticmethod
+    def _fingerprint(model_name: str, texts: Dict[str, List[str]]) -> str:
+        """Identify the model and field texts a set of vectors was encoded from."""
+        digest = hashlib.sha1(model_name.encode("utf-8"))
+        for field in FIELDS:
+            digest.update(f"\x1e{field}\x1e".encode("utf-8"))
+            digest.update("\x1f".join(texts[field]).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _encode_fields(
+        texts: Dict[str, List[str]],
+        encode_documents: Callable[[List[str]], np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """Encode every distinct field text once and split the vectors back per field."""
+        unique = list(dict.fromkeys(text for field in FIELDS for text in texts[field]))
+        logger.info(f"Encoding {len(unique)} distinct field texts")
+        encoded = np.asarray(encode_documents(unique), dtype=np.float32) if unique else None
+        rows = {text: i for i, text in enumerate(unique)}
+
+        vectors = {}
+        for field in FIELDS:
+            if texts[field]:
+                vectors[field] = encoded[[rows[text] for text in texts[field]]]
+            else:
+                dimension = encoded.shape[1] if encoded is not None else 0
+                vectors[field] = np.empty((0, dimension), dtype=np.float32)
+        return vectors
+
+    @staticmethod
+    def _load_vectors(path: str, fingerprint: str) -> Optional[Dict[str, np.ndarray]]:
+        """Read persisted field vectors if they were encoded from the same texts."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                if str(data["fingerprint"]) != fingerprint:
+                    logger.info("Field vectors are stale, re-encoding")
+                    return None
+                return {field: data[field] for field in FIELDS}
+        except Exception as e:
+            logger.warning(f"Could not read field vectors {path}: {e}")
+            return None
+
+    @staticmethod
+    def _save_vectors(path: str, fingerprint: str, vectors: Dict[str, np.ndarray]) -> None:
+        """Write the vectors atomically so concurrent workers never read a partial file."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, fingerprint=fingerprint, **vectors)
+        os.replace(tmp_path, path)
+
+    def query(
+        self,
+        queries: List[str],
+        query_embeddings: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Search each query's routed fields and merge them per entry.
+
+        An entry matched through several fields keeps its best similarity.
+
+        Args:
+            queries: Query texts, used for routing
+            query_embeddings: One embedding per query
+            n_results: Number of results per query
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+
+        Returns:
+            A backend query response (``ids``, ``metadatas``, ``documents``,
+            ``distances``) with one list per query
+        """
+        query_embeddings = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+
+        # Queries with the same route are searched together, one matrix product per field
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for i, query in enumerate(queries):
+            groups.setdefault(route_query(query), []).append(i)
+
+        merged: List[Dict[str, Tuple[float, Dict[str, Any], str]]] = [{} for _ in queries]
+        for fields, members in groups.items():
+            for field in fields:
+                results = self.backends[field].query(query_embeddings[members], n_results, jlpt_levels)
+                for j, i in enumerate(members):
+                    best = merged[i]
+                    for entry_id, metadata, document, distance in zip(
+                        results["ids"][j], results["metadatas"][j],
+                        results["documents"][j], results["distances"][j]
+                    ):
+                        if entry_id not in best or distance < best[entry_id][0]:
+                            best[entry_id] = (distance, metadata, document)
+
+        response: Dict[str, List[List[Any]]] = {"ids": [], "metadatas": [], "documents": [], "distances": []}
+        for best in merged:
+            ranked = sorted(best.items(), key=lambda item: item[1][0])[:n_results]
+            response["ids"].append([entry_id for entry_id, _ in ranked])
+            response["metadatas"].append([metadata for _, (_, metadata, _) in ranked])
+            response["documents"].append([document for _, (_, _, document) in ranked])
+            response["distances"].append([distance for _, (distance, _, _) in ranked])
+        return response
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Vectors and bytes held per field."""
+        return {
+            field: {"vectors": backend.count(), "index_bytes": backend.memory_report()["index_bytes"]}
+            for field, backend in self.backends.items()
+        }
@@ -0,0 +1,212 @@
+"""
+Typo-tolerant reading lookup for JLPT vocabulary.
+
+Readings are indexed twice, as folded hiragana and as romaji, in a
+symmetric-delete (SymSpell) index: every string up to ``max_distance``
+deletions away from an indexed key's prefix is precomputed, so a lookup only
+generates the query's own deletes and verifies the few keys they hit with a
+bounded edit distance, instead of comparing against the whole dictionary.
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .kana import fold_kana, is_romaji, kana_to_romaji
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions).
+
+    Returns:
+        The distance, or ``max_distance + 1`` as soon as it is known to exceed
+        ``max_distance``
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if a == b:
+        return 0
+
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def deletes(text: str, max_distance: int) -> Set[str]:
+    """``text`` and every string reachable from it by up to ``max_distance`` deletions."""
+    results = {text}
+    frontier = {text}
+    for _ in range(max_distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))} - results
+        if not frontier:
+            break
+        results.update(frontier)
+    return results
+
+
+class SymSpellIndex:
+    """Symmetric-delete index mapping keys to the positions that own them.
+
+    Args:
+        max_distance: Largest edit distance a lookup can ask for
+        prefix_length: Only this many leading characters are expanded into
+            deletes, which bounds index size for long keys
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.keys: List[str] = []
+        self.postings: List[List[int]] = []
+        self._key_ids: Dict[str, int] = {}
+        self._deletes: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str, position: int) -> None:
+        """Index ``key`` for ``position``."""
+        if not key:
+            return
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = self._key_ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.postings.append([])
+            for variant in deletes(key[:self.prefix_length], self.max_distance):
+                self._deletes.setdefault(variant, []).append(key_id)
+        if position not in self.postings[key_id]:
+            self.postings[key_id].append(position)
+
+    def lookup(self, query: str, max_distance: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Find indexed keys within ``max_distance`` edits of ``query``.
+
+        Returns:
+            ``(key, distance)`` pairs, closest first
+        """
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        if not query:
+            return []
+
+        checked: Set[int] = set()
+        matches = []
+        for variant in deletes(query[:self.prefix_length], max_distance):
+            for key_id in self._deletes.get(variant, ()):
+                if key_id in checked:
+                    continue
+                checked.add(key_id)
+                key = self.keys[key_id]
+                distance = edit_distance(query, key, max_distance)
+                if distance <= max_distance:
+                    matches.append((key, distance))
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def positions(self, key: str) -> List[int]:
+        """Positions indexed under ``key``."""
+        key_id = self._key_ids.get(key)
+        return self.postings[key_id] if key_id is not None else []
+
+
+def romaji_key(text: str) -> str:
+    """Normalize romaji for matching: no accents, apostrophes or long vowels."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(ch for ch in text if ch.isascii() and ch.isalpha())
+    # toukyou, tookyoo and tokyo all become tokyo
+    return re.sub(r"([aeiou])\1|ou", lambda m: m.group(0)[0], text)
+
+
+class FuzzyReadingIndex:
+    """Kana and romaji readings of the vocabulary in symmetric-delete indexes.
+
+    Rows are the index rows produced by ``JLPTVocabularyRAG``; lookups return
+    positions into that list.
+
+    Args:
+        rows: Index rows (``id``, ``document``, ``metadata``)
+        max_distance: Largest edit distance served
+    """
+
+    # Characters per allowed edit, so short queries only match closely
+    KANA_CHARS_PER_EDIT = 3
+    ROMAJI_CHARS_PER_EDIT = 5
+
+    def __init__(self, rows: List[Dict[str, Any]], max_distance: int = 2):
+        self.max_distance = max_distance
+        self.levels = [str(row["metadata"]["jlpt_level"]) for row in rows]
+        self.kana = SymSpellIndex(max_distance)
+        self.romaji = SymSpellIndex(max_distance)
+
+        for position, row in enumerate(rows):
+            metadata = row["metadata"]
+            for reading in {str(metadata["furigana"]), str(metadata["original"])}:
+                folded = fold_kana(reading)
+                romanized = kana_to_romaji(folded)
+                # Skip surface forms with kanji; they have no reading of their own
+                if not romanized.isascii():
+                    continue
+                self.kana.add(folded, position)
+                self.romaji.add(romaji_key(romanized), position)
+
+    def _allowed(self, positions: Iterable[int], jlpt_levels: Optional[List[str]]) -> List[int]:
+        if not jlpt_levels:
+            return list(positions)
+        levels = set(jlpt_levels)
+        return [p for p in positions if self.levels[p] in levels]
+
+    def lookup(
+        self,
+        query: str,
+        limit: int = 10,
+        jlpt_levels: Optional[List[str]] = None,
+        max_distance: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Look up a kana or romaji reading, tolerating typos.
+
+        Args:
+            query: Reading in hiragana, katakana or romaji
+            limit: Most positions to return
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+            max_distance: Edit distance bound; defaults to one edit per few
+                characters, capped at the index maximum
+
+        Returns:
+            ``(position, distance)`` pairs, closest first
+        """
+        query = unicodedata.normalize("NFKC", query).strip()
+        if query.isascii():
+            key = romaji_key(query)
+            index, chars_per_edit = self.romaji, self.ROMAJI_CHARS_PER_EDIT
+            if not is_romaji(key):
+                return []
+        else:
+            key = fold_kana(query)
+            index, chars_per_edit = self.kana, self.KANA_CHARS_PER_EDIT
+            if not kana_to_romaji(key).isascii():
+                return []
+
+        if max_distance is None:
+            max_distance = len(key) // chars_per_edit
+        max_distance = min(max_distance, self.max_distance)
+
+        results: Dict[int, int] = {}
+        for match, distance in index.lookup(key, max_distance):
+            for position in self._allowed(index.positions(match), jlpt_levels):
+                results.setdefault(position, distance)
+            if len(results) >= limit:
+                break
+        return sorted(results.items(), key=lambda item: (item[1], item[0]))[:limit]
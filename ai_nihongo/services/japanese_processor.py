@@ -1,7 +1,11 @@
 """Japanese text processing service."""
 
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterable, AsyncIterator, Deque, Dict, Iterable, List, Any, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import re
+import threading
 
 try:
     from loguru import logger
@@ -9,7 +13,40 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+from ..core.cache import LRUCache
 from ..core.config import settings
+from .japanese_scripts import (
+    HIRAGANA, KANJI, KATAKANA, SPACE, ScriptProfile, classify, contains_japanese, contains_kanji, script_profile
+)
+from .kana import kana_to_romaji
+from .text_analysis import TextAnalysis, Token
+from .tokenizer_pool import TokenizerPool
+
+# Fallback part of speech by script: hiragana is most often a particle, and
+# katakana and kanji most often nouns
+_GUESSED_POS = {HIRAGANA: "助詞", KATAKANA: "名詞", KANJI: "名詞"}
+
+
+async def _chunked(
+    texts: Union[Iterable[str], AsyncIterable[str]],
+    size: int
+) -> AsyncIterator[List[str]]:
+    """Group a plain or async iterable of texts into lists of ``size``."""
+    chunk: List[str] = []
+    if hasattr(texts, "__aiter__"):
+        async for text in texts:
+            chunk.append(text)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    else:
+        for text in texts:
+            chunk.append(text)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
 
 
 class JapaneseProcessor:
@@ -19,6 +56,20 @@ class JapaneseProcessor:
         self.tokenizer = None
         self.is_initialized = False
         self.tokenizer_type = settings.tokenizer_model
+        self.dictionary_version = ""
+        # Analyses of cleaned text, keyed with the tokenizer and dictionary
+        # that produced them; cached results are shared and must not be mutated
+        self.analysis_cache = LRUCache(
+            maxsize=settings.analysis_cache_size,
+            max_bytes=settings.analysis_cache_bytes
+        )
+        # Taggers are not thread-safe; batch workers and direct calls take turns
+        self._tokenizer_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Worker processes with their own taggers, so analyses run on every core
+        self.tokenizer_pool: Optional[TokenizerPool] = None
+        if settings.tokenizer_workers > 0:
+            self.tokenizer_pool = TokenizerPool(self.tokenizer_type, settings.tokenizer_workers)
     
     async def initialize(self) -> None:
         """Initialize Japanese processing tools."""
@@ -51,6 +102,10 @@ class JapaneseProcessor:
             import fugashi
             import unidic_lite
             self.tokenizer = fugashi.Tagger()
+            self.dictionary_version = ";".join(
+                f"{info.get('filename', '')}:{info.get('version', '')}"
+                for info in getattr(self.tokenizer, "dictionary_info", [])
+            )
             logger.info("MeCab tokenizer initialized")
         except ImportError:
             logger.warning("MeCab dependencies not found, using fallback")
@@ -67,6 +122,7 @@ class JapaneseProcessor:
                               dictionary.DictionaryKind.CORE)
             
             self.tokenizer = dictionary.Dictionary(dict_type).create()
+            self.dictionary_version = f"{settings.sudachi_dict_type}:{self._package_version(f'sudachidict_{settings.sudachi_dict_type}')}"
             logger.info("SudachiPy tokenizer initialized")
         except ImportError:
             logger.warning("SudachiPy not found, using fallback")
@@ -76,8 +132,18 @@ class JapaneseProcessor:
         """Initialize fallback tokenizer."""
         logger.info("Using fallback Japanese processor")
         self.tokenizer = None
+        self.dictionary_version = ""
+    
+    @staticmethod
+    def _package_version(name: str) -> str:
+        """Installed version of a distribution, or an empty string."""
+        try:
+            from importlib.metadata import version
+            return version(name)
+        except Exception:
+            return ""
     
-    async def analyze_text(self, text: str) -> Dict[str, Any]:
+    async def analyze_text(self, text: str) -> TextAnalysis:
         """
         Analyze Japanese text and return detailed information.
         
@@ -85,38 +151,161 @@ class JapaneseProcessor:
             text: Japanese text to analyze
             
         Returns:
-            Dictionary containing analysis results
+            Analysis results, read like a dict; use ``to_dict()`` to serialize
         """
         if not self.is_initialized:
             await self.initialize()
         
-        # Clean the text
-        cleaned_text = self._clean_text(text)
+        return (await self._analyze_many([text]))[0]
+    
+    async def analyze_batch(self, texts: Iterable[str]) -> List[TextAnalysis]:
+        """
+        Analyze many texts, tokenizing in the background or the worker pool.
+        
+        Args:
+            texts: Japanese texts
+        
+        Returns:
+            Analysis of each text, aligned with the input order
+        """
+        return [analysis async for analysis in self.analyze_stream(texts)]
+    
+    async def analyze_stream(
+        self,
+        texts: Union[Iterable[str], AsyncIterable[str]],
+        chunk_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None
+    ) -> AsyncIterator[TextAnalysis]:
+        """
+        Analyze a stream of texts, yielding results in input order.
         
-        if not cleaned_text:
-            return self._empty_analysis(text)
+        Texts are grouped into chunks that are tokenized off the event loop,
+        each chunk paying the dispatch cost once. At most ``max_in_flight``
+        chunks are read ahead, which bounds memory however long the input is;
+        with a tokenizer pool, that many chunks run in parallel.
         
-        # Check if text contains Japanese characters
-        if not self._contains_japanese(cleaned_text):
-            return self._non_japanese_analysis(text)
+        Args:
+            texts: Japanese texts, from a plain or async iterable
+            chunk_size: Texts per worker call
+            max_in_flight: Chunks submitted but not yet yielded; defaults to
+                ``ANALYSIS_MAX_IN_FLIGHT`` or two per pool worker, whichever
+                is larger
+        
+        Yields:
+            Analysis of each text, in input order
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        chunk_size = max(1, chunk_size or settings.analysis_chunk_size)
+        if not max_in_flight:
+            max_in_flight = settings.analysis_max_in_flight
+            if self.tokenizer_pool is not None:
+                max_in_flight = max(max_in_flight, self.tokenizer_pool.workers * 2)
+        max_in_flight = max(1, max_in_flight)
+        pending: Deque[asyncio.Future] = deque()
         
         try:
-            if self.tokenizer_type == "mecab" and self.tokenizer:
-                return await self._analyze_with_mecab(cleaned_text)
-            elif self.tokenizer_type == "sudachi" and self.tokenizer:
-                return await self._analyze_with_sudachi(cleaned_text)
+            async for chunk in _chunked(texts, chunk_size):
+                pending.append(asyncio.ensure_future(self._analyze_many(chunk)))
+                if len(pending) >= max_in_flight:
+                    for analysis in await pending.popleft():
+                        yield analysis
+            
+            while pending:
+                for analysis in await pending.popleft():
+                    yield analysis
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    async def _analyze_many(self, texts: List[str]) -> List[TextAnalysis]:
+        """Analyze texts, tokenizing only distinct cache misses off the event loop."""
+        results: List[Optional[TextAnalysis]] = []
+        misses: Dict[Tuple[str, str, str], List[int]] = {}
+        engine = self.tokenizer_type if self.tokenizer else "fallback"
+        
+        for i, text in enumerate(texts):
+            # Clean the text
+            cleaned_text = self._clean_text(text)
+            
+            if not cleaned_text:
+                results.append(self._empty_analysis(text))
+            # Check if text contains Japanese characters
+            elif not self._contains_japanese(cleaned_text):
+                results.append(self._non_japanese_analysis(text))
             else:
-                return await self._analyze_fallback(cleaned_text)
-        except Exception as e:
-            logger.error(f"Analysis error: {e}")
-            return await self._analyze_fallback(cleaned_text)
+                # Repeated phrases are served from the cache instead of re-tokenized
+                cache_key = (engine, self.dictionary_version, cleaned_text)
+                results.append(self.analysis_cache.get(cache_key))
+                if results[-1] is None:
+                    misses.setdefault(cache_key, []).append(i)
+        
+        if misses:
+            cleaned = [cache_key[2] for cache_key in misses]
+            if self.tokenizer_pool is not None:
+                analyses = await self.tokenizer_pool.analyze(cleaned)
+            else:
+                loop = asyncio.get_running_loop()
+                analyses = await loop.run_in_executor(self._get_executor(), self._tokenize_chunk, cleaned)
+            
+            for (cache_key, positions), analysis in zip(misses.items(), analyses):
+                if analysis is None:
+                    # Tokenizer failed; answer with the fallback but don't cache it
+                    analysis = self._analyze_fallback(cache_key[2])
+                else:
+                    self.analysis_cache.set(cache_key, analysis)
+                for i in positions:
+                    results[i] = analysis
+        
+        return results
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """In-process tokenizer thread; one, since taggers are not thread-safe."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="japanese-analysis")
+        return self._executor
+    
+    def _tokenize_chunk(self, texts: List[str]) -> List[Optional[TextAnalysis]]:
+        """Analyze cleaned Japanese texts with this process's tokenizer.
+        
+        Returns:
+            Analysis of each text, or None where the tokenizer failed
+        """
+        analyses = []
+        with self._tokenizer_lock:
+            for text in texts:
+                try:
+                    if self.tokenizer_type == "mecab" and self.tokenizer:
+                        analyses.append(self._analyze_with_mecab(text))
+                    elif self.tokenizer_type == "sudachi" and self.tokenizer:
+                        analyses.append(self._analyze_with_sudachi(text))
+                    else:
+                        analyses.append(self._analyze_fallback(text))
+                except Exception as e:
+                    logger.error(f"Analysis error: {e}")
+                    analyses.append(None)
+        return analyses
+    
+    def close(self) -> None:
+        """Stop the tokenizer thread and worker processes."""
+        if self.tokenizer_pool is not None:
+            self.tokenizer_pool.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Analysis cache size, byte usage and hit rate."""
+        return self.analysis_cache.stats()
     
-    async def _analyze_with_mecab(self, text: str) -> Dict[str, Any]:
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Tokenizer pool counters, or None when analysis runs in-process."""
+        return self.tokenizer_pool.stats() if self.tokenizer_pool is not None else None
+    
+    def _analyze_with_mecab(self, text: str) -> TextAnalysis:
         """Analyze text using MeCab."""
         tokens = []
-        pos_tags = []
-        pronunciations = []
-        meanings = []
         
         for word in self.tokenizer(text):
             try:
@@ -141,110 +330,146 @@ class JapaneseProcessor:
                 else:
                     features = ['Unknown'] * 9
                 
-                token_info = {
-                    "surface": word.surface,
-                    "pos": features[0] if len(features) > 0 else "Unknown",
-                    "pos_detail": features[1] if len(features) > 1 else "",
-                    "base_form": features[6] if len(features) > 6 and features[6] != '*' else word.surface,
-                    "reading": features[7] if len(features) > 7 and features[7] != '*' else "",
-                    "pronunciation": features[8] if len(features) > 8 and features[8] != '*' else ""
-                }
-                
-                tokens.append(token_info)
-                pos_tags.append(token_info["pos"])
-                
-                if token_info["pronunciation"]:
-                    pronunciations.append(token_info["pronunciation"])
-                elif token_info["reading"]:
-                    pronunciations.append(token_info["reading"])
-                else:
-                    pronunciations.append(token_info["surface"])
+                surface = word.surface
+                tokens.append(Token(
+                    surface,
+                    features[0] if len(features) > 0 else "Unknown",
+                    features[1] if len(features) > 1 else "",
+                    features[6] if len(features) > 6 and features[6] != '*' else surface,
+                    features[7] if len(features) > 7 and features[7] != '*' else "",
+                    features[8] if len(features) > 8 and features[8] != '*' else ""
+                ))
                     
             except Exception as e:
                 logger.warning(f"Error processing token '{word.surface}': {e}")
                 # Fallback token info
-                token_info = {
-                    "surface": word.surface,
-                    "pos": "Unknown",
-                    "pos_detail": "",
-                    "base_form": word.surface,
-                    "reading": "",
-                    "pronunciation": ""
-                }
-                tokens.append(token_info)
-                pos_tags.append("Unknown")
-                pronunciations.append(word.surface)
-        
-        return {
-            "original_text": text,
-            "tokens": tokens,
-            "pos_tags": pos_tags,
-            "pronunciations": pronunciations,
-            "meanings": meanings,
-            "difficulty_level": self._estimate_difficulty(tokens),
-            "kanji_info": self._extract_kanji_info(text),
-            "grammar_patterns": self._identify_grammar_patterns(tokens)
-        }
-    
-    async def _analyze_with_sudachi(self, text: str) -> Dict[str, Any]:
+                tokens.append(Token(word.surface, "Unknown"))
+        
+        return TextAnalysis(
+            text,
+            tokens,
+            self._estimate_difficulty(tokens),
+            kanji_info=self._extract_kanji_info(text),
+            grammar_patterns=self._identify_grammar_patterns(tokens)
+        )
+    
+    def _analyze_with_sudachi(self, text: str) -> TextAnalysis:
         """Analyze text using SudachiPy."""
         tokens = []
-        pos_tags = []
-        pronunciations = []
-        
-        morphemes = self.tokenizer.tokenize(text)
-        
-        for m in morphemes:
-            token_info = {
-                "surface": m.surface(),
-                "pos": m.part_of_speech()[0],
-                "pos_detail": m.part_of_speech()[1],
-                "base_form": m.dictionary_form(),
-                "reading": m.reading_form(),
-                "pronunciation": m.pronunciation_form()
-            }
-            
-            tokens.append(token_info)
-            pos_tags.append(token_info["pos"])
-            pronunciations.append(token_info["pronunciation"] or token_info["reading"] or token_info["surface"])
-        
-        return {
-            "original_text": text,
-            "tokens": tokens,
-            "pos_tags": pos_tags,
-            "pronunciations": pronunciations,
-            "meanings": [],
-            "difficulty_level": self._estimate_difficulty(tokens),
-            "kanji_info": self._extract_kanji_info(text),
-            "grammar_patterns": self._identify_grammar_patterns(tokens)
-        }
-    
-    async def _analyze_fallback(self, text: str) -> Dict[str, Any]:
+        
+        for m in self.tokenizer.tokenize(text):
+            pos = m.part_of_speech()
+            tokens.append(Token(
+                m.surface(),
+                pos[0],
+                pos[1],
+                m.dictionary_form(),
+                m.reading_form(),
+                m.pronunciation_form()
+            ))
+        
+        return TextAnalysis(
+            text,
+            tokens,
+            self._estimate_difficulty(tokens),
+            kanji_info=self._extract_kanji_info(text),
+            grammar_patterns=self._identify_grammar_patterns(tokens)
+        )
+    
+    def _analyze_fallback(self, text: str) -> TextAnalysis:
         """Fallback analysis without external libraries."""
-        # Simple character-based analysis
-        tokens = []
-        for char in text:
-            if char.strip():  # Skip whitespace
-                token_info = {
-                    "surface": char,
-                    "pos": self._guess_pos(char),
-                    "pos_detail": "",
-                    "base_form": char,
-                    "reading": "",
-                    "pronunciation": ""
-                }
-                tokens.append(token_info)
-        
-        return {
-            "original_text": text,
-            "tokens": tokens,
-            "pos_tags": [t["pos"] for t in tokens],
-            "pronunciations": [t["surface"] for t in tokens],
-            "meanings": [],
-            "difficulty_level": self._estimate_difficulty_simple(text),
-            "kanji_info": self._extract_kanji_info(text),
-            "grammar_patterns": []
-        }
+        # Simple character-based analysis from one script classification pass
+        profile = script_profile(text)
+        tokens = [
+            Token(char, _GUESSED_POS.get(script, "記号"))
+            for char, script in zip(text, profile.classes)
+            if script != SPACE  # Skip whitespace
+        ]
+        
+        return TextAnalysis(
+            text,
+            tokens,
+            self._estimate_difficulty_simple(text, profile),
+            kanji_info=self._extract_kanji_info(text, profile)
+        )
+    
+    async def romanize(self, text: str, system: str = "hepburn") -> str:
+        """
+        Romaji pronunciation of Japanese text.
+        
+        Args:
+            text: Japanese text
+            system: ``hepburn`` or ``kunrei``
+            
+        Returns:
+            Romaji with one word per token
+        """
+        return (await self.romanize_batch([text], system=system))[0]
+    
+    async def romanize_batch(self, texts: List[str], system: str = "hepburn") -> List[str]:
+        """
+        Romaji pronunciations for many texts.
+        
+        Only token readings are computed, not the full analysis, so this is
+        suitable for romanizing whole word lists or example sentence sets.
+        Without a tokenizer, kana are romanized and kanji are kept as is.
+        
+        Args:
+            texts: Japanese texts
+            system: ``hepburn`` or ``kunrei``
+            
+        Returns:
+            Romaji for each text, aligned with the input order
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        # Tagging runs on the tokenizer thread or worker processes, as in analysis
+        cleaned = [self._clean_text(text) for text in texts]
+        if self.tokenizer_pool is not None:
+            readings = await self.tokenizer_pool.readings(cleaned)
+        else:
+            loop = asyncio.get_running_loop()
+            readings = await loop.run_in_executor(self._get_executor(), self._readings_chunk, cleaned)
+        
+        return [
+            " ".join(kana_to_romaji(reading, system) for reading in text_readings if reading.strip())
+            for text_readings in readings
+        ]
+    
+    def _readings_chunk(self, texts: List[str]) -> List[List[str]]:
+        """Token readings of cleaned texts with this process's tokenizer; a failed text keeps its surface."""
+        readings = []
+        with self._tokenizer_lock:
+            for text in texts:
+                try:
+                    readings.append(self._token_readings(text))
+                except Exception as e:
+                    logger.warning(f"Reading lookup failed for '{text}': {e}")
+                    readings.append([text])
+        return readings
+    
+    def _token_readings(self, text: str) -> List[str]:
+        """Kana reading of each token, or its surface form when there is none."""
+        if not text:
+            return []
+        
+        if self.tokenizer_type == "mecab" and self.tokenizer:
+            readings = []
+            for word in self.tokenizer(text):
+                feature = getattr(word, 'feature', None)
+                if hasattr(feature, 'split'):
+                    fields = feature.split(',')
+                    kana = fields[7] if len(fields) > 7 else ""
+                else:
+                    kana = getattr(feature, 'kana', "") or ""
+                readings.append(kana if kana and kana != '*' else word.surface)
+            return readings
+        
+        if self.tokenizer_type == "sudachi" and self.tokenizer:
+            return [m.reading_form() or m.surface() for m in self.tokenizer.tokenize(text)]
+        
+        return [text]
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize Japanese text."""
@@ -261,51 +486,27 @@ class JapaneseProcessor:
     
     def _contains_japanese(self, text: str) -> bool:
         """Check if text contains Japanese characters."""
-        japanese_ranges = [
-            (0x3040, 0x309F),  # Hiragana
-            (0x30A0, 0x30FF),  # Katakana
-            (0x4E00, 0x9FAF),  # CJK Unified Ideographs (Kanji)
-            (0x3400, 0x4DBF),  # CJK Extension A
-        ]
-        
-        for char in text:
-            char_code = ord(char)
-            for start, end in japanese_ranges:
-                if start <= char_code <= end:
-                    return True
-        return False
+        return contains_japanese(text)
     
     def _guess_pos(self, char: str) -> str:
         """Guess part of speech for a character (fallback method)."""
-        char_code = ord(char)
-        
-        if 0x3040 <= char_code <= 0x309F:  # Hiragana
-            return "助詞"  # Particle (common for hiragana)
-        elif 0x30A0 <= char_code <= 0x30FF:  # Katakana
-            return "名詞"  # Noun (common for katakana)
-        elif 0x4E00 <= char_code <= 0x9FAF:  # Kanji
-            return "名詞"  # Noun (common for kanji)
-        else:
-            return "記号"  # Symbol
+        return _GUESSED_POS.get(classify(char), "記号")  # Symbol
     
-    def _extract_kanji_info(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_kanji_info(self, text: str, profile: Optional[ScriptProfile] = None) -> List[Dict[str, Any]]:
         """Extract information about kanji characters."""
-        kanji_info = []
-        
-        for char in text:
-            char_code = ord(char)
-            if 0x4E00 <= char_code <= 0x9FAF:  # Kanji range
-                kanji_info.append({
-                    "character": char,
-                    "unicode": hex(char_code),
-                    "stroke_count": None,  # Would need external data
-                    "grade": None,  # Would need external data
-                    "frequency": None  # Would need external data
-                })
-        
-        return kanji_info
-    
-    def _identify_grammar_patterns(self, tokens: List[Dict[str, Any]]) -> List[str]:
+        profile = profile or script_profile(text)
+        return [
+            {
+                "character": char,
+                "unicode": hex(ord(char)),
+                "stroke_count": None,  # Would need external data
+                "grade": None,  # Would need external data
+                "frequency": None  # Would need external data
+            }
+            for char in profile.kanji_chars()
+        ]
+    
+    def _identify_grammar_patterns(self, tokens: List[Token]) -> List[str]:
         """Identify common Japanese grammar patterns."""
         patterns = []
         
@@ -321,13 +522,13 @@ class JapaneseProcessor:
         
         return patterns
     
-    def _estimate_difficulty(self, tokens: List[Dict[str, Any]]) -> str:
+    def _estimate_difficulty(self, tokens: List[Token]) -> str:
         """Estimate difficulty level based on tokens."""
         if not tokens:
             return "unknown"
         
         # Simple heuristic based on token count and kanji presence
-        kanji_count = sum(1 for token in tokens if self._contains_kanji(token["surface"]))
+        kanji_count = sum(1 for token in tokens if contains_kanji(token.surface))
         total_tokens = len(tokens)
         
         kanji_ratio = kanji_count / total_tokens if total_tokens > 0 else 0
@@ -339,15 +540,14 @@ class JapaneseProcessor:
         else:
             return "beginner"
     
-    def _estimate_difficulty_simple(self, text: str) -> str:
+    def _estimate_difficulty_simple(self, text: str, profile: Optional[ScriptProfile] = None) -> str:
         """Simple difficulty estimation for fallback."""
-        kanji_count = sum(1 for char in text if self._contains_kanji(char))
-        total_chars = len([char for char in text if char.strip()])
+        profile = profile or script_profile(text)
         
-        if total_chars == 0:
+        if profile.visible == 0:
             return "unknown"
         
-        kanji_ratio = kanji_count / total_chars
+        kanji_ratio = profile.kanji_ratio
         
         if kanji_ratio > 0.4:
             return "advanced"
@@ -358,34 +558,12 @@ class JapaneseProcessor:
     
     def _contains_kanji(self, text: str) -> bool:
         """Check if text contains kanji characters."""
-        for char in text:
-            char_code = ord(char)
-            if 0x4E00 <= char_code <= 0x9FAF:
-                return True
-        return False
+        return contains_kanji(text)
     
-    def _empty_analysis(self, text: str) -> Dict[str, Any]:
+    def _empty_analysis(self, text: str) -> TextAnalysis:
         """Return empty analysis for invalid input."""
-        return {
-            "original_text": text,
-            "tokens": [],
-            "pos_tags": [],
-            "pronunciations": [],
-            "meanings": [],
-            "difficulty_level": "unknown",
-            "kanji_info": [],
-            "grammar_patterns": []
-        }
-    
-    def _non_japanese_analysis(self, text: str) -> Dict[str, Any]:
+        return TextAnalysis(text, [], "unknown")
+    
+    def _non_japanese_analysis(self, text: str) -> TextAnalysis:
         """Return analysis for non-Japanese text."""
-        return {
-            "original_text": text,
-            "tokens": [{"surface": text, "pos": "foreign", "pos_detail": "", "base_form": text, "reading": "", "pronunciation": ""}],
-            "pos_tags": ["foreign"],
-            "pronunciations": [text],
-            "meanings": [],
-            "difficulty_level": "not_japanese",
-            "kanji_info": [],
-            "grammar_patterns": []
-        }
\ No newline at end of file
+        return TextAnalysis(text, [Token(text, "foreign")], "not_japanese")
@@ -0,0 +1,167 @@
+"""
+Script classification for Japanese and mixed text.
+
+Every code point is mapped to a one-letter script class in a table built once,
+so classifying a string is a single ``str.translate`` pass in C. The
+resulting class string gives per-script counts, kanji positions and ratios
+without walking the text again in Python.
+"""
+
+import re
+from functools import lru_cache
+from typing import List
+
+HIRAGANA = "h"
+KATAKANA = "k"
+KANJI = "K"
+# Japanese marks that are not kana or kanji themselves (々, 〆, 〇)
+MARK = "m"
+# ASCII letters
+LATIN = "l"
+# Letters of any other script
+LETTER = "a"
+DIGIT = "d"
+SPACE = "s"
+OTHER = "o"
+
+SCRIPT_CLASSES = (HIRAGANA, KATAKANA, KANJI, MARK, LATIN, LETTER, DIGIT, SPACE, OTHER)
+
+_RANGES = (
+    (0x3040, 0x30A0, HIRAGANA),
+    (0x30A0, 0x3100, KATAKANA),
+    (0x31F0, 0x3200, KATAKANA),  # Katakana phonetic extensions
+    (0xFF66, 0xFFA0, KATAKANA),  # Half-width katakana
+    (0x3400, 0x4DC0, KANJI),     # CJK extension A
+    (0x4E00, 0xA000, KANJI),     # CJK unified ideographs
+    (0xF900, 0xFB00, KANJI),     # CJK compatibility ideographs
+    (0x3005, 0x3008, MARK),
+    (0x303B, 0x303C, MARK),
+)
+
+# Supplementary ideograph planes (extensions B to H)
+_SUPPLEMENTARY_KANJI = (0x20000, 0x323B0)
+
+_KANJI_PATTERN = re.compile(KANJI)
+
+
+@lru_cache(maxsize=None)
+def _class_table() -> str:
+    """Script class of every code point below the end of the ideograph planes."""
+    classes = []
+    for code_point in range(0x10000):
+        char = chr(code_point)
+        if char.isspace():
+            classes.append(SPACE)
+        elif char.isdigit():
+            classes.append(DIGIT)
+        elif char.isalpha():
+            classes.append(LATIN if code_point < 0x80 else LETTER)
+        else:
+            classes.append(OTHER)
+    for start, stop, script in _RANGES:
+        classes[start:stop] = script * (stop - start)
+
+    start, stop = _SUPPLEMENTARY_KANJI
+    classes.extend(OTHER * (start - 0x10000))
+    classes.extend(KANJI * (stop - start))
+    return "".join(classes)
+
+
+def classify_text(text: str) -> str:
+    """One script class letter per character of ``text``."""
+    classes = text.translate(_class_table())
+    # Code points past the table are left untranslated
+    if not classes.isascii():
+        classes = "".join(c if c.isascii() else OTHER for c in classes)
+    return classes
+
+
+def classify(char: str) -> str:
+    """Script class of one character."""
+    return classify_text(char)
+
+
+def is_kanji(char: str) -> bool:
+    """True for CJK ideographs (unified, extensions and compatibility)."""
+    return classify(char) == KANJI
+
+
+def is_japanese(char: str) -> bool:
+    """True for kana (including half-width), kanji and Japanese marks such as 々."""
+    return classify(char) in (HIRAGANA, KATAKANA, KANJI, MARK)
+
+
+class ScriptProfile:
+    """Per-script counts of a text, from one classification pass.
+
+    Args:
+        text: Text to profile
+    """
+
+    __slots__ = ("text", "classes", "hiragana", "katakana", "kanji", "marks",
+                 "latin", "letters", "digits", "spaces", "other")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.classes = classify_text(text)
+        count = self.classes.count
+        self.hiragana = count(HIRAGANA)
+        self.katakana = count(KATAKANA)
+        self.kanji = count(KANJI)
+        self.marks = count(MARK)
+        self.latin = count(LATIN)
+        # Letters of every script, as counted by str.isalpha
+        self.letters = self.hiragana + self.katakana + self.kanji + self.marks + self.latin + count(LETTER)
+        self.digits = count(DIGIT)
+        self.spaces = count(SPACE)
+        self.other = count(OTHER)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def kana(self) -> int:
+        return self.hiragana + self.katakana
+
+    @property
+    def japanese(self) -> int:
+        """Kana, kanji and Japanese marks."""
+        return self.kana + self.kanji + self.marks
+
+    @property
+    def visible(self) -> int:
+        """Characters other than whitespace."""
+        return len(self.text) - self.spaces
+
+    @property
+    def kanji_ratio(self) -> float:
+        """Share of visible characters that are kanji."""
+        return self.kanji / self.visible if self.visible else 0.0
+
+    @property
+    def japanese_ratio(self) -> float:
+        """Share of letters that are Japanese."""
+        return self.japanese / self.letters if self.letters else 0.0
+
+    def kanji_positions(self) -> List[int]:
+        """Indices of the kanji in the text."""
+        return [match.start() for match in _KANJI_PATTERN.finditer(self.classes)]
+
+    def kanji_chars(self) -> List[str]:
+        """Kanji of the text, in order (repeats included)."""
+        return [self.text[i] for i in self.kanji_positions()]
+
+
+def script_profile(text: str) -> ScriptProfile:
+    """Classify ``text`` once and count each script."""
+    return ScriptProfile(text)
+
+
+def contains_japanese(text: str) -> bool:
+    """True if ``text`` has any kana, kanji or Japanese mark."""
+    return script_profile(text).japanese > 0
+
+
+def contains_kanji(text: str) -> bool:
+    """True if ``text`` has any kanji."""
+    return KANJI in classify_text(text)
@@ -0,0 +1,194 @@
+"""
+Offline, versioned artifact bundles for the JLPT vocabulary RAG.
+
+A bundle packages everything ``JLPTVocabularyRAG`` otherwise fetches or
+computes at startup: the cleaned vocabulary (compact binary), the embedding
+model weights and the document vectors aligned with the vocabulary rows.
+Every file is listed with its SHA-256 and size in ``manifest.json``, so
+workers on air-gapped nodes can start with no network calls. Hashing the
+model weights takes seconds, so the checksums are verified once when a
+bundle is installed (``ai-nihongo jlpt-load-artifacts``); a worker start only
+checks that every file is present with its recorded size.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+from .vocabulary_store import VocabularyStore
+
+BUNDLE_FORMAT = 1
+MANIFEST_FILE = "manifest.json"
+VOCABULARY_FILE = "vocabulary.bin"
+EMBEDDINGS_FILE = "embeddings.npy"
+MODEL_DIR = "model"
+
+
+def _sha256_file(path: Path) -> str:
+    """Hash a file in chunks so large model weights are not read into memory at once."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _checksum_tree(root: Path) -> Dict[str, Dict[str, Any]]:
+    """SHA-256 and size of every file under ``root``, keyed by relative POSIX path."""
+    files = {}
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        if path.name == MANIFEST_FILE and path.parent == root:
+            continue
+        files[path.relative_to(root).as_posix()] = {
+            "sha256": _sha256_file(path),
+            "size": path.stat().st_size
+        }
+    return files
+
+
+class ArtifactBundle:
+    """A loaded, verified artifact bundle."""
+
+    def __init__(self, path: Path, manifest: Dict[str, Any], vocabulary: VocabularyStore, embeddings: np.ndarray):
+        self.path = path
+        self.manifest = manifest
+        self.vocabulary = vocabulary
+        self.embeddings = embeddings
+        self.model_path = path / MODEL_DIR
+
+    @property
+    def version(self) -> str:
+        return self.manifest["version"]
+
+    @property
+    def model_name(self) -> str:
+        return self.manifest["model_name"]
+
+
+def build_artifact_bundle(
+    vocabulary: VocabularyStore,
+    embeddings: np.ndarray,
+    model,
+    model_name: str,
+    output_dir: str,
+    version: Optional[str] = None
+) -> Path:
+    """
+    Package a vocabulary, its document vectors and the embedding model into a bundle.
+
+    Args:
+        vocabulary: Cleaned vocabulary store
+        embeddings: Document vectors in vocabulary row order
+        model: Embedding model exposing ``save(path)``
+        model_name: Name the model was loaded under
+        output_dir: Directory that will contain ``jlpt-<version>/``
+        version: Bundle version; defaults to a hash of the vocabulary and model
+
+    Returns:
+        Path of the finished bundle directory
+    """
+    if len(embeddings) != len(vocabulary):
+        raise ValueError(f"Got {len(embeddings)} vectors for {len(vocabulary)} vocabulary entries")
+
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    staging = output / f".jlpt-build-{os.getpid()}"
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir()
+
+    try:
+        vocabulary_path = staging / VOCABULARY_FILE
+        vocabulary.save(str(vocabulary_path))
+
+        # Vectors are stored in vocabulary row order so row_id indexes them directly
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        np.save(staging / EMBEDDINGS_FILE, embeddings)
+
+        logger.info(f"Saving embedding model {model_name} into bundle")
+        model.save(str(staging / MODEL_DIR))
+
+        if version is None:
+            digest = hashlib.sha256(model_name.encode("utf-8"))
+            digest.update(_sha256_file(vocabulary_path).encode("ascii"))
+            version = digest.hexdigest()[:12]
+
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "version": version,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "model_name": model_name,
+            "dimension": int(embeddings.shape[1]),
+            "entries": len(vocabulary),
+            "files": _checksum_tree(staging)
+        }
+        with open(staging / MANIFEST_FILE, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        bundle_path = output / f"jlpt-{version}"
+        if bundle_path.exists():
+            shutil.rmtree(bundle_path)
+        os.replace(staging, bundle_path)
+
+        logger.info(f"Built JLPT artifact bundle {bundle_path} ({manifest['entries']} entries)")
+        return bundle_path
+
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def load_artifact_bundle(path: str, verify: bool = False) -> ArtifactBundle:
+    """
+    Load a bundle, memory-mapping its vectors.
+
+    Args:
+        path: Bundle directory created by ``build_artifact_bundle``
+        verify: Also check every file against the manifest checksums; without
+            it only file presence and sizes are checked
+
+    Returns:
+        The loaded bundle
+
+    Raises:
+        ValueError: If the bundle format is unsupported or a file is missing,
+            has the wrong size or (with ``verify``) the wrong checksum
+    """
+    bundle_path = Path(path)
+    with open(bundle_path / MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported artifact bundle format: {manifest.get('format')}")
+
+    for relative_path, expected in manifest["files"].items():
+        file_path = bundle_path / relative_path
+        if not file_path.is_file():
+            raise ValueError(f"Artifact bundle is missing {relative_path}")
+        if file_path.stat().st_size != expected["size"]:
+            raise ValueError(f"Size mismatch for {relative_path} in {bundle_path}")
+        if verify and _sha256_file(file_path) != expected["sha256"]:
+            raise ValueError(f"Checksum mismatch for {relative_path} in {bundle_path}")
+
+    vocabulary = VocabularyStore.load(str(bundle_path / VOCABULARY_FILE))
+    embeddings = np.load(bundle_path / EMBEDDINGS_FILE, mmap_mode="r")
+
+    if embeddings.shape[0] != len(vocabulary):
+        raise ValueError(
+            f"Bundle has {embeddings.shape[0]} vectors for {len(vocabulary)} vocabulary entries"
+        )
+
+    logger.info(f"Loaded JLPT artifact bundle {manifest['version']} from {bundle_path}")
+    return ArtifactBundle(bundle_path, manifest, vocabulary, embeddings)
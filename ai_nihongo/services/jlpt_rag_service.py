@@ -5,43 +5,163 @@ This service provides intelligent search and retrieval of JLPT vocabulary
 using vector embeddings and semantic similarity matching.
 """
 
+import asyncio
+import multiprocessing
 import os
-import pandas as pd
+import random
+import re
+import time
+import unicodedata
+import numpy as np
 import kagglehub
 import chromadb
-from typing import List, Dict, Optional, Any
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, List, Dict, Optional, Any, Tuple
 import hashlib
-from sentence_transformers import SentenceTransformer
 from loguru import logger
 import json
 from pathlib import Path
 
+from ..core.cache import LRUCache
+from ..core.config import settings
+from .autocomplete import PrefixIndex
+from .embedding_backends import (
+    DEFAULT_SENTENCE_TRANSFORMER,
+    EmbeddingBackend,
+    create_embedding_backend,
+    load_embedding_backend,
+)
+from .embedding_cache import EmbeddingCache
+from .embedding_executor import EmbeddingExecutor
+from .federated_retrieval import get_federated_retriever
+from .field_index import FieldVectorIndex
+from .fuzzy_index import FuzzyReadingIndex
+from .jlpt_artifacts import ArtifactBundle, build_artifact_bundle, load_artifact_bundle
+from .kana import hiragana_to_katakana, romaji_query_to_kana
+from .lexical_index import LexicalIndex, normalize_text, reciprocal_rank_fusion
+from .neighbor_graph import NeighborGraph
+from .vector_backends import (
+    ChromaSearchBackend,
+    CompressedNumpySearchBackend,
+    IVFSearchBackend,
+    NumpySearchBackend,
+    SearchBackend,
+)
+from .vocabulary_store import VocabularyStore
+
+
+DEFAULT_EMBEDDING_MODEL = DEFAULT_SENTENCE_TRANSFORMER
+
+# Bump when the row hashing or document layout changes so existing
+# manifests are treated as stale and every row is re-embedded once.
+MANIFEST_VERSION = 1
+
+
+# Per-process model for index build workers
+_worker_model = None
+
+
+def _init_encode_worker(backend: str, model_source: str, hashing_dimension: int) -> None:
+    """Load the embedding model once in each build worker process."""
+    global _worker_model
+    _worker_model = create_embedding_backend(backend, model_source, hashing_dimension)
+
+
+def _encode_in_worker(documents: List[str]) -> Tuple[np.ndarray, float]:
+    """Encode one chunk of documents in a build worker process.
+    
+    Returns:
+        The vectors and the seconds spent encoding them, timed in the worker
+        so time queued behind other chunks is not counted
+    """
+    start = time.perf_counter()
+    if not documents:
+        return np.empty((0, 0), dtype=np.float32), 0.0
+    embeddings = np.asarray(_worker_model.encode(documents, show_progress_bar=False), dtype=np.float32)
+    return embeddings, time.perf_counter() - start
+
 
 class JLPTVocabularyRAG:
     """RAG system for JLPT vocabulary with semantic search and intelligent retrieval."""
     
-    def __init__(self, data_dir: str = "data", collection_name: str = "jlpt_vocabulary"):
+    def __init__(
+        self,
+        data_dir: str = "data",
+        collection_name: str = "jlpt_vocabulary",
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        embedding_cache_dir: Optional[str] = None,
+        search_backend: Optional[str] = None,
+        artifact_path: Optional[str] = None,
+        vector_compression: Optional[str] = None,
+        embedding_backend: Optional[str] = None,
+        field_vectors: Optional[bool] = None
+    ):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.db_path = self.data_dir / "chromadb"
+        self.manifest_path = self.db_path / f"{collection_name}_manifest.json"
+        self.checkpoint_path = self.db_path / f"{collection_name}_build_checkpoint.jsonl"
+        
+        # A prebuilt bundle replaces the dataset download and model hub lookup
+        artifact_path = settings.jlpt_artifact_path if artifact_path is None else artifact_path
+        self.artifacts: Optional[ArtifactBundle] = load_artifact_bundle(artifact_path) if artifact_path else None
+        if self.artifacts is not None:
+            model_name = self.artifacts.model_name
         
         self.collection_name = collection_name
+        self.model_name = model_name
+        self.embedding_backend_name = embedding_backend or settings.embedding_backend
+        self.search_backend_name = search_backend or settings.jlpt_search_backend
+        self.vector_compression = vector_compression or settings.jlpt_vector_compression
+        self.field_vectors = settings.jlpt_field_vectors if field_vectors is None else field_vectors
         self.client = None
         self.collection = None
-        self.model = None
-        self.df = None
+        self.search_backend: Optional[SearchBackend] = None
+        self.model: Optional[EmbeddingBackend] = None
+        self.vocabulary: Optional[VocabularyStore] = None
+        self.index_rows: List[Dict[str, Any]] = []
+        self.lexical_index: Optional[LexicalIndex] = None
+        self.field_index: Optional[FieldVectorIndex] = None
+        self.fuzzy_index: Optional[FuzzyReadingIndex] = None
+        self.prefix_index: Optional[PrefixIndex] = None
+        self.neighbor_graph: Optional[NeighborGraph] = None
         
-        # Initialize components
+        # The backend decides the model name that keys the caches and manifest
         self._initialize_embedding_model()
+        
+        # Shared on-disk vectors; an empty directory setting disables the cache
+        cache_dir = settings.embedding_cache_dir if embedding_cache_dir is None else embedding_cache_dir
+        self.embedding_cache = EmbeddingCache(cache_dir, self.model_name) if cache_dir else None
+        self.query_cache = LRUCache(maxsize=settings.query_cache_size, ttl=settings.query_cache_ttl)
+        
+        # All query encoding goes through one worker thread that batches
+        # concurrent requests into a single forward pass
+        self.embedding_executor = EmbeddingExecutor(
+            lambda texts: self.model.encode(texts),
+            max_batch_size=settings.embedding_max_batch_size,
+            batch_window=settings.embedding_batch_window_ms / 1000
+        )
+        
+        # Initialize components
         self._initialize_vector_db()
     
     def _initialize_embedding_model(self):
-        """Initialize the sentence transformer model for embeddings."""
+        """Initialize the configured embedding backend."""
         try:
-            # Use a model that's good for multilingual and Japanese text
-            model_name = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
-            logger.info(f"Loading embedding model: {model_name}")
-            self.model = SentenceTransformer(model_name)
-            logger.info("Embedding model loaded successfully")
+            if self.artifacts is not None:
+                self.model_source = str(self.artifacts.model_path)
+                logger.info(f"Loading embedding model: {self.model_name} from {self.model_source}")
+                self.model = load_embedding_backend(self.model_source, model_name=self.model_name)
+                self.embedding_backend_name = self.model.name
+            else:
+                # Default model is multilingual so Japanese and English queries share a space
+                self.model_source = self.model_name
+                logger.info(f"Loading {self.embedding_backend_name} embedding backend")
+                self.model = create_embedding_backend(
+                    self.embedding_backend_name, self.model_name, settings.hashing_embedding_dim
+                )
+            self.model_name = self.model.model_name
+            logger.info(f"Embedding model {self.model_name} loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise
@@ -50,8 +170,7 @@ class JLPTVocabularyRAG:
         """Initialize ChromaDB vector database."""
         try:
             # Initialize ChromaDB client
-            db_path = self.data_dir / "chromadb"
-            self.client = chromadb.PersistentClient(path=str(db_path))
+            self.client = chromadb.PersistentClient(path=str(self.db_path))
             
             # Get or create collection
             try:
@@ -64,6 +183,8 @@ class JLPTVocabularyRAG:
                     metadata={"description": "JLPT vocabulary with embeddings"}
                 )
                 logger.info(f"Created new collection: {self.collection_name}")
+            
+            self.search_backend = ChromaSearchBackend(self.collection)
                 
         except Exception as e:
             logger.error(f"Failed to initialize vector database: {e}")
@@ -74,15 +195,28 @@ class JLPTVocabularyRAG:
         try:
             logger.info("Initializing JLPT RAG system...")
             
-            # Download and load JLPT dataset
-            await self._download_and_load_data()
-            
-            # Check if we need to build the vector index
-            if self.collection.count() == 0:
-                logger.info("Building vector index for JLPT vocabulary...")
-                await self._build_vector_index()
+            # Load JLPT dataset from the artifact bundle, or download it
+            if self.artifacts is not None:
+                self.vocabulary = self.artifacts.vocabulary
+                logger.info(f"Using vocabulary from artifact bundle {self.artifacts.version}")
             else:
-                logger.info(f"Vector index already exists with {self.collection.count()} entries")
+                await self._download_and_load_data()
+            
+            # Bring the vector index in line with the loaded dataset. In-memory
+            # backends serve bundle vectors directly, so the collection is
+            # only synced when Chroma answers the queries
+            self.index_rows = self._prepare_index_rows()
+            if self.artifacts is None or self.search_backend_name not in ("numpy", "ivf"):
+                await self._sync_vector_index(self.index_rows)
+            self.lexical_index = LexicalIndex(self.index_rows)
+            if settings.jlpt_fuzzy_max_distance > 0:
+                self.fuzzy_index = FuzzyReadingIndex(self.index_rows, settings.jlpt_fuzzy_max_distance)
+            self.prefix_index = PrefixIndex(self.index_rows)
+            self.search_backend = self._create_search_backend()
+            if settings.jlpt_neighbor_k > 0:
+                self.neighbor_graph = self._load_neighbor_graph(settings.jlpt_neighbor_k)
+            if self.field_vectors:
+                self.field_index = self._create_field_index()
             
             logger.info("JLPT RAG system initialized successfully")
             
@@ -99,76 +233,499 @@ class JLPTVocabularyRAG:
             dataset_path = kagglehub.dataset_download("robinpourtaud/jlpt-words-by-level")
             csv_path = os.path.join(dataset_path, "jlpt_vocab.csv")
             
-            # Load dataset
-            self.df = pd.read_csv(csv_path)
-            
-            # Clean and prepare data
-            self.df = self.df.dropna()  # Remove any rows with missing data
-            self.df['id'] = range(len(self.df))  # Add unique IDs
+            # Load dataset; rows with missing values are dropped and the row
+            # position becomes the entry's row id
+            self.vocabulary = VocabularyStore.from_csv(csv_path)
             
-            logger.info(f"Loaded {len(self.df)} JLPT vocabulary entries")
-            logger.info(f"JLPT levels: {sorted(self.df['JLPT Level'].unique())}")
-            logger.info(f"Level distribution: {dict(self.df['JLPT Level'].value_counts().sort_index())}")
+            logger.info(f"Loaded {len(self.vocabulary)} JLPT vocabulary entries")
+            logger.info(f"JLPT levels: {self.vocabulary.level_names}")
+            distribution = {level: len(rows) for level, rows in self.vocabulary.level_rows.items()}
+            logger.info(f"Level distribution: {distribution}")
             
         except Exception as e:
             logger.error(f"Failed to download and load data: {e}")
             raise
     
-    async def _build_vector_index(self):
-        """Build vector embeddings for all vocabulary entries."""
+    def _numpy_backend_options(self, index_name: str):
+        """Backend class and options for the configured in-memory backend.
+        
+        ``index_name`` names the files an IVF layout or re-rank store is
+        persisted to, so several indexes can share the data directory.
+        """
+        if self.search_backend_name == "ivf":
+            # Centroids and list layout persist next to the collection
+            if self.vector_compression != "none":
+                logger.warning("Vector compression only applies to the numpy search backend")
+            return IVFSearchBackend, {
+                "nlist": settings.jlpt_ivf_nlist,
+                "nprobe": settings.jlpt_ivf_nprobe,
+                "index_path": str(self.db_path / f"{index_name}_ivf.npz")
+            }
+        if self.vector_compression != "none":
+            # Candidates come from compressed vectors; the float32 copy used
+            # for re-ranking is memory-mapped next to the collection
+            return CompressedNumpySearchBackend, {
+                "compression": self.vector_compression,
+                "rerank_factor": settings.jlpt_rerank_factor,
+                "pca_components": settings.jlpt_pca_components,
+                "rerank_store": str(self.db_path / f"{index_name}_rerank.npy")
+            }
+        return NumpySearchBackend, {}
+    
+    def _create_search_backend(self) -> SearchBackend:
+        """Create the configured search backend over the synced collection."""
+        if self.search_backend_name in ("numpy", "ivf"):
+            backend_cls, options = self._numpy_backend_options(self.collection_name)
+            if self.artifacts is not None:
+                return backend_cls(
+                    [row["id"] for row in self.index_rows],
+                    self.artifacts.embeddings,
+                    [row["metadata"] for row in self.index_rows],
+                    [row["document"] for row in self.index_rows],
+                    **options
+                )
+            return backend_cls.from_collection(self.collection, **options)
+        if self.vector_compression != "none":
+            logger.warning("Vector compression only applies to the numpy search backend")
+        if self.search_backend_name != "chroma":
+            logger.warning(f"Unknown search backend: {self.search_backend_name}, using chroma")
+        return ChromaSearchBackend(self.collection)
+    
+    def _create_field_index(self) -> FieldVectorIndex:
+        """Build (or load) per-field vectors, searched with the configured in-memory backend."""
+        if self.search_backend_name not in ("numpy", "ivf"):
+            logger.warning(f"JLPT_FIELD_VECTORS replaces the {self.search_backend_name} search backend: "
+                           f"vocabulary queries search in-memory numpy field vectors and the "
+                           f"{self.search_backend_name} index only serves similar-word lookups")
+        if self.artifacts is not None:
+            logger.warning("Field vectors are not part of the artifact bundle; encoding them on first start")
+        def field_backend(field, ids, embeddings, metadatas, documents):
+            backend_cls, options = NumpySearchBackend, {}
+            if len(ids) and self.search_backend_name in ("numpy", "ivf"):
+                backend_cls, options = self._numpy_backend_options(f"{self.collection_name}_{field}")
+            return backend_cls(ids, embeddings, metadatas, documents, **options)
+        
+        return FieldVectorIndex(
+            self.index_rows,
+            lambda texts: self._encode_documents(texts, show_progress_bar=False),
+            model_name=self.model_name,
+            index_path=str(self.db_path / f"{self.collection_name}_fields.npz"),
+            backend_factory=field_backend
+        )
+    
+    def _document_vectors(self) -> np.ndarray:
+        """Document vectors aligned with ``index_rows``."""
+        if self.artifacts is not None:
+            return np.asarray(self.artifacts.embeddings, dtype=np.float32)
+        
+        data = self.collection.get(include=["embeddings"])
+        rows = {entry_id: i for i, entry_id in enumerate(data["ids"])}
+        embeddings = np.asarray(data["embeddings"], dtype=np.float32)
+        return embeddings[[rows[row["id"]] for row in self.index_rows]]
+    
+    def _load_neighbor_graph(self, k: int) -> Optional[NeighborGraph]:
+        """Load the neighbour graph for the current rows, building it if it is missing or stale.
+        
+        The build compares every row with every other, so above
+        ``JLPT_NEIGHBOR_MAX_ENTRIES`` rows it is skipped and None is returned.
+        """
+        digest = hashlib.sha1(f"{self.model_name}:{k}".encode("utf-8"))
+        for row in self.index_rows:
+            digest.update(f"{row['id']}\x1f{row['hash']}\x1e".encode("utf-8"))
+        fingerprint = digest.hexdigest()
+        path = str(self.db_path / f"{self.collection_name}_neighbors.npz")
+        
+        graph = NeighborGraph.load(path, fingerprint)
+        if graph is not None:
+            logger.info(f"Loaded neighbour graph from {path}")
+            return graph
+        
+        max_entries = settings.jlpt_neighbor_max_entries
+        if 0 < max_entries < len(self.index_rows):
+            logger.info(f"Skipping the neighbour graph: {len(self.index_rows)} entries exceed "
+                        f"JLPT_NEIGHBOR_MAX_ENTRIES={max_entries}")
+            return None
+        
+        start = time.perf_counter()
+        graph = NeighborGraph.build(self._document_vectors(), k=k)
+        graph.save(path, fingerprint)
+        logger.info(f"Built top-{graph.k} neighbour graph over {len(graph)} entries "
+                    f"in {time.perf_counter() - start:.1f}s")
+        return graph
+    
+    def _prepare_index_rows(self) -> List[Dict[str, Any]]:
+        """Turn the loaded dataset into index rows with stable ids and content hashes."""
+        rows = []
+        seen_keys: Dict[str, int] = {}
+        
+        for row_id in range(len(self.vocabulary)):
+            entry = self.vocabulary.entry(row_id)
+            doc_text = (f"Japanese: {entry['original']} "
+                        f"Reading: {entry['furigana']} "
+                        f"English: {entry['english']} "
+                        f"JLPT Level: {entry['jlpt_level']}")
+            
+            # Ids are keyed on the entry itself rather than its CSV position, so
+            # inserting or removing a row does not shift every id after it
+            key_source = f"{entry['original']}\x1f{entry['furigana']}\x1f{entry['jlpt_level']}"
+            key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()[:16]
+            duplicate = seen_keys.get(key, 0)
+            seen_keys[key] = duplicate + 1
+            entry_id = f"jlpt_{key}" if duplicate == 0 else f"jlpt_{key}_{duplicate}"
+            
+            rows.append({
+                "id": entry_id,
+                "document": doc_text,
+                "hash": hashlib.sha256(doc_text.encode("utf-8")).hexdigest(),
+                "metadata": {**entry, "row_id": row_id}
+            })
+        
+        return rows
+    
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the per-row hash manifest describing what is currently indexed."""
         try:
-            logger.info("Building vector embeddings...")
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index manifest {self.manifest_path}: {e}")
+            return {}
+        
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("model") != self.model_name:
+            logger.info("Index manifest is from a different version or model, re-embedding all rows")
+            return {}
+        
+        return manifest
+    
+    def _save_manifest(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the manifest so readers never see a partial file."""
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "model": self.model_name,
+            "collection": self.collection_name,
+            "entries": entries
+        }
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+    
+    def _load_checkpoint(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Entries written by an interrupted build, or None if there is no usable checkpoint."""
+        try:
+            f = open(self.checkpoint_path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        
+        entries: Dict[str, Dict[str, Any]] = {}
+        with f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                return None
+            if header.get("version") != MANIFEST_VERSION or header.get("model") != self.model_name:
+                return None
             
-            documents = []
-            metadatas = []
-            ids = []
+            for line in f:
+                try:
+                    entries.update(json.loads(line)["entries"])
+                except (ValueError, KeyError):
+                    break  # Torn final write from the crash; that chunk is redone
+        
+        return entries
+    
+    def _reset_checkpoint(self) -> None:
+        """Start a fresh checkpoint log for a new build."""
+        with open(self.checkpoint_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "model": self.model_name}, f)
+            f.write("\n")
+    
+    def _append_checkpoint(self, rows: List[Dict[str, Any]]) -> None:
+        """Durably record rows whose vectors are in the collection."""
+        record = {
+            "entries": {
+                row["id"]: {"hash": row["hash"], "row_id": row["metadata"]["row_id"]}
+                for row in rows
+            }
+        }
+        with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    
+    async def _sync_vector_index(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Diff the loaded dataset against the stored index and apply only the changes.
+        
+        Returns:
+            Number of rows embedded, relabeled and deleted
+        """
+        try:
+            indexed = self._load_manifest().get("entries", {})
             
-            for _, row in self.df.iterrows():
-                # Create comprehensive text for embedding
-                text_for_embedding = f"{row['Original']} {row['Furigana']} {row['English']}"
-                
-                # Create document text
-                doc_text = (f"Japanese: {row['Original']} "
-                           f"Reading: {row['Furigana']} "
-                           f"English: {row['English']} "
-                           f"JLPT Level: {row['JLPT Level']}")
-                
-                documents.append(doc_text)
-                
-                metadatas.append({
-                    "original": row['Original'],
-                    "furigana": row['Furigana'],
-                    "english": row['English'],
-                    "jlpt_level": row['JLPT Level'],
-                    "row_id": int(row['id'])
-                })
-                
-                ids.append(f"jlpt_{row['id']}")
+            # Chunks finished by an interrupted build count as indexed, so it resumes
+            checkpoint = self._load_checkpoint()
+            if checkpoint:
+                logger.info(f"Resuming interrupted index build: {len(checkpoint)} entries already written")
+                indexed.update(checkpoint)
+            
+            existing_ids = set(self.collection.get(include=[])["ids"])
+            current_ids = {row["id"] for row in rows}
+            
+            to_embed = []
+            to_relabel = []
+            for row in rows:
+                previous = indexed.get(row["id"])
+                if row["id"] not in existing_ids or previous is None or previous["hash"] != row["hash"]:
+                    to_embed.append(row)
+                elif previous["row_id"] != row["metadata"]["row_id"]:
+                    to_relabel.append(row)
             
-            # Generate embeddings
-            logger.info("Generating embeddings for vocabulary entries...")
-            embeddings = self.model.encode(documents, show_progress_bar=True)
+            stale_ids = sorted(existing_ids - current_ids)
+            counts = {"embedded": len(to_embed), "relabeled": len(to_relabel), "deleted": len(stale_ids)}
+            
+            if not (to_embed or to_relabel or stale_ids):
+                logger.info(f"Vector index is up to date with {len(rows)} entries")
+                return counts
+            
+            logger.info(f"Syncing vector index: {len(to_embed)} to embed, "
+                        f"{len(to_relabel)} to relabel, {len(stale_ids)} to delete")
             
-            # Add to ChromaDB collection in batches
             batch_size = 500
-            for i in range(0, len(documents), batch_size):
-                end_idx = min(i + batch_size, len(documents))
-                
-                self.collection.add(
-                    embeddings=embeddings[i:end_idx].tolist(),
-                    documents=documents[i:end_idx],
-                    metadatas=metadatas[i:end_idx],
-                    ids=ids[i:end_idx]
+            for i in range(0, len(stale_ids), batch_size):
+                self.collection.delete(ids=stale_ids[i:i + batch_size])
+            
+            for i in range(0, len(to_relabel), batch_size):
+                batch = to_relabel[i:i + batch_size]
+                self.collection.update(
+                    ids=[row["id"] for row in batch],
+                    metadatas=[row["metadata"] for row in batch]
                 )
+            
+            if to_embed:
+                if checkpoint is None:
+                    self._reset_checkpoint()
+                await self._build_vector_index(to_embed, on_chunk=self._append_checkpoint)
+            
+            self._save_manifest({
+                row["id"]: {"hash": row["hash"], "row_id": row["metadata"]["row_id"]}
+                for row in rows
+            })
+            if self.checkpoint_path.exists():
+                self.checkpoint_path.unlink()
+            logger.info(f"Vector index synced with {self.collection.count()} entries")
+            return counts
+            
+        except Exception as e:
+            logger.error(f"Failed to sync vector index: {e}")
+            raise
+    
+    async def _build_vector_index(
+        self,
+        rows: List[Dict[str, Any]],
+        on_chunk: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    ):
+        """
+        Embed the given index rows chunk by chunk, upserting each chunk as it is ready.
+        
+        Args:
+            rows: Index rows to embed
+            on_chunk: Called with each chunk's rows once they are in the collection
+        """
+        try:
+            chunk_size = max(1, settings.jlpt_build_chunk_size)
+            chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+            logger.info(f"Generating embeddings for {len(rows)} vocabulary entries in {len(chunks)} chunks...")
+            
+            done = 0
+            build_start = time.perf_counter()
+            for n, (chunk, embeddings, seconds) in enumerate(self._embed_chunks(chunks), 1):
+                # Upsert into ChromaDB collection in batches
+                batch_size = 500
+                for i in range(0, len(chunk), batch_size):
+                    batch = chunk[i:i + batch_size]
+                    self.collection.upsert(
+                        embeddings=embeddings[i:i + batch_size].tolist(),
+                        documents=[row["document"] for row in batch],
+                        metadatas=[row["metadata"] for row in batch],
+                        ids=[row["id"] for row in batch]
+                    )
+                
+                if on_chunk is not None:
+                    on_chunk(chunk)
                 
-                logger.info(f"Added batch {i//batch_size + 1}/{(len(documents)-1)//batch_size + 1}")
+                done += len(chunk)
+                logger.info(f"Chunk {n}/{len(chunks)}: {len(chunk)} entries in {seconds:.2f}s "
+                            f"({len(chunk) / max(seconds, 1e-9):.0f}/s), {done}/{len(rows)} done")
             
-            logger.info(f"Successfully built vector index with {len(documents)} entries")
+            elapsed = time.perf_counter() - build_start
+            logger.info(f"Successfully embedded {len(rows)} entries in {elapsed:.1f}s "
+                        f"({len(rows) / max(elapsed, 1e-9):.0f}/s)")
             
         except Exception as e:
             logger.error(f"Failed to build vector index: {e}")
             raise
     
+    def _embed_chunks(self, chunks: List[List[Dict[str, Any]]]):
+        """Yield ``(chunk, embeddings, seconds)`` for each chunk, as each finishes.
+        
+        Bundle vectors are sliced directly. Otherwise chunks are encoded in this
+        process or, with ``JLPT_BUILD_WORKERS`` > 0, in a process pool that
+        keeps a bounded number of chunks in flight. ``seconds`` is the time
+        spent producing that chunk's vectors, excluding time it sat queued.
+        """
+        if self.artifacts is not None:
+            for chunk in chunks:
+                start = time.perf_counter()
+                # Bundle vectors are stored in vocabulary row order
+                embeddings = np.asarray(self.artifacts.embeddings[[row["metadata"]["row_id"] for row in chunk]])
+                yield chunk, embeddings, time.perf_counter() - start
+            return
+        
+        workers = settings.jlpt_build_workers
+        if workers <= 0 or len(chunks) < 2:
+            for chunk in chunks:
+                start = time.perf_counter()
+                embeddings = self._encode_documents([row["document"] for row in chunk], show_progress_bar=False)
+                yield chunk, embeddings, time.perf_counter() - start
+            return
+        
+        # Spawned workers each load their own copy of the model once
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_encode_worker,
+            initargs=(self.embedding_backend_name, self.model_source, settings.hashing_embedding_dim)
+        ) as pool:
+            pending = {}
+            remaining = iter(chunks)
+            
+            def submit_next() -> bool:
+                chunk = next(remaining, None)
+                if chunk is None:
+                    return False
+                documents = [row["document"] for row in chunk]
+                if self.embedding_cache is not None:
+                    vectors = self.embedding_cache.get_many(documents)
+                else:
+                    vectors = [None] * len(documents)
+                missing = [i for i, vector in enumerate(vectors) if vector is None]
+                future = pool.submit(_encode_in_worker, [documents[i] for i in missing])
+                pending[future] = (chunk, documents, vectors, missing)
+                return True
+            
+            for _ in range(workers * 2):
+                if not submit_next():
+                    break
+            
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    chunk, documents, vectors, missing = pending.pop(future)
+                    fresh, seconds = future.result()
+                    if missing and self.embedding_cache is not None:
+                        self.embedding_cache.put_many([documents[i] for i in missing], fresh)
+                    for i, vector in zip(missing, fresh):
+                        vectors[i] = vector
+                    yield chunk, np.vstack(vectors).astype(np.float32, copy=False), seconds
+                    submit_next()
+    
+    def build_artifacts(self, output_dir: str, version: Optional[str] = None) -> Path:
+        """
+        Package the loaded vocabulary, model and vectors into an offline bundle.
+        
+        Args:
+            output_dir: Directory that will contain the versioned bundle
+            version: Bundle version; defaults to a content hash
+            
+        Returns:
+            Path of the bundle directory
+        """
+        if self.vocabulary is None:
+            raise ValueError("JLPT RAG system must be initialized before building artifacts")
+        
+        embeddings = self._encode_documents([row["document"] for row in self.index_rows])
+        return build_artifact_bundle(
+            self.vocabulary, embeddings, self.model, self.model_name, output_dir, version
+        )
+    
+    def _encode_documents(self, documents: List[str], show_progress_bar: bool = True) -> np.ndarray:
+        """Encode documents, reusing vectors from the shared embedding cache."""
+        if self.embedding_cache is None:
+            return self.model.encode(documents, show_progress_bar=show_progress_bar)
+        
+        vectors = self.embedding_cache.get_many(documents)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        logger.info(f"Embedding cache: {len(documents) - len(missing)} hits, {len(missing)} misses")
+        
+        if missing:
+            missing_docs = [documents[i] for i in missing]
+            fresh = self.model.encode(missing_docs, show_progress_bar=show_progress_bar)
+            self.embedding_cache.put_many(missing_docs, fresh)
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+        
+        return np.vstack(vectors).astype(np.float32, copy=False)
+    
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a query so trivially different spellings share a cache entry."""
+        query = unicodedata.normalize("NFKC", query)
+        return re.sub(r"\s+", " ", query).strip().casefold()
+    
+    def _lookup_queries(self, queries: List[str]):
+        """Return normalized keys, cached embeddings (None on a miss) and the distinct missing keys."""
+        keys = [self._normalize_query(query) for query in queries]
+        embeddings: List[Optional[np.ndarray]] = [self.query_cache.get(key) for key in keys]
+        
+        # Encode each distinct uncached query once, even if it repeats in the batch
+        missing = list(dict.fromkeys(key for key, emb in zip(keys, embeddings) if emb is None))
+        return keys, embeddings, missing
+    
+    def _merge_encoded(
+        self,
+        keys: List[str],
+        embeddings: List[Optional[np.ndarray]],
+        missing: List[str],
+        encoded: np.ndarray
+    ) -> np.ndarray:
+        """Cache freshly encoded queries and stack all embeddings in query order."""
+        if missing:
+            fresh = dict(zip(missing, encoded))
+            for key, embedding in fresh.items():
+                self.query_cache.set(key, embedding)
+            embeddings = [fresh[key] if emb is None else emb for key, emb in zip(keys, embeddings)]
+        
+        return np.vstack(embeddings)
+    
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed queries in one forward pass, skipping the model for cached ones."""
+        keys, embeddings, missing = self._lookup_queries(queries)
+        encoded = self.embedding_executor.encode_sync(missing) if missing else None
+        return self._merge_encoded(keys, embeddings, missing, encoded)
+    
+    async def _encode_queries_async(self, queries: List[str]) -> np.ndarray:
+        """Embed queries on the embedding executor without blocking the event loop."""
+        keys, embeddings, missing = self._lookup_queries(queries)
+        encoded = await self.embedding_executor.encode_async(missing) if missing else None
+        return self._merge_encoded(keys, embeddings, missing, encoded)
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Return the embedding for a query, skipping the model on cache hits."""
+        return self._encode_queries([query])[0]
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the query and document embedding caches."""
+        return {
+            "query_embeddings": self.query_cache.stats(),
+            "document_embeddings": {
+                "enabled": self.embedding_cache is not None,
+                "size": len(self.embedding_cache) if self.embedding_cache is not None else 0
+            }
+        }
+    
     def search_vocabulary(
         self, 
         query: str, 
@@ -189,62 +746,479 @@ class JLPTVocabularyRAG:
             List of vocabulary entries with similarity scores
         """
         try:
+            # Dictionary-style lookups and misspelled readings are answered
+            # without the embedding model
+            direct_results = self._direct_matches(query, n_results, jlpt_levels, include_metadata)
+            if direct_results:
+                logger.info(f"Found {len(direct_results)} direct matches for query: {query}")
+                return direct_results
+            
             # Generate query embedding
-            query_embedding = self.model.encode([query])
-            
-            # Build where clause for filtering
-            where_clause = None
-            if jlpt_levels:
-                where_clause = {"jlpt_level": {"$in": jlpt_levels}}
-            
-            # Search in vector database
-            results = self.collection.query(
-                query_embeddings=query_embedding.tolist(),
-                n_results=n_results,
-                where=where_clause
-            )
+            query_embedding = self._encode_query(query)
             
-            # Format results
-            formatted_results = []
-            if results['ids'] and results['ids'][0]:
-                for i in range(len(results['ids'][0])):
-                    result = {
-                        'id': results['ids'][0][i],
-                        'original': results['metadatas'][0][i]['original'],
-                        'furigana': results['metadatas'][0][i]['furigana'],
-                        'english': results['metadatas'][0][i]['english'],
-                        'jlpt_level': results['metadatas'][0][i]['jlpt_level'],
-                        'similarity_score': 1.0 - results['distances'][0][i],  # Convert distance to similarity
-                    }
-                    
-                    if include_metadata:
-                        result['document'] = results['documents'][0][i]
-                        result['metadata'] = results['metadatas'][0][i]
-                    
-                    formatted_results.append(result)
-            
-            logger.info(f"Found {len(formatted_results)} results for query: {query}")
-            return formatted_results
+            return self._search_embedded(query, query_embedding, n_results, jlpt_levels, include_metadata)
             
         except Exception as e:
             logger.error(f"Search failed for query '{query}': {e}")
             return []
     
-    def get_vocabulary_by_level(self, jlpt_level: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get vocabulary entries for a specific JLPT level."""
+    async def search_vocabulary_async(
+        self,
+        query: str,
+        n_results: int = 10,
+        jlpt_levels: Optional[List[str]] = None,
+        include_metadata: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of ``search_vocabulary`` for use on an event loop.
+        
+        The query is encoded on the embedding executor, where concurrent
+        searches are batched into one forward pass, and the index query runs
+        in a worker thread, so the loop is blocked by neither.
+        
+        Args:
+            query: Search query (can be in Japanese, English, or mixed)
+            n_results: Number of results to return
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+            include_metadata: Whether to include detailed metadata
+            
+        Returns:
+            List of vocabulary entries with similarity scores
+        """
         try:
-            filtered_df = self.df[self.df['JLPT Level'] == jlpt_level].head(limit)
+            direct_results = self._direct_matches(query, n_results, jlpt_levels, include_metadata)
+            if direct_results:
+                logger.info(f"Found {len(direct_results)} direct matches for query: {query}")
+                return direct_results
+            
+            query_embedding = (await self._encode_queries_async([query]))[0]
+            
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._search_embedded, query, query_embedding, n_results, jlpt_levels, include_metadata
+            )
+            
+        except Exception as e:
+            logger.error(f"Search failed for query '{query}': {e}")
+            return []
+    
+    def search_with_embedding(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        n_results: int = 10,
+        jlpt_levels: Optional[List[str]] = None,
+        include_metadata: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Search with a query that has already been encoded (e.g. shared across corpora).
+        
+        Args:
+            query: Search query text, used for exact and substring matching
+            query_embedding: Embedding of ``query`` from this RAG's model
+            n_results: Number of results to return
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+            include_metadata: Whether to include detailed metadata
             
-            results = []
-            for _, row in filtered_df.iterrows():
-                results.append({
-                    'original': row['Original'],
-                    'furigana': row['Furigana'],
-                    'english': row['English'],
-                    'jlpt_level': row['JLPT Level']
-                })
+        Returns:
+            List of vocabulary entries with similarity scores
+        """
+        direct_results = self._direct_matches(query, n_results, jlpt_levels, include_metadata)
+        if direct_results:
+            return direct_results
+        return self._search_embedded(query, query_embedding, n_results, jlpt_levels, include_metadata)
+    
+    def _search_embedded(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]],
+        include_metadata: bool
+    ) -> List[Dict[str, Any]]:
+        """Vector search for an encoded query, fused with lexical matches."""
+        results = self._vector_query([query], query_embedding[np.newaxis, :], n_results, jlpt_levels)
+        
+        formatted_results = self._format_results(results, 0, include_metadata)
+        formatted_results = self._fuse_lexical(
+            query, formatted_results, n_results, jlpt_levels, include_metadata
+        )
+        formatted_results = self._append_romaji_matches(
+            query, formatted_results, n_results, jlpt_levels, include_metadata
+        )
+        
+        logger.info(f"Found {len(formatted_results)} results for query: {query}")
+        return formatted_results
+    
+    def search_vocabulary_batch(
+        self,
+        queries: List[str],
+        n_results: int = 10,
+        jlpt_levels: Optional[List[str]] = None,
+        include_metadata: bool = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for many vocabulary queries with one encode and one vector query.
+        
+        Args:
+            queries: Search queries (Japanese, English, or mixed)
+            n_results: Number of results to return per query
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+            include_metadata: Whether to include detailed metadata
+            
+        Returns:
+            One result list per query, aligned with the input order
+        """
+        if not queries:
+            return []
+        
+        try:
+            batch_results = [
+                self._direct_matches(query, n_results, jlpt_levels, include_metadata)
+                for query in queries
+            ]
+            pending = [i for i, results in enumerate(batch_results) if not results]
             
+            if pending:
+                query_embeddings = self._encode_queries([queries[i] for i in pending])
+                self._search_pending(queries, pending, query_embeddings, batch_results,
+                                     n_results, jlpt_levels, include_metadata)
+            
+            logger.info(f"Batch search for {len(queries)} queries returned "
+                        f"{sum(len(r) for r in batch_results)} results "
+                        f"({len(queries) - len(pending)} direct)")
+            return batch_results
+        
+        except Exception as e:
+            logger.error(f"Batch search failed for {len(queries)} queries: {e}")
+            return [[] for _ in queries]
+    
+    async def search_vocabulary_batch_async(
+        self,
+        queries: List[str],
+        n_results: int = 10,
+        jlpt_levels: Optional[List[str]] = None,
+        include_metadata: bool = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Async variant of ``search_vocabulary_batch`` for use on an event loop.
+        
+        Queries are encoded on the embedding executor and the single vector
+        query runs in a worker thread, so synchronous backends such as Chroma
+        never block the loop.
+        
+        Args:
+            queries: Search queries (Japanese, English, or mixed)
+            n_results: Number of results to return per query
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+            include_metadata: Whether to include detailed metadata
+        
+        Returns:
+            One result list per query, aligned with the input order
+        """
+        if not queries:
+            return []
+        
+        try:
+            batch_results = [
+                self._direct_matches(query, n_results, jlpt_levels, include_metadata)
+                for query in queries
+            ]
+            pending = [i for i, results in enumerate(batch_results) if not results]
+            
+            if pending:
+                query_embeddings = await self._encode_queries_async([queries[i] for i in pending])
+                await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    lambda: self._search_pending(queries, pending, query_embeddings, batch_results,
+                                                 n_results, jlpt_levels, include_metadata)
+                )
+            
+            logger.info(f"Batch search for {len(queries)} queries returned "
+                        f"{sum(len(r) for r in batch_results)} results "
+                        f"({len(queries) - len(pending)} direct)")
+            return batch_results
+            
+        except Exception as e:
+            logger.error(f"Batch search failed for {len(queries)} queries: {e}")
+            return [[] for _ in queries]
+    
+    def _search_pending(
+        self,
+        queries: List[str],
+        pending: List[int],
+        query_embeddings: np.ndarray,
+        batch_results: List[List[Dict[str, Any]]],
+        n_results: int,
+        jlpt_levels: Optional[List[str]],
+        include_metadata: bool
+    ) -> None:
+        """Run one vector query for the ``pending`` queries and fill in their results."""
+        results = self._vector_query(
+            [queries[i] for i in pending], query_embeddings, n_results, jlpt_levels
+        )
+        
+        for j, i in enumerate(pending):
+            formatted_results = self._format_results(results, j, include_metadata)
+            formatted_results = self._fuse_lexical(
+                queries[i], formatted_results, n_results, jlpt_levels, include_metadata
+            )
+            batch_results[i] = self._append_romaji_matches(
+                queries[i], formatted_results, n_results, jlpt_levels, include_metadata
+            )
+    
+    def _vector_query(
+        self,
+        queries: List[str],
+        query_embeddings: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Query the field vectors routed by script, or the document vectors without them."""
+        if self.field_index is not None:
+            return self.field_index.query(queries, query_embeddings, n_results, jlpt_levels)
+        return self.search_backend.query(query_embeddings, n_results, jlpt_levels)
+    
+    def _direct_matches(
+        self,
+        query: str,
+        n_results: int,
+        jlpt_levels: Optional[List[str]],
+        include_metadata: bool
+    ) -> List[Dict[str, Any]]:
+        """Exact matches (of the query or the kana a romaji query spells), or
+        typo-tolerant reading matches when the query matches nothing.
+        
+        The romaji and fuzzy fallbacks only run when the lexical index has no
+        substring match either, so English words that happen to spell kana
+        ("mine", "hate") and partial readings keep going to vector search. An
+        empty list means the query needs vector search.
+        """
+        exact_results = self._exact_matches(query, n_results, jlpt_levels, include_metadata)
+        if exact_results:
+            return exact_results
+        
+        if self.lexical_index is not None and self.lexical_index.search(query, limit=1, jlpt_levels=jlpt_levels):
+            return []
+        
+        positions = self._romaji_positions(query, jlpt_levels)
+        if positions:
+            return [self._row_result(self.index_rows[p], 1.0, include_metadata) for p in positions[:n_results]]
+        
+        if self.fuzzy_index is None:
+            return []
+        return self.fuzzy_lookup(query, n_results, jlpt_levels, include_metadata=include_metadata)
+    
+    def _romaji_positions(self, query: str, jlpt_levels: Optional[List[str]]) -> List[int]:
+        """Exact matches for the kana a romaji query spells.
+        
+        Romaji typed on an English keyboard is looked up as hiragana and as
+        katakana for loanwords ("terebi").
+        """
+        if self.lexical_index is None:
+            return []
+        kana = romaji_query_to_kana(query)
+        if not kana or kana == query:
+            return []
+        return (self.lexical_index.exact(kana, jlpt_levels)
+                or self.lexical_index.exact(hiragana_to_katakana(kana), jlpt_levels))
+    
+    def _append_romaji_matches(
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        n_results: int,
+        jlpt_levels: Optional[List[str]],
+        include_metadata: bool
+    ) -> List[Dict[str, Any]]:
+        """Rank words an English query also spells in romaji below the search results.
+        
+        Free slots are filled first; otherwise the romaji matches take at most
+        the last quarter of the list, scored no higher than the result above.
+        """
+        seen = {result['id'] for result in results}
+        positions = [p for p in self._romaji_positions(query, jlpt_levels) if self.index_rows[p]['id'] not in seen]
+        if not positions:
             return results
+        
+        kept = results[:max(n_results - len(positions), n_results - max(1, n_results // 4))]
+        score = min((result['similarity_score'] for result in kept), default=1.0)
+        for position in positions[:n_results - len(kept)]:
+            kept.append(self._row_result(self.index_rows[position], score, include_metadata))
+        return kept
+    
+    def fuzzy_lookup(
+        self,
+        query: str,
+        n_results: int = 10,
+        jlpt_levels: Optional[List[str]] = None,
+        max_distance: Optional[int] = None,
+        include_metadata: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Look up a misspelled reading in kana or romaji (たべろ, "tabera").
+        
+        Args:
+            query: Reading in hiragana, katakana or romaji
+            n_results: Number of results to return
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+            max_distance: Edit distance bound; scales with the query length by default
+            include_metadata: Whether to include detailed metadata
+        
+        Returns:
+            Entries with their ``edit_distance``, closest first
+        """
+        if self.fuzzy_index is None:
+            return []
+        
+        results = []
+        for position, distance in self.fuzzy_index.lookup(query, n_results, jlpt_levels, max_distance):
+            result = self._row_result(self.index_rows[position], 1.0 / (1.0 + distance), include_metadata)
+            result['edit_distance'] = distance
+            results.append(result)
+        return results
+    
+    def _exact_matches(
+        self,
+        query: str,
+        n_results: int,
+        jlpt_levels: Optional[List[str]],
+        include_metadata: bool
+    ) -> List[Dict[str, Any]]:
+        """Exact field matches for the query, topped up with substring matches.
+        
+        Returns an empty list when nothing matches exactly, so callers fall
+        through to vector search.
+        """
+        if self.lexical_index is None:
+            return []
+        
+        positions = self.lexical_index.exact(query, jlpt_levels)[:n_results]
+        if not positions:
+            return []
+        
+        results = [self._row_result(self.index_rows[p], 1.0, include_metadata) for p in positions]
+        seen = set(positions)
+        for position, score in self.lexical_index.search(query, limit=n_results, jlpt_levels=jlpt_levels):
+            if len(results) >= n_results:
+                break
+            if position not in seen:
+                results.append(self._row_result(self.index_rows[position], score, include_metadata))
+        
+        return results
+    
+    def _fuse_lexical(
+        self,
+        query: str,
+        vector_results: List[Dict[str, Any]],
+        n_results: int,
+        jlpt_levels: Optional[List[str]],
+        include_metadata: bool
+    ) -> List[Dict[str, Any]]:
+        """Merge substring matches into vector results with reciprocal rank fusion."""
+        if self.lexical_index is None:
+            return vector_results
+        
+        lexical_hits = self.lexical_index.search(query, limit=n_results, jlpt_levels=jlpt_levels)
+        if not lexical_hits:
+            return vector_results
+        
+        candidates = {result['id']: result for result in vector_results}
+        lexical_ids = []
+        for position, score in lexical_hits:
+            row = self.index_rows[position]
+            lexical_ids.append(row['id'])
+            if row['id'] in candidates:
+                result = candidates[row['id']]
+                result['similarity_score'] = max(result['similarity_score'], score)
+            else:
+                candidates[row['id']] = self._row_result(row, score, include_metadata)
+        
+        fused = reciprocal_rank_fusion([lexical_ids, [result['id'] for result in vector_results]])
+        return [candidates[entry_id] for entry_id, _ in fused[:n_results]]
+    
+    @staticmethod
+    def _row_result(row: Dict[str, Any], score: float, include_metadata: bool) -> Dict[str, Any]:
+        """Build a search result dict from an index row."""
+        metadata = row['metadata']
+        result = {
+            'id': row['id'],
+            'original': metadata['original'],
+            'furigana': metadata['furigana'],
+            'english': metadata['english'],
+            'jlpt_level': metadata['jlpt_level'],
+            'similarity_score': score,
+        }
+        
+        if include_metadata:
+            result['document'] = row['document']
+            result['metadata'] = metadata
+        
+        return result
+    
+    @classmethod
+    def _format_results(
+        cls,
+        results: Dict[str, Any],
+        query_index: int,
+        include_metadata: bool
+    ) -> List[Dict[str, Any]]:
+        """Convert one query's slice of a backend query response into result dicts."""
+        if not results['ids'] or not results['ids'][query_index]:
+            return []
+        
+        rows = zip(
+            results['ids'][query_index],
+            results['metadatas'][query_index],
+            results['documents'][query_index],
+            results['distances'][query_index]
+        )
+        return [
+            # Convert distance to similarity
+            cls._row_result({'id': entry_id, 'metadata': metadata, 'document': document},
+                            1.0 - distance, include_metadata)
+            for entry_id, metadata, document, distance in rows
+        ]
+    
+    def autocomplete(
+        self,
+        prefix: str,
+        limit: int = 10,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggest entries whose surface form, reading or gloss starts with ``prefix``.
+        
+        Args:
+            prefix: Typed text; katakana and hiragana are interchangeable
+            limit: Number of suggestions to return
+            jlpt_levels: Filter by JLPT levels (e.g., ['N1', 'N2'])
+        
+        Returns:
+            Entries with the key they complete to, easiest JLPT level first
+        """
+        if self.prefix_index is None:
+            return []
+        
+        suggestions = []
+        for position, completion in self.prefix_index.complete(prefix, limit, jlpt_levels):
+            metadata = self.index_rows[position]['metadata']
+            suggestions.append({
+                'id': self.index_rows[position]['id'],
+                'original': metadata['original'],
+                'furigana': metadata['furigana'],
+                'english': metadata['english'],
+                'jlpt_level': metadata['jlpt_level'],
+                'completion': completion
+            })
+        return suggestions
+    
+    def get_vocabulary_by_level(self, jlpt_level: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get vocabulary entries for a specific JLPT level."""
+        try:
+            if self.vocabulary is None:
+                return []
+            
+            return self.vocabulary.entries_for_level(jlpt_level, limit=limit)
             
         except Exception as e:
             logger.error(f"Failed to get vocabulary for level {jlpt_level}: {e}")
@@ -252,28 +1226,141 @@ class JLPTVocabularyRAG:
     
     def get_similar_words(self, word: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """Find words similar to the given word."""
-        return self.search_vocabulary(word, n_results=n_results, include_metadata=False)
+        # Semantic neighbours only: the lexical fast path would just echo the word back
+        try:
+            # Vocabulary words read their neighbours straight from the graph
+            position = self._vocabulary_position(word)
+            if position is not None and self.neighbor_graph is not None and n_results <= self.neighbor_graph.k:
+                neighbors, scores = self.neighbor_graph.neighbors_of(position, n_results)
+                return [
+                    self._row_result(self.index_rows[int(neighbor)], float(score), include_metadata=False)
+                    for neighbor, score in zip(neighbors, scores)
+                ]
+            
+            query_embedding = self._encode_query(word)
+            results = self.search_backend.query(query_embedding[np.newaxis, :], n_results, None)
+            return self._format_results(results, 0, include_metadata=False)
+        except Exception as e:
+            logger.error(f"Similar word search failed for '{word}': {e}")
+            return []
+    
+    def _vocabulary_position(self, word: str) -> Optional[int]:
+        """Index row of a vocabulary word given as written, as read or in romaji."""
+        if self.lexical_index is None:
+            return None
+        
+        positions = self.lexical_index.exact(word)
+        # English words that also spell kana ("mine") stay English
+        if not positions and not self.lexical_index.search(word, limit=1):
+            positions = self._romaji_positions(word, None)
+        return positions[0] if positions else None
+    
+    def get_quiz_distractors(self, row_id: int, count: int = 3) -> List[Dict[str, Any]]:
+        """
+        Pick wrong answers for a vocabulary question.
+        
+        Nearest neighbours make plausible distractors; entries sharing the
+        answer's meaning or spelling are skipped, and random words of the same
+        level fill any remaining slots.
+        
+        Args:
+            row_id: Vocabulary row of the correct answer
+            count: Number of distractors
+        
+        Returns:
+            Distractor entries
+        """
+        answer = self.vocabulary.entry(row_id)
+        seen_meanings = {normalize_text(answer['english'])}
+        seen_words = {answer['original']}
+        
+        candidates: List[int] = []
+        if self.neighbor_graph is not None:
+            candidates.extend(int(neighbor) for neighbor in self.neighbor_graph.neighbors_of(row_id)[0])
+        candidates.extend(self.vocabulary.sample_rows(answer['jlpt_level'], count * 4))
+        
+        distractors = []
+        for candidate in candidates:
+            if len(distractors) == count:
+                break
+            entry = self.vocabulary.entry(candidate)
+            meaning = normalize_text(entry['english'])
+            if candidate == row_id or meaning in seen_meanings or entry['original'] in seen_words:
+                continue
+            seen_meanings.add(meaning)
+            seen_words.add(entry['original'])
+            distractors.append(entry)
+        return distractors
+    
+    def generate_quiz(
+        self,
+        jlpt_level: Optional[str] = None,
+        count: int = 5,
+        n_choices: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Build multiple-choice meaning questions for random vocabulary.
+        
+        Args:
+            jlpt_level: Optional JLPT level to draw words from
+            count: Number of questions
+            n_choices: Choices per question, including the answer
+        
+        Returns:
+            Questions with the word, its English ``choices`` and the index of
+            the correct ``answer``
+        """
+        if self.vocabulary is None:
+            return []
+        
+        questions = []
+        for row_id in self.vocabulary.sample_rows(jlpt_level=jlpt_level, count=count):
+            word = self.vocabulary.entry(row_id)
+            choices = [entry['english'] for entry in self.get_quiz_distractors(row_id, n_choices - 1)]
+            answer = random.randint(0, len(choices))
+            choices.insert(answer, word['english'])
+            questions.append({'word': word, 'choices': choices, 'answer': answer})
+        return questions
+    
+    def evaluate_search_backend(self, n_queries: int = 200, k: int = 10, seed: int = 0) -> Dict[str, Any]:
+        """
+        Measure an approximate search index against exact float32 search.
+        
+        Args:
+            n_queries: Number of vocabulary glosses sampled as test queries
+            k: Result list length for recall@k
+            seed: Sampling seed, so repeated runs compare like with like
+        
+        Returns:
+            Memory report and recall@k, or an error entry for backends that
+            cannot be compared in process
+        """
+        if not isinstance(self.search_backend, NumpySearchBackend):
+            return {'error': f'Search backend {self.search_backend_name} does not support recall evaluation'}
+        
+        rows = random.Random(seed).sample(range(len(self.vocabulary)), min(n_queries, len(self.vocabulary)))
+        queries = self._encode_queries([self.vocabulary.english[row_id] for row_id in rows])
+        
+        report = self.search_backend.memory_report()
+        report.update(self.search_backend.recall_at_k(queries, k=k))
+        return report
     
     def get_level_statistics(self) -> Dict[str, Any]:
         """Get statistics about JLPT vocabulary levels."""
         try:
-            if self.df is None:
+            if self.vocabulary is None:
                 return {}
             
-            stats = {
-                'total_vocabulary': len(self.df),
-                'levels': {},
-                'collection_count': self.collection.count() if self.collection else 0
-            }
-            
-            for level in sorted(self.df['JLPT Level'].unique()):
-                count = len(self.df[self.df['JLPT Level'] == level])
-                percentage = (count / len(self.df)) * 100
-                
-                stats['levels'][level] = {
-                    'count': count,
-                    'percentage': round(percentage, 2)
-                }
+            stats = self.vocabulary.statistics()
+            stats.update({
+                'collection_count': self.collection.count() if self.collection else 0,
+                'search_backend': self.search_backend.name if self.search_backend else None,
+                'search_index': self.search_backend.memory_report() if self.search_backend else None,
+                'field_index': self.field_index.memory_report() if self.field_index else None,
+                'neighbor_graph': self.neighbor_graph.memory_report() if self.neighbor_graph else None,
+                'cache': self.get_cache_stats(),
+                'embedding_executor': self.embedding_executor.stats()
+            })
             
             return stats
             
@@ -292,44 +1379,154 @@ class JLPTVocabularyRAG:
     def get_random_vocabulary(self, jlpt_level: Optional[str] = None, count: int = 5) -> List[Dict[str, Any]]:
         """Get random vocabulary entries, optionally filtered by JLPT level."""
         try:
-            if self.df is None:
-                return []
-            
-            df_to_sample = self.df
-            if jlpt_level:
-                df_to_sample = self.df[self.df['JLPT Level'] == jlpt_level]
-            
-            if len(df_to_sample) == 0:
+            if self.vocabulary is None:
                 return []
             
-            sample_size = min(count, len(df_to_sample))
-            random_entries = df_to_sample.sample(n=sample_size)
-            
-            results = []
-            for _, row in random_entries.iterrows():
-                results.append({
-                    'original': row['Original'],
-                    'furigana': row['Furigana'],
-                    'english': row['English'],
-                    'jlpt_level': row['JLPT Level']
-                })
-            
-            return results
+            return self.vocabulary.sample(jlpt_level=jlpt_level, count=count)
             
         except Exception as e:
             logger.error(f"Failed to get random vocabulary: {e}")
             return []
 
 
-# Global instance
-_jlpt_rag_instance = None
+# Global instance, built at most once per process
+_jlpt_rag_instance: Optional[JLPTVocabularyRAG] = None
+_jlpt_rag_lock: Optional[asyncio.Lock] = None
+_jlpt_rag_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+_jlpt_rag_warmup_task: Optional[asyncio.Task] = None
+_jlpt_rag_status: Dict[str, Any] = {
+    'state': 'idle',
+    'started_at': None,
+    'finished_at': None,
+    'load_seconds': None,
+    'attempts': 0,
+    'error': None
+}
+
+
+def _get_jlpt_rag_lock() -> asyncio.Lock:
+    """Return the init lock for the running event loop (the CLI runs one loop per command)."""
+    global _jlpt_rag_lock, _jlpt_rag_lock_loop
+    
+    loop = asyncio.get_running_loop()
+    if _jlpt_rag_lock is None or _jlpt_rag_lock_loop is not loop:
+        _jlpt_rag_lock = asyncio.Lock()
+        _jlpt_rag_lock_loop = loop
+    return _jlpt_rag_lock
+
+
+def _build_jlpt_rag() -> JLPTVocabularyRAG:
+    """Construct and initialize the RAG; runs in a worker thread off the event loop.
+    
+    The federated retriever's corpora (kanji derived from the whole
+    vocabulary, grammar, examples) are indexed here too, so the first chat
+    query does not pay for them.
+    """
+    rag = JLPTVocabularyRAG()
+    asyncio.run(rag.initialize())
+    get_federated_retriever(rag).build_indexes()
+    return rag
+
 
-async def get_jlpt_rag() -> JLPTVocabularyRAG:
-    """Get or create the global JLPT RAG instance."""
+async def _load_jlpt_rag() -> JLPTVocabularyRAG:
+    """Single-flight initializer: concurrent callers wait on one build."""
     global _jlpt_rag_instance
     
-    if _jlpt_rag_instance is None:
-        _jlpt_rag_instance = JLPTVocabularyRAG()
-        await _jlpt_rag_instance.initialize()
+    async with _get_jlpt_rag_lock():
+        if _jlpt_rag_instance is not None:
+            return _jlpt_rag_instance
+        
+        _jlpt_rag_status.update(
+            state='loading',
+            started_at=time.time(),
+            finished_at=None,
+            load_seconds=None,
+            attempts=_jlpt_rag_status['attempts'] + 1,
+            error=None
+        )
+        start = time.perf_counter()
+        
+        try:
+            # Model load, dataset download and index sync all block, so keep
+            # them off the event loop that is serving requests
+            rag = await asyncio.get_running_loop().run_in_executor(None, _build_jlpt_rag)
+        except Exception as e:
+            _jlpt_rag_status.update(
+                state='failed',
+                finished_at=time.time(),
+                load_seconds=round(time.perf_counter() - start, 3),
+                error=str(e)
+            )
+            logger.error(f"JLPT RAG initialization failed: {e}")
+            raise
+        
+        _jlpt_rag_instance = rag
+        _jlpt_rag_status.update(
+            state='ready',
+            finished_at=time.time(),
+            load_seconds=round(time.perf_counter() - start, 3)
+        )
+        logger.info(f"JLPT RAG ready in {_jlpt_rag_status['load_seconds']}s")
+        return rag
+
+
+async def get_jlpt_rag(timeout: Optional[float] = None) -> JLPTVocabularyRAG:
+    """
+    Get or create the global JLPT RAG instance.
+    
+    Args:
+        timeout: Seconds to wait for a background warmup that is still
+            loading; None waits indefinitely. The build keeps running in the
+            background on timeout. Without a warmup in flight the call always
+            loads the RAG and waits for it, so a process that never started
+            one still gets vocabulary context.
+    
+    Returns:
+        The initialized RAG instance
     
-    return _jlpt_rag_instance
\ No newline at end of file
+    Raises:
+        asyncio.TimeoutError: If a warmup is in flight and not ready within ``timeout``
+    """
+    if _jlpt_rag_instance is not None:
+        return _jlpt_rag_instance
+    
+    task = _jlpt_rag_warmup_task
+    warming = task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+    if timeout is None or not warming:
+        return await _load_jlpt_rag()
+    
+    return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+
+def get_jlpt_rag_if_ready() -> Optional[JLPTVocabularyRAG]:
+    """Return the global instance if it has finished loading, without waiting."""
+    return _jlpt_rag_instance
+
+
+def start_jlpt_rag_warmup() -> "asyncio.Future[JLPTVocabularyRAG]":
+    """
+    Start loading the global instance in the background.
+    
+    Must be called from a running event loop. Repeated calls while a load is in
+    flight return the same task; after a failure the next call retries.
+    """
+    global _jlpt_rag_warmup_task
+    
+    if _jlpt_rag_instance is not None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(_jlpt_rag_instance)
+        return future
+    
+    task = _jlpt_rag_warmup_task
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_load_jlpt_rag())
+        # Failures are recorded in the status; don't let them surface as
+        # "exception was never retrieved" warnings
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _jlpt_rag_warmup_task = task
+    return task
+
+
+def get_jlpt_rag_status() -> Dict[str, Any]:
+    """Return the loading state (idle, loading, ready or failed) with timings."""
+    return dict(_jlpt_rag_status)
@@ -0,0 +1,295 @@
+"""
+Kana normalization, romanization and romaji input.
+
+``fold_kana`` maps katakana (full or half width) to hiragana and spells out
+the long vowel mark, so ``コーヒー`` and ``こおひい`` compare equal.
+``kana_to_romaji`` produces modified Hepburn (or Kunrei-shiki) romaji, the
+spelling learners type when they do not have a Japanese keyboard, and
+``romaji_to_kana`` turns such input back into kana with a longest-match
+automaton compiled from the syllable tables.
+"""
+
+import re
+import unicodedata
+
+_KATAKANA_START, _KATAKANA_END = ord("ァ"), ord("ヶ")
+_KATAKANA_OFFSET = ord("ァ") - ord("ぁ")
+
+LONG_VOWEL_MARK = "ー"
+
+_VOWEL_KANA = {"a": "あ", "i": "い", "u": "う", "e": "え", "o": "お"}
+
+HIRAGANA_ROMAJI = {
+    "あ": "a", "い": "i", "う": "u", "え": "e", "お": "o",
+    "か": "ka", "き": "ki", "く": "ku", "け": "ke", "こ": "ko",
+    "が": "ga", "ぎ": "gi", "ぐ": "gu", "げ": "ge", "ご": "go",
+    "さ": "sa", "し": "shi", "す": "su", "せ": "se", "そ": "so",
+    "ざ": "za", "じ": "ji", "ず": "zu", "ぜ": "ze", "ぞ": "zo",
+    "た": "ta", "ち": "chi", "つ": "tsu", "て": "te", "と": "to",
+    "だ": "da", "ぢ": "ji", "づ": "zu", "で": "de", "ど": "do",
+    "な": "na", "に": "ni", "ぬ": "nu", "ね": "ne", "の": "no",
+    "は": "ha", "ひ": "hi", "ふ": "fu", "へ": "he", "ほ": "ho",
+    "ば": "ba", "び": "bi", "ぶ": "bu", "べ": "be", "ぼ": "bo",
+    "ぱ": "pa", "ぴ": "pi", "ぷ": "pu", "ぺ": "pe", "ぽ": "po",
+    "ま": "ma", "み": "mi", "む": "mu", "め": "me", "も": "mo",
+    "や": "ya", "ゆ": "yu", "よ": "yo",
+    "ら": "ra", "り": "ri", "る": "ru", "れ": "re", "ろ": "ro",
+    "わ": "wa", "ゐ": "i", "ゑ": "e", "を": "o", "ん": "n",
+    "ゔ": "vu",
+    "ぁ": "a", "ぃ": "i", "ぅ": "u", "ぇ": "e", "ぉ": "o",
+    "ゃ": "ya", "ゅ": "yu", "ょ": "yo", "ゎ": "wa",
+    # Digraphs
+    "きゃ": "kya", "きゅ": "kyu", "きょ": "kyo",
+    "ぎゃ": "gya", "ぎゅ": "gyu", "ぎょ": "gyo",
+    "しゃ": "sha", "しゅ": "shu", "しぇ": "she", "しょ": "sho",
+    "じゃ": "ja", "じゅ": "ju", "じぇ": "je", "じょ": "jo",
+    "ちゃ": "cha", "ちゅ": "chu", "ちぇ": "che", "ちょ": "cho",
+    "ぢゃ": "ja", "ぢゅ": "ju", "ぢょ": "jo",
+    "にゃ": "nya", "にゅ": "nyu", "にょ": "nyo",
+    "ひゃ": "hya", "ひゅ": "hyu", "ひょ": "hyo",
+    "びゃ": "bya", "びゅ": "byu", "びょ": "byo",
+    "ぴゃ": "pya", "ぴゅ": "pyu", "ぴょ": "pyo",
+    "みゃ": "mya", "みゅ": "myu", "みょ": "myo",
+    "りゃ": "rya", "りゅ": "ryu", "りょ": "ryo",
+    # Loanword combinations
+    "ふぁ": "fa", "ふぃ": "fi", "ふぇ": "fe", "ふぉ": "fo",
+    "てぃ": "ti", "でぃ": "di", "とぅ": "tu", "どぅ": "du",
+    "うぃ": "wi", "うぇ": "we", "うぉ": "wo",
+    "ゔぁ": "va", "ゔぃ": "vi", "ゔぇ": "ve", "ゔぉ": "vo",
+    "つぁ": "tsa", "つぃ": "tsi", "つぇ": "tse", "つぉ": "tso",
+}
+
+SOKUON = "っ"
+HATSUON = "ん"
+
+# Kunrei-shiki spellings that differ from Hepburn
+KUNREI_OVERRIDES = {
+    "し": "si", "ち": "ti", "つ": "tu", "ふ": "hu", "じ": "zi", "ぢ": "zi", "づ": "zu",
+    "しゃ": "sya", "しゅ": "syu", "しょ": "syo",
+    "じゃ": "zya", "じゅ": "zyu", "じょ": "zyo",
+    "ちゃ": "tya", "ちゅ": "tyu", "ちょ": "tyo",
+    "ぢゃ": "zya", "ぢゅ": "zyu", "ぢょ": "zyo",
+}
+
+# Romaji accepted on input besides the Hepburn table: Kunrei/Nihon-shiki,
+# common keyboard (IME) spellings and explicit small kana
+ROMAJI_INPUT_EXTRAS = {
+    "si": "し", "ti": "ち", "tu": "つ", "hu": "ふ", "zi": "じ", "di": "ぢ", "du": "づ",
+    "sya": "しゃ", "syu": "しゅ", "syo": "しょ",
+    "tya": "ちゃ", "tyu": "ちゅ", "tyo": "ちょ",
+    "cya": "ちゃ", "cyu": "ちゅ", "cyo": "ちょ",
+    "zya": "じゃ", "zyu": "じゅ", "zyo": "じょ",
+    "jya": "じゃ", "jyu": "じゅ", "jyo": "じょ",
+    "dya": "ぢゃ", "dyu": "ぢゅ", "dyo": "ぢょ",
+    "wo": "を", "ye": "いぇ", "thi": "てぃ", "dhi": "でぃ",
+    "ca": "か", "cu": "く", "co": "こ",
+    "xa": "ぁ", "xi": "ぃ", "xu": "ぅ", "xe": "ぇ", "xo": "ぉ",
+    "la": "ぁ", "li": "ぃ", "lu": "ぅ", "le": "ぇ", "lo": "ぉ",
+    "xya": "ゃ", "xyu": "ゅ", "xyo": "ょ", "lya": "ゃ", "lyu": "ゅ", "lyo": "ょ",
+    "xtu": "っ", "xtsu": "っ", "ltu": "っ", "ltsu": "っ", "xwa": "ゎ",
+    "-": LONG_VOWEL_MARK,
+}
+
+# Macron (Hepburn) and circumflex (Kunrei) long vowels
+_LONG_VOWELS = str.maketrans({
+    "ā": "aa", "ī": "ii", "ū": "uu", "ē": "ee", "ō": "ou",
+    "â": "aa", "î": "ii", "û": "uu", "ê": "ee", "ô": "ou",
+})
+
+_VOWELS = "aeiou"
+
+# Kana written as a plain ASCII word: consonant clusters followed by a vowel, or n
+ROMAJI_PATTERN = re.compile(r"(?:[bcdfghjkmnprstvwyz]{0,3}[aeiou]|n)+")
+
+
+def katakana_to_hiragana(text: str) -> str:
+    """Replace every full-width katakana letter with its hiragana counterpart."""
+    return "".join(
+        chr(ord(ch) - _KATAKANA_OFFSET) if _KATAKANA_START <= ord(ch) <= _KATAKANA_END else ch
+        for ch in text
+    )
+
+
+def fold_kana(text: str) -> str:
+    """
+    Normalize kana for comparison.
+
+    Half-width kana are widened (NFKC), katakana become hiragana and the long
+    vowel mark is replaced by the vowel it lengthens (``ラーメン`` ->
+    ``らあめん``). Other characters are kept.
+
+    Args:
+        text: Text containing kana
+
+    Returns:
+        Folded hiragana text
+    """
+    text = katakana_to_hiragana(unicodedata.normalize("NFKC", text))
+    if LONG_VOWEL_MARK not in text:
+        return text
+
+    folded = []
+    for ch in text:
+        if ch == LONG_VOWEL_MARK and folded:
+            romaji = HIRAGANA_ROMAJI.get(folded[-1], "")
+            ch = _VOWEL_KANA.get(romaji[-1:], ch)
+        folded.append(ch)
+    return "".join(folded)
+
+
+def kana_to_romaji(text: str, system: str = "hepburn") -> str:
+    """
+    Romanize kana in modified Hepburn or Kunrei-shiki.
+
+    Digraphs are read as one syllable, っ doubles the next consonant (``っち``
+    -> ``tchi`` in Hepburn) and ん is written ``n'`` before a vowel or ``y``.
+    Characters that are not kana, such as kanji, pass through unchanged.
+
+    Args:
+        text: Text containing hiragana or katakana
+        system: ``hepburn`` or ``kunrei``
+
+    Returns:
+        Romanized text
+    """
+    if system not in ("hepburn", "kunrei"):
+        raise ValueError(f"Unknown romanization system: {system}")
+    table = HIRAGANA_ROMAJI if system == "hepburn" else {**HIRAGANA_ROMAJI, **KUNREI_OVERRIDES}
+
+    text = fold_kana(text)
+    output = []
+    double_next = False
+    i = 0
+    while i < len(text):
+        syllable = table.get(text[i:i + 2])
+        if syllable is not None:
+            i += 2
+        elif text[i] == SOKUON:
+            double_next = True
+            i += 1
+            continue
+        else:
+            syllable = table.get(text[i], text[i])
+            i += 1
+
+        if double_next:
+            if syllable.startswith("ch") and system == "hepburn":
+                syllable = "t" + syllable
+            elif syllable[:1].isalpha() and syllable[:1] not in "aeioun":
+                syllable = syllable[0] + syllable
+            double_next = False
+
+        if output and output[-1] == "n" and syllable[:1] in ("a", "i", "u", "e", "o", "y"):
+            output[-1] = "n'"
+        output.append(syllable)
+
+    return "".join(output)
+
+
+def is_romaji(text: str) -> bool:
+    """True when ``text`` is lowercase ASCII that can be read as kana syllables."""
+    return bool(text) and ROMAJI_PATTERN.fullmatch(text) is not None
+
+
+def _compile_romaji_automaton() -> dict:
+    """Build a character trie over every accepted romaji spelling.
+
+    Each node maps the next letter to a child node; a node that completes a
+    spelling stores its kana under ``None``.
+    """
+    spellings = {}
+    for kana, romaji in HIRAGANA_ROMAJI.items():
+        # The first kana listed for a spelling wins: あ over ぁ, じ over ぢ
+        if kana not in (HATSUON, SOKUON):
+            spellings.setdefault(romaji, kana)
+    spellings.update(ROMAJI_INPUT_EXTRAS)
+
+    root: dict = {}
+    for romaji, kana in spellings.items():
+        node = root
+        for ch in romaji:
+            node = node.setdefault(ch, {})
+        node[None] = kana
+    return root
+
+
+_ROMAJI_AUTOMATON = _compile_romaji_automaton()
+
+
+def hiragana_to_katakana(text: str) -> str:
+    """Replace every hiragana letter with its katakana counterpart."""
+    return "".join(
+        chr(ord(ch) + _KATAKANA_OFFSET) if "ぁ" <= ch <= "ゖ" else ch
+        for ch in text
+    )
+
+
+def romaji_to_kana(text: str, katakana: bool = False) -> str:
+    """
+    Transliterate romaji into kana.
+
+    Hepburn (``shi``, ``tsu``, ``ja``), Kunrei/Nihon-shiki (``si``, ``tu``,
+    ``zya``) and keyboard spellings (``xtu``, ``nn``) are accepted, matched
+    longest first. A doubled consonant (or ``tch``) becomes っ. ``n`` becomes ん
+    before a consonant, at the end, before ``'`` or as ``nn``, and Hepburn
+    ``m`` before b/m/p (``shimbun``) is ん too. Macron and circumflex vowels
+    are long vowels (``tōkyō`` -> ``とうきょう``). Anything else is kept as is.
+
+    Args:
+        text: Romaji text
+        katakana: Produce katakana instead of hiragana
+
+    Returns:
+        Kana text
+    """
+    text = text.casefold().translate(_LONG_VOWELS)
+    output = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        following = text[i + 1:i + 2]
+
+        if ch == "n" and following not in tuple(_VOWELS) + ("y",):
+            output.append(HATSUON)
+            if following == "'":
+                i += 2
+            elif following == "n":
+                # "nn" is ん; "nni" is ん followed by に
+                after = text[i + 2:i + 3]
+                i += 1 if after and after in _VOWELS + "y" else 2
+            else:
+                i += 1
+            continue
+        if ch == "m" and following in ("b", "m", "p"):
+            output.append(HATSUON)
+            i += 1
+            continue
+        if ch.isalpha() and ch not in _VOWELS and (following == ch or text[i:i + 3] == "tch"):
+            output.append(SOKUON)
+            i += 1
+            continue
+
+        # Longest spelling starting here
+        node = _ROMAJI_AUTOMATON
+        match, length = None, 0
+        for j in range(i, len(text)):
+            node = node.get(text[j])
+            if node is None:
+                break
+            if None in node:
+                match, length = node[None], j - i + 1
+        if match is None:
+            output.append(ch)
+            i += 1
+        else:
+            output.append(match)
+            i += length
+
+    kana = "".join(output)
+    return hiragana_to_katakana(kana) if katakana else kana
+
+
+def romaji_query_to_kana(text: str) -> str:
+    """The kana spelled by a romaji query, or an empty string if it is not all romaji."""
+    kana = romaji_to_kana(text.strip())
+    return kana if kana and not any(ch.isascii() and ch.isalpha() for ch in kana) else ""
@@ -0,0 +1,155 @@
+"""
+Lexical inverted index over JLPT vocabulary entries.
+
+Answers dictionary-style lookups (食べる, たべる, "to eat") without touching the
+embedding model: exact field matches are served straight from a hash map and
+substring matches from character n-gram (Japanese) or word token (English)
+posting lists. Lexical and vector rankings are combined with reciprocal rank
+fusion when there is no exact hit.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Entries whose English gloss lists several meanings ("to eat; to drink")
+GLOSS_SEPARATORS = re.compile(r"\s*[;,/]\s*")
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+# Standard RRF damping constant; larger values flatten the rank contribution
+RRF_K = 60
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for lexical matching (NFKC, collapsed whitespace, casefolded)."""
+    text = unicodedata.normalize("NFKC", str(text))
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+def char_ngrams(text: str, n: int = 2) -> Set[str]:
+    """Character n-grams of ``text``; strings shorter than ``n`` yield themselves."""
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def word_tokens(text: str) -> List[str]:
+    """Lowercase word tokens of an English string."""
+    return WORD_PATTERN.findall(text)
+
+
+def reciprocal_rank_fusion(rankings: Iterable[List[str]], k: int = RRF_K) -> List[Tuple[str, float]]:
+    """Fuse several ranked id lists into one, best first."""
+    scores: Dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking):
+            scores[item_id] += 1.0 / (k + rank + 1)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class LexicalIndex:
+    """Inverted index over the ``Original``, ``Furigana`` and ``English`` columns.
+
+    Rows are the index rows produced by ``JLPTVocabularyRAG`` (``id``,
+    ``document`` and ``metadata``); lookups return positions into that list.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.levels = [str(row["metadata"]["jlpt_level"]) for row in rows]
+
+        self._japanese_fields: List[Tuple[str, str]] = []
+        self._english_glosses: List[List[str]] = []
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._ngrams: Dict[str, List[int]] = defaultdict(list)
+        self._tokens: Dict[str, List[int]] = defaultdict(list)
+
+        for position, row in enumerate(rows):
+            metadata = row["metadata"]
+            original = normalize_text(metadata["original"])
+            furigana = normalize_text(metadata["furigana"])
+            glosses = [g for g in GLOSS_SEPARATORS.split(normalize_text(metadata["english"])) if g]
+
+            self._japanese_fields.append((original, furigana))
+            self._english_glosses.append(glosses)
+
+            exact_keys = {original, furigana}
+            for gloss in glosses:
+                exact_keys.add(gloss)
+                # Let "eat" find "to eat" the same way a dictionary would
+                if gloss.startswith("to ") and len(gloss) > 3:
+                    exact_keys.add(gloss[3:])
+            for key in exact_keys:
+                if key:
+                    self._exact[key].append(position)
+
+            # Unigrams serve one-character queries, bigrams everything longer
+            grams: Set[str] = set()
+            for field in (original, furigana):
+                grams.update(char_ngrams(field, 1))
+                grams.update(char_ngrams(field, 2))
+            for gram in grams:
+                self._ngrams[gram].append(position)
+            for token in set(word_tokens(" ".join(glosses))):
+                self._tokens[token].append(position)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _allowed(self, positions: Iterable[int], jlpt_levels: Optional[List[str]]) -> List[int]:
+        if not jlpt_levels:
+            return list(positions)
+        levels = set(jlpt_levels)
+        return [p for p in positions if self.levels[p] in levels]
+
+    def exact(self, query: str, jlpt_levels: Optional[List[str]] = None) -> List[int]:
+        """Positions whose surface form, reading or a gloss equals the query."""
+        return self._allowed(self._exact.get(normalize_text(query), []), jlpt_levels)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> List[Tuple[int, float]]:
+        """Substring matches ranked by how much of the matched field the query covers.
+
+        Returns:
+            ``(position, score)`` pairs, best first, with scores in (0, 1]
+        """
+        query = normalize_text(query)
+        if not query:
+            return []
+
+        hits: Dict[int, float] = {}
+
+        tokens = word_tokens(query)
+        if tokens:
+            for position in self._intersect(self._tokens, tokens):
+                for gloss in self._english_glosses[position]:
+                    if query in gloss:
+                        hits[position] = max(hits.get(position, 0.0), len(query) / len(gloss))
+
+        if not query.isascii():
+            for position in self._intersect(self._ngrams, char_ngrams(query, min(len(query), 2))):
+                for field in self._japanese_fields[position]:
+                    if field and query in field:
+                        hits[position] = max(hits.get(position, 0.0), len(query) / len(field))
+
+        allowed = self._allowed(hits, jlpt_levels)
+        allowed.sort(key=lambda p: (-hits[p], len(self._japanese_fields[p][0])))
+        return [(p, hits[p]) for p in allowed[:limit]]
+
+    @staticmethod
+    def _intersect(postings: Dict[str, List[int]], keys: Iterable[str]) -> Set[int]:
+        """Positions present in every posting list for ``keys``."""
+        lists = sorted((postings.get(key, []) for key in set(keys)), key=len)
+        if not lists or not lists[0]:
+            return set()
+        result = set(lists[0])
+        for posting in lists[1:]:
+            result.intersection_update(posting)
+            if not result:
+                break
+        return result
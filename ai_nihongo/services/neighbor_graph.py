@@ -0,0 +1,117 @@
+"""
+Precomputed nearest-neighbour graph over the JLPT vocabulary.
+
+The vocabulary is static between index builds, so each entry's top-k most
+similar entries are computed once with a blocked matrix multiplication and
+stored as an int32 id matrix plus float16 scores. Similar-word lookups and
+quiz distractors then read a row of the graph instead of running a query.
+"""
+
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+class NeighborGraph:
+    """Top-k neighbours of every row, best first.
+
+    Args:
+        neighbors: ``(rows, k)`` int32 row ids
+        scores: ``(rows, k)`` float16 cosine similarities
+    """
+
+    def __init__(self, neighbors: np.ndarray, scores: np.ndarray):
+        if neighbors.shape != scores.shape:
+            raise ValueError("Neighbour ids and scores must have the same shape")
+        self.neighbors = neighbors
+        self.scores = scores
+
+    def __len__(self) -> int:
+        return len(self.neighbors)
+
+    @property
+    def k(self) -> int:
+        return self.neighbors.shape[1]
+
+    @classmethod
+    def build(cls, embeddings: np.ndarray, k: int = 16, block_rows: int = 1024) -> "NeighborGraph":
+        """
+        Compute every row's ``k`` nearest rows by cosine similarity.
+
+        Rows are processed ``block_rows`` at a time, so peak memory is one
+        ``block_rows x rows`` score block rather than the full similarity matrix.
+
+        Args:
+            embeddings: ``(rows, dimension)`` vectors
+            k: Neighbours kept per row (excluding the row itself)
+            block_rows: Rows scored per matrix multiplication
+
+        Returns:
+            The neighbour graph
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+
+        n = len(matrix)
+        k = max(0, min(k, n - 1))
+        neighbors = np.empty((n, k), dtype=np.int32)
+        scores = np.empty((n, k), dtype=np.float16)
+        if k == 0:
+            return cls(neighbors, scores)
+
+        for start in range(0, n, block_rows):
+            block = matrix[start:start + block_rows] @ matrix.T
+            rows = np.arange(len(block))
+            block[rows, start + rows] = -np.inf
+
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            neighbors[start:start + len(block)] = np.take_along_axis(top, order, axis=1)
+            scores[start:start + len(block)] = np.take_along_axis(top_scores, order, axis=1)
+
+        return cls(neighbors, scores)
+
+    def neighbors_of(self, row: int, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids and similarities of up to ``n`` nearest rows, best first."""
+        n = self.k if n is None else n
+        return self.neighbors[row, :n], self.scores[row, :n]
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> Optional["NeighborGraph"]:
+        """Read a persisted graph if it was built for the same rows and model."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                if str(data["fingerprint"]) != fingerprint:
+                    logger.info("Neighbour graph is stale, rebuilding")
+                    return None
+                return cls(data["neighbors"], data["scores"])
+        except Exception as e:
+            logger.warning(f"Could not read neighbour graph {path}: {e}")
+            return None
+
+    def save(self, path: str, fingerprint: str) -> None:
+        """Write the graph atomically so concurrent workers never read a partial file."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, fingerprint=fingerprint, neighbors=self.neighbors, scores=self.scores)
+        os.replace(tmp_path, path)
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Rows, neighbours per row and bytes held."""
+        return {
+            "rows": len(self),
+            "k": self.k,
+            "bytes": int(self.neighbors.nbytes + self.scores.nbytes)
+        }
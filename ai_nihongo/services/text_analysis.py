@@ -0,0 +1,152 @@
+"""
+Compact token and analysis records.
+
+Analyses used to hold a six-key dict of fresh strings per token, plus
+parallel ``pos_tags`` and ``pronunciations`` lists copied from the tokens.
+Here a token is a ``__slots__`` object whose part-of-speech strings are
+interned, and the parallel lists are derived on access. Both records are
+read-only mappings with the original keys, so ``token["pos"]`` and
+``analysis["pos_tags"]`` keep working; ``to_dict`` builds the plain dict
+schema where it is serialized to JSON.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+TOKEN_FIELDS = ("surface", "pos", "pos_detail", "base_form", "reading", "pronunciation")
+
+ANALYSIS_KEYS = (
+    "original_text",
+    "tokens",
+    "pos_tags",
+    "pronunciations",
+    "meanings",
+    "difficulty_level",
+    "kanji_info",
+    "grammar_patterns"
+)
+
+
+class Token(Mapping):
+    """One morpheme, readable as ``{"surface": ..., "pos": ..., ...}``.
+
+    Args:
+        surface: Text as written
+        pos: Part of speech (interned)
+        pos_detail: Part-of-speech subcategory (interned)
+        base_form: Dictionary form; defaults to ``surface``
+        reading: Kana reading
+        pronunciation: Kana pronunciation
+    """
+
+    __slots__ = TOKEN_FIELDS
+
+    def __init__(
+        self,
+        surface: str,
+        pos: str,
+        pos_detail: str = "",
+        base_form: Optional[str] = None,
+        reading: str = "",
+        pronunciation: str = ""
+    ):
+        self.surface = surface
+        self.pos = sys.intern(pos)
+        self.pos_detail = sys.intern(pos_detail)
+        self.base_form = surface if base_form is None else base_form
+        self.reading = reading
+        self.pronunciation = pronunciation
+
+    @property
+    def spoken(self) -> str:
+        """Pronunciation, else reading, else the surface form."""
+        return self.pronunciation or self.reading or self.surface
+
+    def __getitem__(self, key: str) -> str:
+        if key not in TOKEN_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(TOKEN_FIELDS)
+
+    def __len__(self) -> int:
+        return len(TOKEN_FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __reduce__(self):
+        return Token, tuple(getattr(self, field) for field in TOKEN_FIELDS)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Token as a plain dict."""
+        return {field: getattr(self, field) for field in TOKEN_FIELDS}
+
+
+class TextAnalysis(Mapping):
+    """Analysis of one text, readable with the ``analyze_text`` dict keys.
+
+    ``pos_tags`` and ``pronunciations`` are computed from the tokens when read.
+
+    Args:
+        original_text: Analyzed text
+        tokens: Tokens in order
+        difficulty_level: Estimated difficulty
+        kanji_info: Per-kanji details
+        grammar_patterns: Detected grammar pattern names
+        meanings: Token meanings, when known
+    """
+
+    __slots__ = ("original_text", "tokens", "meanings", "difficulty_level", "kanji_info", "grammar_patterns")
+
+    def __init__(
+        self,
+        original_text: str,
+        tokens: List[Token],
+        difficulty_level: str,
+        kanji_info: Optional[List[Dict[str, Any]]] = None,
+        grammar_patterns: Optional[List[str]] = None,
+        meanings: Optional[List[Any]] = None
+    ):
+        self.original_text = original_text
+        self.tokens = tokens
+        self.difficulty_level = difficulty_level
+        self.kanji_info = kanji_info if kanji_info is not None else []
+        self.grammar_patterns = grammar_patterns if grammar_patterns is not None else []
+        self.meanings = meanings if meanings is not None else []
+
+    @property
+    def pos_tags(self) -> List[str]:
+        return [token.pos for token in self.tokens]
+
+    @property
+    def pronunciations(self) -> List[str]:
+        return [token.spoken for token in self.tokens]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in ANALYSIS_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ANALYSIS_KEYS)
+
+    def __len__(self) -> int:
+        return len(ANALYSIS_KEYS)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def __reduce__(self):
+        return TextAnalysis, (
+            self.original_text, self.tokens, self.difficulty_level,
+            self.kanji_info, self.grammar_patterns, self.meanings
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Analysis in the plain dict schema, ready for JSON."""
+        result = dict(self.items())
+        result["tokens"] = [token.to_dict() for token in self.tokens]
+        return result
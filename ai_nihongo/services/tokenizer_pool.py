@@ -0,0 +1,133 @@
+"""
+Process pool of Japanese tokenizers.
+
+MeCab and SudachiPy tokenization is CPU-bound and holds the GIL, so a shared
+tagger serializes every analysis in the process. Each worker process here
+initializes its own tagger and dictionary once, and analysis requests are
+dispatched to the pool so throughput scales with cores while the event loop
+stays free.
+"""
+
+import asyncio
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .text_analysis import TextAnalysis
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# Processor owned by each worker process, created by ``_init_tokenizer_worker``
+_worker_processor = None
+
+
+def _init_tokenizer_worker(tokenizer_type: str) -> None:
+    """Initialize one tagger per worker process."""
+    global _worker_processor
+    from .japanese_processor import JapaneseProcessor
+
+    processor = JapaneseProcessor()
+    processor.tokenizer_type = tokenizer_type
+    # Workers tokenize in-process; the parent dispatches and caches
+    processor.tokenizer_pool = None
+    asyncio.run(processor.initialize())
+    _worker_processor = processor
+
+
+def _analyze_in_worker(texts: List[str]) -> List[Optional[TextAnalysis]]:
+    """Analyze one chunk of cleaned texts in a worker process; None marks a tokenizer failure."""
+    return _worker_processor._tokenize_chunk(texts)
+
+
+def _readings_in_worker(texts: List[str]) -> List[List[str]]:
+    """Token readings of one chunk of cleaned texts in a worker process."""
+    return _worker_processor._readings_chunk(texts)
+
+
+class TokenizerPool:
+    """Worker processes that each own an initialized tokenizer.
+
+    Args:
+        tokenizer_type: Tokenizer the workers load (``mecab``, ``sudachi`` or
+            anything else for the fallback analyzer)
+        workers: Number of worker processes
+    """
+
+    def __init__(self, tokenizer_type: str, workers: int):
+        self.tokenizer_type = tokenizer_type
+        self.workers = max(1, workers)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._chunks = 0
+        self._texts = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned workers load their own tagger and dictionary once
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_tokenizer_worker,
+                initargs=(self.tokenizer_type,)
+            )
+            logger.info(f"Started {self.workers} {self.tokenizer_type} tokenizer workers")
+        return self._pool
+
+    async def analyze(self, texts: List[str]) -> List[Optional[TextAnalysis]]:
+        """
+        Analyze texts in one worker.
+
+        Args:
+            texts: Cleaned Japanese texts
+
+        Returns:
+            Analysis of each text aligned with the input order, or None where
+            the worker's tokenizer failed
+        """
+        if not texts:
+            return []
+        self._chunks += 1
+        self._texts += len(texts)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), _analyze_in_worker, texts)
+
+    async def readings(self, texts: List[str]) -> List[List[str]]:
+        """
+        Token readings of texts, computed in one worker.
+
+        Args:
+            texts: Cleaned Japanese texts
+
+        Returns:
+            Kana reading of each token, per text in input order
+        """
+        if not texts:
+            return []
+        self._chunks += 1
+        self._texts += len(texts)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), _readings_in_worker, texts)
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            if sys.version_info >= (3, 9):
+                # Drop queued chunks instead of tokenizing them on the way out
+                self._pool.shutdown(wait=True, cancel_futures=True)
+            else:
+                self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return worker and dispatch counters."""
+        return {
+            "tokenizer": self.tokenizer_type,
+            "workers": self.workers,
+            "running": self._pool is not None,
+            "chunks": self._chunks,
+            "texts": self._texts
+        }
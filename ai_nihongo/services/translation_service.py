@@ -11,6 +11,8 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+from .japanese_scripts import script_profile
+
 
 class TranslationProvider(Enum):
     """Supported translation providers."""
@@ -534,22 +536,13 @@ class TranslationService:
     
     async def detect_language(self, text: str) -> str:
         """Detect the language of the text."""
-        # Simple heuristic language detection
-        japanese_chars = set('あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをん')
-        japanese_chars.update('アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン')
-        japanese_chars.update('がぎぐげござじずぜぞだぢづでどばびぶべぼぱぴぷぺぽ')
-        japanese_chars.update('ガギグゲゴザジズゼゾダヂヅデドバビブベボパピプペポ')
-        
-        # Count Japanese characters
-        japanese_count = sum(1 for char in text if char in japanese_chars)
-        total_chars = len([c for c in text if c.isalpha()])
+        # Simple heuristic language detection from per-script counts
+        profile = script_profile(text)
         
-        if total_chars == 0:
+        if profile.letters == 0:
             return "unknown"
         
-        japanese_ratio = japanese_count / total_chars
-        
-        if japanese_ratio > 0.3:  # If more than 30% are Japanese characters
+        if profile.japanese_ratio > 0.3:  # If more than 30% are Japanese characters
             return "ja"
         else:
             return "en"  # Default to English for non-Japanese text
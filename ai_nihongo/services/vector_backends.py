@@ -0,0 +1,613 @@
+"""
+Pluggable nearest-neighbour search backends for the JLPT vocabulary index.
+
+Every backend answers queries in the same shape as a ChromaDB query response
+(``ids``, ``metadatas``, ``documents`` and ``distances``, one list per query)
+so ``JLPTVocabularyRAG`` can format results identically whichever is active.
+"""
+
+import hashlib
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+class SearchBackend(ABC):
+    """Base class for vocabulary search backends."""
+
+    name = "base"
+
+    @abstractmethod
+    def query(
+        self,
+        query_embeddings: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        """Return the ``n_results`` nearest entries for each query embedding."""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of indexed entries."""
+        pass
+
+    def memory_report(self) -> Optional[Dict[str, Any]]:
+        """Return index memory usage, or None if the backend manages its own storage."""
+        return None
+
+
+class ChromaSearchBackend(SearchBackend):
+    """Search backend that delegates to a ChromaDB collection."""
+
+    name = "chroma"
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    @staticmethod
+    def level_filter(jlpt_levels: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """Build the Chroma where clause for a JLPT level filter."""
+        if not jlpt_levels:
+            return None
+        return {"jlpt_level": {"$in": jlpt_levels}}
+
+    def query(
+        self,
+        query_embeddings: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        return self.collection.query(
+            query_embeddings=np.asarray(query_embeddings).tolist(),
+            n_results=n_results,
+            where=self.level_filter(jlpt_levels)
+        )
+
+    def count(self) -> int:
+        return self.collection.count()
+
+
+class NumpySearchBackend(SearchBackend):
+    """Exact in-memory cosine search over a level-partitioned float32 matrix.
+
+    Rows are stored grouped by JLPT level, so a level filter is a contiguous
+    slice of the matrix and a query is one matrix product plus ``argpartition``.
+    Distances are reported as ``1 - cosine similarity``.
+    """
+
+    name = "numpy"
+
+    def __init__(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+        documents: List[str]
+    ):
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        levels = [str(metadata["jlpt_level"]) for metadata in metadatas]
+        order = sorted(range(len(ids)), key=lambda i: levels[i])
+
+        self.ids = [ids[i] for i in order]
+        self.metadatas = [metadatas[i] for i in order]
+        self.documents = [documents[i] for i in order]
+        self.matrix = self._normalize(embeddings[order]) if order else embeddings.reshape(0, 0)
+
+        self.level_slices: Dict[str, slice] = {}
+        start = 0
+        for i in range(1, len(order) + 1):
+            if i == len(order) or levels[order[i]] != levels[order[start]]:
+                self.level_slices[levels[order[start]]] = slice(start, i)
+                start = i
+
+    @classmethod
+    def from_collection(cls, collection, **kwargs) -> "NumpySearchBackend":
+        """Load every vector and its metadata out of a ChromaDB collection."""
+        data = collection.get(include=["embeddings", "metadatas", "documents"])
+        backend = cls(data["ids"], data["embeddings"], data["metadatas"], data["documents"], **kwargs)
+        logger.info(f"Loaded {backend.count()} vectors into the in-memory search backend")
+        return backend
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize rows, leaving zero vectors untouched."""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (vectors / norms).astype(np.float32, copy=False)
+
+    def _candidate_rows(self, jlpt_levels: Optional[List[str]]) -> Optional[np.ndarray]:
+        """Row indices allowed by the level filter, or None for all rows."""
+        if not jlpt_levels:
+            return None
+
+        slices = sorted(
+            (self.level_slices[level] for level in set(jlpt_levels) if level in self.level_slices),
+            key=lambda s: s.start
+        )
+        if not slices:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(s.start, s.stop) for s in slices])
+
+    @staticmethod
+    def _select(matrix: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Rows of ``matrix`` allowed by the filter; a view when they are contiguous."""
+        if rows is None:
+            return matrix
+        if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+            # A single level (or adjacent levels) is a view, not a copy
+            return matrix[rows[0]:rows[-1] + 1]
+        return matrix[rows]
+
+    def _scores(self, queries: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Cosine similarity of each query against the candidate rows."""
+        return queries @ self._select(self.matrix, rows).T
+
+    def _top_k(
+        self,
+        queries: np.ndarray,
+        rows: Optional[np.ndarray],
+        k: int
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Best ``k`` row positions and their similarities for each query, best first."""
+        scores = self._scores(queries, rows)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+        results = []
+        for q in range(len(queries)):
+            ranked = top[q][np.argsort(-scores[q, top[q]])]
+            positions = ranked if rows is None else rows[ranked]
+            results.append((positions, scores[q, ranked]))
+        return results
+
+    def query(
+        self,
+        query_embeddings: np.ndarray,
+        n_results: int,
+        jlpt_levels: Optional[List[str]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        queries = self._normalize(np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32)))
+        rows = self._candidate_rows(jlpt_levels)
+        n_candidates = self.count() if rows is None else len(rows)
+        k = min(n_results, n_candidates)
+
+        response: Dict[str, List[List[Any]]] = {"ids": [], "metadatas": [], "documents": [], "distances": []}
+        if k <= 0:
+            for key in response:
+                response[key] = [[] for _ in range(len(queries))]
+            return response
+
+        for positions, similarities in self._top_k(queries, rows, k):
+            response["ids"].append([self.ids[p] for p in positions])
+            response["metadatas"].append([self.metadatas[p] for p in positions])
+            response["documents"].append([self.documents[p] for p in positions])
+            response["distances"].append((1.0 - similarities).tolist())
+
+        return response
+
+    def count(self) -> int:
+        return len(self.ids)
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Bytes held by the search index compared with plain float32 vectors."""
+        full_bytes = int(self.matrix.size) * 4
+        return {
+            "compression": "none",
+            "dimension": int(self.matrix.shape[1]),
+            "float32_bytes": full_bytes,
+            "index_bytes": int(self.matrix.nbytes),
+            "saved_bytes": 0,
+            "compression_ratio": 1.0
+        }
+
+    @staticmethod
+    def _recall(found: List[np.ndarray], exact: List[Tuple[np.ndarray, np.ndarray]]) -> float:
+        """Fraction of the exact top-k positions present in ``found``, over all queries."""
+        total = sum(len(truth) for truth, _ in exact)
+        hits = sum(len(set(f.tolist()) & set(truth.tolist())) for f, (truth, _) in zip(found, exact))
+        return round(hits / total, 4) if total else 1.0
+
+    def recall_at_k(self, query_embeddings: np.ndarray, k: int = 10) -> Dict[str, Any]:
+        """
+        Compare results with exact float32 search over the same vectors.
+
+        Args:
+            query_embeddings: Sample queries to evaluate
+            k: Result list length
+
+        Returns:
+            Mean recall@k of this backend's ranking
+        """
+        queries = self._normalize(np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32)))
+        k = min(k, self.count())
+        if k <= 0 or not len(queries):
+            return {"k": k, "queries": 0, "recall_at_k": None}
+
+        exact = NumpySearchBackend._top_k(self, queries, None, k)
+        found = [positions for positions, _ in self._top_k(queries, None, k)]
+        return {"k": k, "queries": len(queries), "recall_at_k": self._recall(found, exact)}
+
+
+class CompressedNumpySearchBackend(NumpySearchBackend):
+    """Two-pass search: compressed vectors generate candidates, float32 re-ranks them.
+
+    ``compression`` is ``int8`` (per-dimension symmetric quantization) or
+    ``pca`` (projection onto the top principal components). The top
+    ``n_results * rerank_factor`` candidates are re-scored with the exact
+    float32 vectors, which can live in a memory-mapped ``.npy`` file so only
+    the compressed index stays resident.
+
+    Each row shrinks 4x with int8 and ``dimension / components`` with PCA, but
+    the index also holds a fixed per-dimension scale (int8) or the mean and
+    projection matrix (PCA), so the overall ratio only approaches the per-row
+    ratio as the corpus grows; ``memory_report`` gives both. Without explicit
+    ``pca_components``, PCA keeps as many components as still fit a 4x
+    overall saving, at most a quarter of the dimension.
+    """
+
+    name = "numpy-compressed"
+
+    COMPRESSIONS = ("int8", "pca")
+
+    # Rows scored per block when dequantizing, bounding the float32 temporary
+    SCORE_BLOCK_ROWS = 16384
+
+    def __init__(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+        documents: List[str],
+        compression: str = "int8",
+        rerank_factor: int = 10,
+        pca_components: int = 0,
+        rerank_store: Optional[str] = None
+    ):
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unknown vector compression: {compression}")
+
+        super().__init__(ids, embeddings, metadatas, documents)
+        self.compression = compression
+        self.rerank_factor = max(1, int(rerank_factor))
+        full = self.matrix
+
+        if compression == "int8":
+            # Per-dimension scale so every dimension uses the full int8 range
+            scale = np.abs(full).max(axis=0) if len(full) else np.ones(full.shape[1], dtype=np.float32)
+            scale[scale == 0] = 1.0
+            self.scale = (scale / 127.0).astype(np.float32)
+            self.codes = np.clip(np.rint(full / self.scale), -127, 127).astype(np.int8)
+        else:
+            dimension = full.shape[1]
+            n_components = pca_components or self._default_pca_components(len(full), dimension)
+            n_components = min(n_components, dimension, max(1, len(full)))
+            self.mean = full.mean(axis=0).astype(np.float32) if len(full) else np.zeros(dimension, dtype=np.float32)
+            _, _, vt = np.linalg.svd(full - self.mean, full_matrices=False)
+            self.components = np.ascontiguousarray(vt[:n_components], dtype=np.float32)
+            self.codes = ((full - self.mean) @ self.components.T).astype(np.float32)
+
+        # Keep exact vectors on disk and page in only the rows being re-ranked
+        self.rerank_store = rerank_store
+        self.matrix = self._store_full_vectors(full, rerank_store) if rerank_store else full
+
+        report = self.memory_report()
+        logger.info(
+            f"Compressed {self.count()} vectors with {compression}: "
+            f"{report['index_bytes']} bytes resident vs {report['float32_bytes']} "
+            f"({report['compression_ratio']}x smaller, {report['row_compression_ratio']}x per row)"
+        )
+
+    @staticmethod
+    def _default_pca_components(rows: int, dimension: int) -> int:
+        """Components for a 4x overall saving once the projection is counted.
+
+        The index costs ``4 * (c * (rows + dimension) + dimension)`` bytes
+        against ``4 * rows * dimension`` for the float32 vectors.
+        """
+        budget = (rows * dimension / 4 - dimension) / (rows + dimension)
+        return max(1, min(dimension // 4, int(budget)))
+
+    @staticmethod
+    def _store_full_vectors(full: np.ndarray, path: str) -> np.ndarray:
+        """Write the float32 vectors to ``path`` atomically and memory-map them back."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, full)
+        os.replace(tmp_path, path)
+        return np.load(path, mmap_mode="r")
+
+    def _approximate_scores(self, queries: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Similarity estimates from the compressed vectors (rank-preserving per query)."""
+        codes = self._select(self.codes, rows)
+
+        if self.compression == "pca":
+            # q . x ~= q . mean + (q C^T) . z, and q . mean is the same for every row
+            return (queries @ self.components.T) @ codes.T
+
+        scaled = queries * self.scale
+        scores = np.empty((len(queries), len(codes)), dtype=np.float32)
+        for start in range(0, len(codes), self.SCORE_BLOCK_ROWS):
+            block = codes[start:start + self.SCORE_BLOCK_ROWS]
+            scores[:, start:start + len(block)] = scaled @ block.T.astype(np.float32)
+        return scores
+
+    def _candidates(self, queries: np.ndarray, rows: Optional[np.ndarray], k: int) -> List[np.ndarray]:
+        """Top ``k`` row positions per query by approximate score, unordered."""
+        scores = self._approximate_scores(queries, rows)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        return [top[q] if rows is None else rows[top[q]] for q in range(len(queries))]
+
+    def _top_k(
+        self,
+        queries: np.ndarray,
+        rows: Optional[np.ndarray],
+        k: int
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        n_candidates = self.count() if rows is None else len(rows)
+        candidates = self._candidates(queries, rows, min(k * self.rerank_factor, n_candidates))
+
+        results = []
+        for q, positions in enumerate(candidates):
+            positions = np.sort(positions)  # Sequential reads from the memory map
+            exact = np.asarray(self.matrix[positions]) @ queries[q]
+            best = np.argsort(-exact)[:k]
+            results.append((positions[best], exact[best]))
+        return results
+
+    def memory_report(self) -> Dict[str, Any]:
+        full_bytes = self.count() * int(self.matrix.shape[1]) * 4
+        code_bytes = int(self.codes.nbytes)
+        if self.compression == "int8":
+            overhead_bytes = int(self.scale.nbytes)
+        else:
+            overhead_bytes = int(self.mean.nbytes + self.components.nbytes)
+        index_bytes = code_bytes + overhead_bytes
+        if not self.rerank_store:
+            # Re-rank vectors held in memory count against the savings
+            index_bytes += full_bytes
+
+        return {
+            "compression": self.compression,
+            "dimension": int(self.matrix.shape[1]),
+            "index_dimension": int(self.codes.shape[1]),
+            "rerank_factor": self.rerank_factor,
+            "rerank_vectors": "mmap" if self.rerank_store else "memory",
+            "float32_bytes": full_bytes,
+            "index_bytes": index_bytes,
+            "overhead_bytes": overhead_bytes,
+            "saved_bytes": full_bytes - index_bytes,
+            "compression_ratio": round(full_bytes / index_bytes, 2) if index_bytes else 1.0,
+            # Ratio per row, which compression_ratio approaches on large corpora
+            "row_compression_ratio": round(full_bytes / code_bytes, 2) if code_bytes else 1.0
+        }
+
+    def recall_at_k(self, query_embeddings: np.ndarray, k: int = 10) -> Dict[str, Any]:
+        report = super().recall_at_k(query_embeddings, k)
+        if report["queries"]:
+            queries = self._normalize(np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32)))
+            report["candidate_recall_at_k"] = self._recall(
+                self._candidates(queries, None, report["k"]),
+                NumpySearchBackend._top_k(self, queries, None, report["k"])
+            )
+        else:
+            report["candidate_recall_at_k"] = None
+        return report
+
+
+def spherical_kmeans(
+    vectors: np.ndarray,
+    n_clusters: int,
+    iterations: int = 10,
+    seed: int = 0,
+    max_train: int = 256
+) -> np.ndarray:
+    """
+    Cluster unit vectors by cosine similarity.
+
+    Args:
+        vectors: L2-normalized rows
+        n_clusters: Number of centroids
+        iterations: Lloyd iterations
+        seed: Random seed, so rebuilding an unchanged index gives the same lists
+        max_train: Training sample size per centroid
+
+    Returns:
+        ``(n_clusters, dimension)`` unit centroids
+    """
+    rng = np.random.default_rng(seed)
+    n_clusters = max(1, min(n_clusters, len(vectors)))
+    train = vectors
+    if len(vectors) > n_clusters * max_train:
+        train = vectors[np.sort(rng.choice(len(vectors), n_clusters * max_train, replace=False))]
+
+    centroids = np.array(train[rng.choice(len(train), n_clusters, replace=False)], dtype=np.float32)
+    for _ in range(iterations):
+        assignment = np.argmax(train @ centroids.T, axis=1)
+
+        # Sum members per cluster with one sort + reduceat (much faster than np.add.at)
+        order = np.argsort(assignment, kind="stable")
+        clusters, starts = np.unique(assignment[order], return_index=True)
+        sums = np.zeros_like(centroids)
+        sums[clusters] = np.add.reduceat(train[order], starts)
+        counts = np.bincount(assignment, minlength=n_clusters)
+
+        # Reseed empty clusters from random points rather than dropping them
+        empty = counts == 0
+        if empty.any():
+            sums[empty] = train[rng.choice(len(train), int(empty.sum()))]
+        centroids = NumpySearchBackend._normalize(sums)
+
+    return centroids
+
+
+class IVFSearchBackend(NumpySearchBackend):
+    """Inverted-file ANN index with per-level k-means centroids.
+
+    Each JLPT level is clustered on its own, so every inverted list holds a
+    single level and a level filter simply restricts which centroids are
+    probed. Rows are stored grouped by list, making a list a contiguous slice
+    of the matrix. A query scores the allowed centroids, scans the closest
+    ``nprobe`` lists per searched level exactly, and widens the probe if they
+    hold fewer than ``n_results`` rows. Centroids and list layout can be persisted to
+    ``index_path`` and are reused while the vectors are unchanged.
+    """
+
+    name = "ivf"
+
+    # Rows assigned to centroids per block when building lists
+    ASSIGN_BLOCK_ROWS = 65536
+
+    def __init__(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+        documents: List[str],
+        nlist: int = 0,
+        nprobe: int = 8,
+        index_path: Optional[str] = None
+    ):
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        super().__init__(ids, embeddings, metadatas, documents)
+        self.nprobe = max(1, int(nprobe))
+        self.index_path = index_path
+
+        fingerprint = self._fingerprint(ids, embeddings, nlist)
+        layout = self._load_layout(index_path, fingerprint) if index_path else None
+        if layout is None:
+            layout = self._train(nlist)
+            if index_path:
+                self._save_layout(index_path, fingerprint, layout)
+        else:
+            logger.info(f"Loaded IVF index layout from {index_path}")
+
+        permutation, self.centroids, self.list_offsets = layout
+        self.ids = [self.ids[i] for i in permutation]
+        self.metadatas = [self.metadatas[i] for i in permutation]
+        self.documents = [self.documents[i] for i in permutation]
+        self.matrix = self.matrix[permutation]
+
+        # Level of each list, so the probe budget can scale with the levels searched
+        level_starts = sorted(level_slice.start for level_slice in self.level_slices.values())
+        self.list_levels = np.searchsorted(level_starts, self.list_offsets[:-1], side="right") - 1
+
+        logger.info(f"IVF index over {self.count()} vectors with {len(self.centroids)} lists, nprobe={self.nprobe}")
+
+    @staticmethod
+    def _fingerprint(ids: List[str], embeddings: np.ndarray, nlist: int) -> str:
+        """Identify the exact vectors and settings a layout was trained for."""
+        digest = hashlib.sha1(f"{nlist}:{embeddings.shape}".encode("utf-8"))
+        digest.update("\x1f".join(ids).encode("utf-8"))
+        digest.update(np.ascontiguousarray(embeddings).tobytes())
+        return digest.hexdigest()
+
+    def _train(self, nlist: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Cluster each level and order its rows by inverted list."""
+        total = self.count()
+        permutation, centroids, offsets = [], [], [0]
+
+        for level, level_slice in self.level_slices.items():
+            vectors = self.matrix[level_slice]
+            if nlist:
+                n_clusters = max(1, round(nlist * len(vectors) / total))
+            else:
+                n_clusters = max(1, round(np.sqrt(len(vectors))))
+            level_centroids = spherical_kmeans(vectors, n_clusters)
+
+            assignment = np.empty(len(vectors), dtype=np.int64)
+            for start in range(0, len(vectors), self.ASSIGN_BLOCK_ROWS):
+                block = vectors[start:start + self.ASSIGN_BLOCK_ROWS]
+                assignment[start:start + len(block)] = np.argmax(block @ level_centroids.T, axis=1)
+
+            permutation.append(level_slice.start + np.argsort(assignment, kind="stable"))
+            centroids.append(level_centroids)
+            counts = np.bincount(assignment, minlength=len(level_centroids))
+            offsets.extend((offsets[-1] + np.cumsum(counts)).tolist())
+
+        if not permutation:
+            return np.empty(0, dtype=np.int64), np.empty((0, self.matrix.shape[1]), dtype=np.float32), np.zeros(1, dtype=np.int64)
+        return np.concatenate(permutation), np.vstack(centroids), np.asarray(offsets, dtype=np.int64)
+
+    @staticmethod
+    def _load_layout(path: str, fingerprint: str) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Read a persisted layout if it was trained for the same vectors."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                if str(data["fingerprint"]) != fingerprint:
+                    logger.info("IVF index layout is stale, retraining")
+                    return None
+                return data["permutation"], data["centroids"], data["list_offsets"]
+        except Exception as e:
+            logger.warning(f"Could not read IVF index layout {path}: {e}")
+            return None
+
+    @staticmethod
+    def _save_layout(path: str, fingerprint: str, layout: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        """Write the layout atomically so concurrent workers never read a partial file."""
+        permutation, centroids, offsets = layout
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, fingerprint=fingerprint, permutation=permutation, centroids=centroids, list_offsets=offsets)
+        os.replace(tmp_path, path)
+
+    def _allowed_lists(self, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Inverted lists inside the filtered rows; lists never span two levels."""
+        list_starts = self.list_offsets[:-1]
+        if rows is None:
+            return np.arange(len(list_starts))
+
+        # Rows are a concatenation of contiguous level slices
+        breaks = np.flatnonzero(np.diff(rows) != 1)
+        run_starts = rows[np.r_[0, breaks + 1]]
+        run_ends = rows[np.r_[breaks, len(rows) - 1]] + 1
+        lo = np.searchsorted(list_starts, run_starts)
+        hi = np.searchsorted(list_starts, run_ends)
+        return np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)])
+
+    def _top_k(
+        self,
+        queries: np.ndarray,
+        rows: Optional[np.ndarray],
+        k: int
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        lists = self._allowed_lists(rows)
+        sizes = self.list_offsets[lists + 1] - self.list_offsets[lists]
+        centroid_scores = queries @ self.centroids[lists].T
+        n_levels = len(np.unique(self.list_levels[lists]))
+
+        results = []
+        for q in range(len(queries)):
+            probe_order = np.argsort(-centroid_scores[q])
+            # Probe nprobe lists per level, then keep going until there are k candidates
+            covered = np.cumsum(sizes[probe_order])
+            n_probe = max(self.nprobe * n_levels, int(np.searchsorted(covered, k)) + 1)
+            probed = lists[probe_order[:n_probe]]
+
+            # Score each list through a view of its slice instead of gathering rows
+            bounds = [(self.list_offsets[i], self.list_offsets[i + 1]) for i in np.sort(probed)]
+            candidates = np.concatenate([np.arange(start, stop) for start, stop in bounds])
+            scores = np.concatenate([self.matrix[start:stop] @ queries[q] for start, stop in bounds])
+            best = np.argsort(-scores)[:k]
+            results.append((candidates[best], scores[best]))
+        return results
+
+    def memory_report(self) -> Dict[str, Any]:
+        report = super().memory_report()
+        report.update({
+            "index_bytes": int(self.matrix.nbytes + self.centroids.nbytes + self.list_offsets.nbytes),
+            "lists": len(self.centroids),
+            "nprobe": self.nprobe
+        })
+        report["saved_bytes"] = report["float32_bytes"] - report["index_bytes"]
+        report["compression_ratio"] = round(report["float32_bytes"] / report["index_bytes"], 2) if report["index_bytes"] else 1.0
+        return report
@@ -0,0 +1,184 @@
+"""
+Pandas-free columnar store for the JLPT vocabulary dataset.
+
+Columns are parallel lists of interned strings plus a compact per-row level
+code. Per-level row offsets and aggregate counts are computed once at load
+time, so listing a level is O(limit), random sampling is O(count) and
+statistics are O(1).
+"""
+
+import csv
+import mmap
+import random
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Optional
+
+REQUIRED_COLUMNS = ("Original", "Furigana", "English", "JLPT Level")
+
+# Binary layout: magic, row/level counts, newline-joined level names, one level
+# code byte per row, then each string column as uint32 offsets + UTF-8 blob
+BINARY_MAGIC = b"JLPTVOC1"
+
+
+def level_rank(level: str) -> int:
+    """Numeric JLPT level (N5 -> 5) so the easiest level sorts highest."""
+    digits = "".join(ch for ch in str(level) if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+class VocabularyStore:
+    """Columnar, read-only vocabulary table with per-level indexes."""
+
+    def __init__(
+        self,
+        original: List[str],
+        furigana: List[str],
+        english: List[str],
+        levels: List[str]
+    ):
+        if not len(original) == len(furigana) == len(english) == len(levels):
+            raise ValueError("All vocabulary columns must have the same length")
+
+        self.original = [sys.intern(value) for value in original]
+        self.furigana = [sys.intern(value) for value in furigana]
+        self.english = [sys.intern(value) for value in english]
+
+        self.level_names: List[str] = sorted({sys.intern(level) for level in levels})
+        codes = {level: code for code, level in enumerate(self.level_names)}
+        self.level_codes = array("B", (codes[level] for level in levels))
+
+        # Row ids per level, in dataset order
+        self.level_rows: Dict[str, array] = {level: array("i") for level in self.level_names}
+        for row_id, level in enumerate(levels):
+            self.level_rows[level].append(row_id)
+
+        total = len(self.original)
+        self._statistics = {
+            'total_vocabulary': total,
+            'levels': {
+                level: {
+                    'count': len(rows),
+                    'percentage': round(len(rows) / total * 100, 2)
+                }
+                for level, rows in self.level_rows.items()
+            }
+        }
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> "VocabularyStore":
+        """Load the dataset CSV, skipping rows with missing values."""
+        columns: Dict[str, List[str]] = {name: [] for name in REQUIRED_COLUMNS}
+
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            missing = [name for name in REQUIRED_COLUMNS if name not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"Vocabulary CSV is missing columns: {missing}")
+
+            for record in reader:
+                values = [(record.get(name) or "").strip() for name in REQUIRED_COLUMNS]
+                if all(values):
+                    for name, value in zip(REQUIRED_COLUMNS, values):
+                        columns[name].append(value)
+
+        return cls(
+            columns["Original"],
+            columns["Furigana"],
+            columns["English"],
+            columns["JLPT Level"]
+        )
+
+    def save(self, path: str) -> None:
+        """Write the store in its compact binary format."""
+        levels_blob = "\n".join(self.level_names).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(BINARY_MAGIC)
+            f.write(struct.pack("<III", len(self), len(self.level_names), len(levels_blob)))
+            f.write(levels_blob)
+            f.write(self.level_codes.tobytes())
+
+            for column in (self.original, self.furigana, self.english):
+                encoded = [value.encode("utf-8") for value in column]
+                offsets = array("I", [0])
+                for value in encoded:
+                    offsets.append(offsets[-1] + len(value))
+                if sys.byteorder != "little":
+                    offsets.byteswap()
+                f.write(offsets.tobytes())
+                f.write(b"".join(encoded))
+
+    @classmethod
+    def load(cls, path: str) -> "VocabularyStore":
+        """Load a store written by ``save`` through a read-only memory map."""
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+                raise ValueError(f"{path} is not a vocabulary store file")
+
+            pos = len(BINARY_MAGIC)
+            n_rows, _, levels_len = struct.unpack_from("<III", mm, pos)
+            pos += 12
+            level_names = mm[pos:pos + levels_len].decode("utf-8").split("\n")
+            pos += levels_len
+            codes = mm[pos:pos + n_rows]
+            pos += n_rows
+
+            columns = []
+            for _ in range(3):
+                offsets = array("I")
+                offsets.frombytes(mm[pos:pos + 4 * (n_rows + 1)])
+                if sys.byteorder != "little":
+                    offsets.byteswap()
+                pos += 4 * (n_rows + 1)
+                blob = mm[pos:pos + offsets[-1]]
+                pos += offsets[-1]
+                columns.append([blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n_rows)])
+
+        levels = [level_names[code] for code in codes]
+        return cls(columns[0], columns[1], columns[2], levels)
+
+    def __len__(self) -> int:
+        return len(self.original)
+
+    def level(self, row_id: int) -> str:
+        """Return the JLPT level of a row."""
+        return self.level_names[self.level_codes[row_id]]
+
+    def entry(self, row_id: int) -> Dict[str, Any]:
+        """Return one row in the public vocabulary dict format."""
+        return {
+            'original': self.original[row_id],
+            'furigana': self.furigana[row_id],
+            'english': self.english[row_id],
+            'jlpt_level': self.level(row_id)
+        }
+
+    def entries_for_level(self, jlpt_level: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return the first ``limit`` entries of a level."""
+        rows = self.level_rows.get(jlpt_level)
+        if rows is None:
+            return []
+        return [self.entry(row_id) for row_id in rows[:limit]]
+
+    def sample_rows(self, jlpt_level: Optional[str] = None, count: int = 5) -> List[int]:
+        """Return up to ``count`` distinct random row ids, optionally from one level."""
+        if jlpt_level:
+            rows = self.level_rows.get(jlpt_level)
+            if not rows:
+                return []
+            return [rows[i] for i in random.sample(range(len(rows)), min(count, len(rows)))]
+
+        return random.sample(range(len(self)), min(count, len(self)))
+
+    def sample(self, jlpt_level: Optional[str] = None, count: int = 5) -> List[Dict[str, Any]]:
+        """Return up to ``count`` distinct random entries, optionally from one level."""
+        return [self.entry(row_id) for row_id in self.sample_rows(jlpt_level, count)]
+
+    def statistics(self) -> Dict[str, Any]:
+        """Return precomputed level counts and percentages."""
+        return {
+            'total_vocabulary': self._statistics['total_vocabulary'],
+            'levels': {level: dict(stats) for level, stats in self._statistics['levels'].items()}
+        }
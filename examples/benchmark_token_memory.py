@@ -0,0 +1,96 @@
+"""Memory benchmark: slotted analysis records vs. the plain dict schema.
+
+Analyzes a corpus of sentences with the configured tokenizer and keeps every
+analysis alive, once as ``TextAnalysis``/``Token`` records and once
+materialized to plain dicts (the previous representation). Each variant runs
+in its own process so the peak RSS figures don't overlap.
+
+    python examples/benchmark_token_memory.py --sentences 20000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from ai_nihongo.services.japanese_processor import JapaneseProcessor
+
+SENTENCES = [
+    "私は毎朝七時に起きて、コーヒーを飲みます。",
+    "昨日、友達と一緒に新しいレストランへ行きました。",
+    "日本語の勉強は難しいですが、とても面白いです。",
+    "電車が遅れたので、会議に間に合いませんでした。",
+    "週末は天気が良ければ、山に登るつもりです。",
+]
+
+
+def corpus(count: int):
+    # Distinct texts, so no analysis is shared through the cache
+    return [f"{SENTENCES[i % len(SENTENCES)]}（{i}）" for i in range(count)]
+
+
+def measure(variant: str, count: int) -> dict:
+    processor = JapaneseProcessor()
+    processor.analysis_cache.maxsize = 0
+    texts = corpus(count)
+
+    async def analyze():
+        return await processor.analyze_batch(texts)
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    analyses = asyncio.run(analyze())
+    if variant == "dict":
+        analyses = [analysis.to_dict() for analysis in analyses]
+    seconds = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    processor.close()
+
+    return {
+        "variant": variant,
+        "analyses": len(analyses),
+        "tokens": sum(len(analysis["tokens"]) for analysis in analyses),
+        "retained_mb": round(current / 2**20, 2),
+        "peak_traced_mb": round(peak / 2**20, 2),
+        # ru_maxrss is kilobytes on Linux
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "seconds": round(seconds, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=20000)
+    parser.add_argument("--variant", choices=["slots", "dict"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(measure(args.variant, args.sentences)))
+        return
+
+    results = {}
+    for variant in ("dict", "slots"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--variant", variant, "--sentences", str(args.sentences)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results[variant] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'variant':<8}{'tokens':>10}{'retained MB':>14}{'peak MB':>10}{'max RSS MB':>13}{'seconds':>10}")
+    for result in results.values():
+        print(f"{result['variant']:<8}{result['tokens']:>10}{result['retained_mb']:>14}"
+              f"{result['peak_traced_mb']:>10}{result['max_rss_mb']:>13}{result['seconds']:>10}")
+    saved = 1 - results["slots"]["retained_mb"] / max(results["dict"]["retained_mb"], 1e-9)
+    print(f"\nRetained memory saved by slotted records: {saved:.0%}")
+
+
+if __name__ == "__main__":
+    main()
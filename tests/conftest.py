@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 from ai_nihongo.core.agent import AIAgent
 from ai_nihongo.core.config import Settings
+from ai_nihongo.services.text_analysis import TextAnalysis, Token
 
 
 @pytest.fixture
@@ -34,25 +35,20 @@ def mock_japanese_processor():
     """Mock Japanese processor for testing."""
     mock = AsyncMock()
     mock.initialize.return_value = None
-    mock.analyze_text.return_value = {
-        "original_text": "こんにちは",
-        "tokens": [
-            {
-                "surface": "こんにちは",
-                "pos": "感動詞",
-                "pos_detail": "",
-                "base_form": "こんにちは",
-                "reading": "コンニチハ",
-                "pronunciation": "コンニチワ"
-            }
+    mock.analyze_text.return_value = TextAnalysis(
+        original_text="こんにちは",
+        tokens=[
+            Token(
+                surface="こんにちは",
+                pos="感動詞",
+                pos_detail="",
+                base_form="こんにちは",
+                reading="コンニチハ",
+                pronunciation="コンニチワ"
+            )
         ],
-        "pos_tags": ["感動詞"],
-        "pronunciations": ["コンニチワ"],
-        "meanings": [],
-        "difficulty_level": "beginner",
-        "kanji_info": [],
-        "grammar_patterns": []
-    }
+        difficulty_level="beginner"
+    )
     return mock
 
 
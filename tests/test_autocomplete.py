@@ -0,0 +1,64 @@
+"""Tests for prefix autocomplete."""
+
+from ai_nihongo.services.autocomplete import PrefixIndex
+
+ENTRIES = [
+    ("食べる", "たべる", "to eat", "N5"),
+    ("食べ物", "たべもの", "food", "N5"),
+    ("建物", "たてもの", "building", "N4"),
+    ("食堂", "しょくどう", "dining hall", "N4"),
+    ("体力", "たいりょく", "physical strength", "N1"),
+    ("テレビ", "テレビ", "television", "N5"),
+    ("手紙", "てがみ", "letter", "N5"),
+    ("経済", "けいざい", "economy; economics", "N3"),
+]
+
+
+def make_rows():
+    return [
+        {"id": f"jlpt_{i}", "document": "",
+         "metadata": {"original": o, "furigana": f, "english": e, "jlpt_level": level}}
+        for i, (o, f, e, level) in enumerate(ENTRIES)
+    ]
+
+
+def test_reading_prefix_ranks_easiest_level_first():
+    index = PrefixIndex(make_rows())
+
+    results = index.complete("た")
+
+    assert [position for position, _ in results] == [0, 1, 2, 4]
+
+
+def test_surface_and_english_prefixes():
+    index = PrefixIndex(make_rows())
+
+    assert index.complete("食") == [(0, "食べる"), (1, "食べ物"), (3, "食堂")]
+    assert index.complete("eco") == [(7, "economy")]
+    assert index.complete("ea") == [(0, "eat")]
+
+
+def test_katakana_and_hiragana_are_interchangeable():
+    index = PrefixIndex(make_rows())
+
+    assert index.complete("てれ") == [(5, "てれび")]
+    assert [position for position, _ in index.complete("タベ")] == [0, 1]
+
+
+def test_romaji_prefix_completes_kana():
+    index = PrefixIndex(make_rows())
+
+    assert [position for position, _ in index.complete("tabe")] == [0, 1]
+    # "tab" has not finished its second syllable yet
+    assert [position for position, _ in index.complete("tab")] == [0, 1, 2, 4]
+    assert index.complete("tere") == [(5, "てれび")]
+
+
+def test_limit_dedupes_entries_and_level_filter():
+    index = PrefixIndex(make_rows())
+
+    # テレビ matches through both its surface form and reading
+    assert index.complete("て", limit=2) == [(6, "てがみ"), (5, "てれび")]
+    assert index.complete("た", jlpt_levels=["N1"]) == [(4, "たいりょく")]
+    assert index.complete("zzz") == []
+    assert index.complete("") == []
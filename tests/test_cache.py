@@ -0,0 +1,94 @@
+"""Tests for the in-process LRU cache."""
+
+from unittest.mock import patch
+
+from ai_nihongo.core.cache import LRUCache, approximate_size
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted."""
+        cache = LRUCache(maxsize=4)
+        cache.set("水", 1)
+
+        assert cache.get("水") == 1
+        assert cache.get("火") is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = LRUCache(maxsize=2, ttl=10)
+        with patch("ai_nihongo.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("ai_nihongo.core.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+        with patch("ai_nihongo.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+
+        assert cache.stats()["expirations"] == 1
+        assert len(cache) == 0
+
+    def test_zero_size_disables_cache(self):
+        """Test that a zero-sized cache never stores entries."""
+        cache = LRUCache(maxsize=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Test that entries are evicted once the byte budget is exceeded."""
+        cache = LRUCache(maxsize=10, max_bytes=10, sizeof=len)
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+        cache.get("a")
+        cache.set("c", "xxxx")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "xxxx"
+        assert cache.bytes == 8
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_values_are_not_stored(self):
+        """Test that a value larger than the whole budget is skipped."""
+        cache = LRUCache(maxsize=10, max_bytes=4, sizeof=len)
+        cache.set("a", "xx")
+        cache.set("b", "xxxxxxxx")
+
+        assert cache.get("a") == "xx"
+        assert cache.get("b") is None
+        assert cache.bytes == 2
+
+    def test_replacing_a_value_updates_its_size(self):
+        """Test that overwriting a key does not leak its old size."""
+        cache = LRUCache(maxsize=10, max_bytes=100, sizeof=len)
+        cache.set("a", "xxxxxxxx")
+        cache.set("a", "xx")
+
+        assert cache.bytes == 2
+        assert len(cache) == 1
+
+
+def test_approximate_size_counts_nested_values():
+    small = approximate_size({"tokens": []})
+    large = approximate_size({"tokens": [{"surface": "日本語" * 10} for _ in range(10)]})
+
+    assert large > small > 0
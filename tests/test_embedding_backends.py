@@ -0,0 +1,43 @@
+"""Tests for the dependency-free hashing embedding backend."""
+
+import numpy as np
+import pytest
+
+from ai_nihongo.services.embedding_backends import (
+    HashingNgramEmbedder,
+    create_embedding_backend,
+    load_embedding_backend,
+)
+
+
+class TestHashingNgramEmbedder:
+    """Test cases for HashingNgramEmbedder."""
+
+    def test_vectors_are_deterministic_and_normalized(self):
+        embedder = HashingNgramEmbedder(dimension=128)
+
+        first = embedder.encode(["食べる", "to eat"])
+        second = HashingNgramEmbedder(dimension=128).encode(["食べる", "to eat"])
+
+        assert first.shape == (2, 128)
+        np.testing.assert_array_equal(first, second)
+        np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+
+    def test_shared_ngrams_score_higher(self):
+        embedder = HashingNgramEmbedder()
+        query, related, unrelated = embedder.encode(["たべる", "食べる (たべる) to eat", "学校 (がっこう) school"])
+
+        assert query @ related > query @ unrelated
+
+    def test_save_and_load(self, tmp_path):
+        embedder = create_embedding_backend("hashing", hashing_dimension=64)
+        embedder.save(str(tmp_path))
+
+        loaded = load_embedding_backend(str(tmp_path))
+
+        assert isinstance(loaded, HashingNgramEmbedder)
+        assert loaded.model_name == embedder.model_name
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_embedding_backend("word2vec")
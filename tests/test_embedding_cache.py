@@ -0,0 +1,93 @@
+"""Tests for the persistent embedding cache."""
+
+import numpy as np
+import pytest
+
+from ai_nihongo.services.embedding_cache import EmbeddingCache
+
+
+def vectors(count, dimension=4, start=0):
+    return np.arange(start, start + count * dimension, dtype=np.float32).reshape(count, dimension)
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    def test_round_trip_and_duplicate_texts(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path), "model-a")
+
+        assert cache.put_many(["水", "火", "水"], vectors(3)) == 2
+        assert cache.put_many(["火"], vectors(1, start=100)) == 0
+
+        water, fire, earth = cache.get_many(["水", "火", "土"])
+        np.testing.assert_array_equal(water, vectors(3)[0])
+        np.testing.assert_array_equal(fire, vectors(3)[1])
+        assert earth is None
+        assert (tmp_path / "model-a.f32").stat().st_size == 2 * 4 * 4
+
+    def test_second_instance_sees_appended_rows(self, tmp_path):
+        writer = EmbeddingCache(str(tmp_path), "model-a")
+        writer.put_many(["水"], vectors(1))
+        reader = EmbeddingCache(str(tmp_path), "model-a")
+
+        writer.put_many(["火"], vectors(1, start=10))
+
+        # Nothing is re-read until the next lookup refreshes the tail
+        assert len(reader) == 1
+        fire = reader.get_many(["火"])[0]
+        np.testing.assert_array_equal(fire, vectors(1, start=10)[0])
+        assert len(reader) == 2
+
+    def test_partial_key_line_is_ignored_until_complete(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path), "model-a")
+        cache.put_many(["水"], vectors(1))
+        key = EmbeddingCache.text_key("火")
+        with open(tmp_path / "model-a.f32", "ab") as f:
+            f.write(vectors(1, start=10).tobytes())
+        with open(tmp_path / "model-a.keys", "a", encoding="ascii") as f:
+            f.write(key[:10])
+
+        assert cache.get_many(["火"]) == [None]
+
+        with open(tmp_path / "model-a.keys", "a", encoding="ascii") as f:
+            f.write(key[10:] + "\n")
+        np.testing.assert_array_equal(cache.get_many(["火"])[0], vectors(1, start=10)[0])
+
+    def test_torn_trailing_vector_is_truncated(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path), "model-a")
+        cache.put_many(["水"], vectors(1))
+        # A writer died after its vector bytes but before its key line
+        with open(tmp_path / "model-a.f32", "ab") as f:
+            f.write(vectors(1, start=50).tobytes()[:10])
+
+        assert cache.put_many(["火"], vectors(1, start=10)) == 1
+
+        assert (tmp_path / "model-a.f32").stat().st_size == 2 * 4 * 4
+        fresh = EmbeddingCache(str(tmp_path), "model-a")
+        water, fire = fresh.get_many(["水", "火"])
+        np.testing.assert_array_equal(water, vectors(1)[0])
+        np.testing.assert_array_equal(fire, vectors(1, start=10)[0])
+
+    def test_dimension_mismatch_is_rejected(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path), "model-a")
+        cache.put_many(["水"], vectors(1, dimension=4))
+
+        with pytest.raises(ValueError, match="dimension"):
+            cache.put_many(["火"], vectors(1, dimension=8))
+        with pytest.raises(ValueError, match="dimension"):
+            EmbeddingCache(str(tmp_path), "model-a").put_many(["火"], vectors(1, dimension=8))
+
+    def test_models_do_not_share_vectors(self, tmp_path):
+        EmbeddingCache(str(tmp_path), "model-a").put_many(["水"], vectors(1))
+
+        assert EmbeddingCache(str(tmp_path), "model-b").get_many(["水"]) == [None]
+
+    def test_other_model_with_the_same_slug_is_not_served(self, tmp_path):
+        EmbeddingCache(str(tmp_path), "org/model").put_many(["水"], vectors(1))
+
+        cache = EmbeddingCache(str(tmp_path), "org_model")
+
+        assert cache.disabled
+        assert cache.get_many(["水"]) == [None]
+        assert cache.put_many(["火"], vectors(1)) == 0
+        assert len(EmbeddingCache(str(tmp_path), "org/model")) == 1
@@ -0,0 +1,52 @@
+"""Tests for the micro-batching embedding executor."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from ai_nihongo.services.embedding_executor import EmbeddingExecutor
+
+
+def fake_encode(calls):
+    def encode(texts):
+        calls.append(list(texts))
+        return np.array([[len(text), ord(text[0])] for text in texts], dtype=np.float32)
+    return encode
+
+
+class TestEmbeddingExecutor:
+    """Test cases for EmbeddingExecutor."""
+
+    def test_results_follow_request_order(self):
+        calls = []
+        executor = EmbeddingExecutor(fake_encode(calls))
+
+        result = executor.encode_sync(["bb", "a", "bb"])
+
+        np.testing.assert_array_equal(result[:, 0], [2, 1, 2])
+        assert calls == [["bb", "a"]]
+        executor.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self):
+        calls = []
+        executor = EmbeddingExecutor(fake_encode(calls), batch_window=0.05)
+
+        results = await asyncio.gather(*(executor.encode_async([f"q{i}"]) for i in range(10)))
+
+        assert [int(r[0, 0]) for r in results] == [len(f"q{i}") for i in range(10)]
+        assert len(calls) == 1
+        assert executor.stats()["requests"] == 10
+        executor.close()
+
+    @pytest.mark.asyncio
+    async def test_encode_errors_reach_every_caller(self):
+        def failing(texts):
+            raise RuntimeError("model unavailable")
+
+        executor = EmbeddingExecutor(failing)
+
+        with pytest.raises(RuntimeError):
+            await executor.encode_async(["x"])
+        executor.close()
@@ -0,0 +1,113 @@
+"""Tests for federated retrieval across JLPT corpora."""
+
+import numpy as np
+import pytest
+
+from ai_nihongo.services.federated_retrieval import (
+    DEFAULT_QUOTAS, Corpus, DocumentCorpus, FederatedRetriever, fit_quotas, kanji_records
+)
+from ai_nihongo.services.japanese_scripts import is_kanji
+from ai_nihongo.services.vocabulary_store import VocabularyStore
+
+
+class StaticCorpus(Corpus):
+    def __init__(self, name, scores):
+        self.name = name
+        self.scores = scores
+
+    def search(self, query, query_embedding, n_results, jlpt_levels=None):
+        return [{'text': f"{self.name}{i}", 'similarity_score': s} for i, s in enumerate(self.scores[:n_results])]
+
+
+async def encode_query(query):
+    return np.zeros(4, dtype=np.float32)
+
+
+class TestFederatedRetriever:
+    """Test cases for FederatedRetriever merging."""
+
+    @pytest.mark.asyncio
+    async def test_quotas_reserve_slots_for_each_corpus(self):
+        retriever = FederatedRetriever(
+            [StaticCorpus("vocabulary", [0.9, 0.8, 0.7, 0.6]), StaticCorpus("kanji", [0.2, 0.1])],
+            encode_query,
+            quotas={"vocabulary": 2, "kanji": 1}
+        )
+
+        results = await retriever.search("水", n_results=4)
+
+        assert [r['corpus'] for r in results].count("kanji") >= 1
+        assert len(results) == 4
+        assert all(0.0 <= r['normalized_score'] <= 1.0 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_default_quotas_fit_n_results(self):
+        corpora = [StaticCorpus(name, [0.9 - i / 10 for i in range(8)]) for name in DEFAULT_QUOTAS]
+        retriever = FederatedRetriever(corpora, encode_query)
+
+        results = await retriever.search("水", n_results=8)
+
+        counts = {name: [r['corpus'] for r in results].count(name) for name in DEFAULT_QUOTAS}
+        assert len(results) == 8
+        assert counts == {"vocabulary": 3, "kanji": 2, "grammar": 2, "examples": 1}
+
+    @pytest.mark.asyncio
+    async def test_failing_corpus_is_skipped(self):
+        class Broken(Corpus):
+            name = "grammar"
+
+            def search(self, *args, **kwargs):
+                raise RuntimeError("index unavailable")
+
+        retriever = FederatedRetriever([StaticCorpus("vocabulary", [0.5]), Broken()], encode_query)
+
+        results = await retriever.search("test", n_results=3)
+
+        assert [r['corpus'] for r in results] == ["vocabulary"]
+
+
+def test_fit_quotas():
+    assert fit_quotas({"vocabulary": 4, "kanji": 2}, 8) == {"vocabulary": 4, "kanji": 2}
+    assert fit_quotas(DEFAULT_QUOTAS, 5) == {"vocabulary": 2, "kanji": 1, "grammar": 1, "examples": 1}
+    assert sum(fit_quotas(DEFAULT_QUOTAS, 3).values()) == 3
+
+
+def test_kanji_records_use_easiest_level():
+    store = VocabularyStore(
+        ["水", "海水浴", "山"],
+        ["みず", "かいすいよく", "やま"],
+        ["water", "sea bathing", "mountain"],
+        ["N5", "N2", "N5"]
+    )
+
+    records = {record['kanji']: record for record in kanji_records(store)}
+
+    assert is_kanji("水") and not is_kanji("み")
+    assert records["水"]['jlpt_level'] == "N5"
+    assert records["水"]['word_count'] == 2
+    assert records["海"]['jlpt_level'] == "N2"
+
+
+def test_document_corpus_persists_its_vectors(tmp_path):
+    encoded = []
+
+    def encode_documents(texts):
+        encoded.append(len(texts))
+        return np.eye(len(texts), 4, dtype=np.float32)
+
+    records = [{'kanji': "水", 'jlpt_level': "N5"}, {'kanji': "山", 'jlpt_level': "N5"}]
+    path = str(tmp_path / "kanji.npz")
+
+    def corpus(model_name="model-a", text=lambda record: record['kanji']):
+        return DocumentCorpus("kanji", records, text, encode_documents, model_name, path)
+
+    corpus().build_index()
+    reloaded = corpus()
+    reloaded.build_index()
+    assert encoded == [2]
+    assert reloaded.search("水", np.eye(1, 4, dtype=np.float32)[0], 1)[0]['kanji'] == "水"
+
+    # Another model or different embedded texts invalidate the stored vectors
+    corpus(model_name="model-b").build_index()
+    corpus(text=lambda record: f"Kanji: {record['kanji']}").build_index()
+    assert encoded == [2, 2, 2]
@@ -0,0 +1,89 @@
+"""Tests for field-specific vectors and script-based query routing."""
+
+from ai_nihongo.services.embedding_backends import HashingNgramEmbedder
+from ai_nihongo.services.field_index import FieldVectorIndex, route_query
+
+ENTRIES = [
+    ("水", "みず", "water", "N5"),
+    ("山", "やま", "mountain", "N5"),
+    ("ありがとう", "ありがとう", "thank you", "N5"),
+    ("海水浴", "かいすいよく", "sea bathing", "N2"),
+    ("テレビ", "テレビ", "television", "N5"),
+]
+
+
+def make_rows():
+    return [
+        {
+            "id": f"jlpt_{i}",
+            "document": f"Japanese: {original} Reading: {furigana} English: {english} Level: {level}",
+            "metadata": {"original": original, "furigana": furigana, "english": english,
+                         "jlpt_level": level, "row_id": i},
+        }
+        for i, (original, furigana, english, level) in enumerate(ENTRIES)
+    ]
+
+
+class CountingEncoder:
+    def __init__(self):
+        self.embedder = HashingNgramEmbedder(dimension=256)
+        self.texts = []
+
+    def __call__(self, texts):
+        self.texts.extend(texts)
+        return self.embedder.encode(texts)
+
+
+def test_route_query_by_script():
+    assert route_query("みず") == ("surface", "reading")
+    assert route_query("海水") == ("surface", "reading")
+    assert route_query("ｶﾀｶﾅ") == ("surface", "reading")
+    assert route_query("water") == ("english",)
+    assert route_query("water 水") == ("surface", "reading", "english")
+    assert route_query("123") == ("surface", "reading", "english")
+
+
+def test_kana_readings_are_stored_once():
+    index = FieldVectorIndex(make_rows(), CountingEncoder())
+
+    assert index.backends["surface"].count() == 5
+    assert index.backends["english"].count() == 5
+    # ありがとう and テレビ are their own readings
+    assert index.backends["reading"].count() == 3
+
+
+def test_queries_use_their_fields():
+    encoder = CountingEncoder()
+    index = FieldVectorIndex(make_rows(), encoder)
+    queries = ["water", "やま", "sea bathing"]
+
+    results = index.query(queries, encoder.embedder.encode(queries), n_results=1)
+
+    assert [ids[0] for ids in results["ids"]] == ["jlpt_0", "jlpt_1", "jlpt_3"]
+    assert results["distances"][1][0] < 1e-5
+
+
+def test_level_filter_applies_to_every_field():
+    encoder = CountingEncoder()
+    index = FieldVectorIndex(make_rows(), encoder)
+
+    results = index.query(["みず"], encoder.embedder.encode(["みず"]), n_results=5, jlpt_levels=["N2"])
+
+    assert results["ids"] == [["jlpt_3"]]
+
+
+def test_vectors_are_persisted_and_reused(tmp_path):
+    path = str(tmp_path / "fields.npz")
+    first = CountingEncoder()
+    FieldVectorIndex(make_rows(), first, model_name="hashing", index_path=path)
+    assert first.texts
+
+    second = CountingEncoder()
+    FieldVectorIndex(make_rows(), second, model_name="hashing", index_path=path)
+    assert second.texts == []
+
+    rows = make_rows()
+    rows[0]["metadata"]["english"] = "cold water"
+    third = CountingEncoder()
+    FieldVectorIndex(rows, third, model_name="hashing", index_path=path)
+    assert third.texts
@@ -0,0 +1,65 @@
+"""Tests for the typo-tolerant reading index."""
+
+from ai_nihongo.services.fuzzy_index import FuzzyReadingIndex, SymSpellIndex, edit_distance, romaji_key
+
+ENTRIES = [
+    ("食べる", "たべる", "to eat", "N5"),
+    ("飲む", "のむ", "to drink", "N5"),
+    ("コーヒー", "コーヒー", "coffee", "N5"),
+    ("東京", "とうきょう", "Tokyo", "N5"),
+    ("建物", "たてもの", "building", "N4"),
+]
+
+
+def make_rows():
+    return [
+        {"id": f"jlpt_{i}", "document": "",
+         "metadata": {"original": o, "furigana": f, "english": e, "jlpt_level": level}}
+        for i, (o, f, e, level) in enumerate(ENTRIES)
+    ]
+
+
+def test_edit_distance_counts_transpositions():
+    assert edit_distance("たべる", "たべる", 2) == 0
+    assert edit_distance("たべる", "たべろ", 2) == 1
+    assert edit_distance("taberu", "tabreu", 2) == 1
+    assert edit_distance("abc", "wxyz", 2) == 3
+
+
+def test_symspell_finds_keys_within_distance():
+    index = SymSpellIndex(max_distance=2)
+    for position, key in enumerate(["taberu", "nomu", "tatemono"]):
+        index.add(key, position)
+
+    assert index.lookup("tabera") == [("taberu", 1)]
+    assert index.lookup("tatemno", 1) == [("tatemono", 1)]
+    assert index.lookup("xyz") == []
+
+
+def test_romaji_key_folds_long_vowels():
+    assert romaji_key("toukyou") == romaji_key("Tōkyō") == romaji_key("tokyo") == "tokyo"
+
+
+def test_kana_typos():
+    index = FuzzyReadingIndex(make_rows())
+
+    assert index.lookup("たべろ") == [(0, 1)]
+    assert index.lookup("コーピー") == [(2, 1)]
+
+
+def test_romaji_readings():
+    index = FuzzyReadingIndex(make_rows())
+
+    assert index.lookup("taberu") == [(0, 0)]
+    assert index.lookup("tabera") == [(0, 1)]
+    assert index.lookup("tokyo") == [(3, 0)]
+    # English words are not romaji and are left to vector search
+    assert index.lookup("water") == []
+
+
+def test_short_queries_and_level_filter():
+    index = FuzzyReadingIndex(make_rows())
+
+    # Two kana allow no edits
+    assert index.lookup("のま") == []
+    assert index.lookup("たべろ", jlpt_levels=["N4"]) == []
@@ -0,0 +1,143 @@
+"""Tests for the Japanese text processor."""
+
+import asyncio
+import threading
+
+from ai_nihongo.services.japanese_processor import JapaneseProcessor
+from ai_nihongo.services.tokenizer_pool import TokenizerPool
+
+
+def make_processor():
+    processor = JapaneseProcessor()
+    processor.tokenizer_type = "fallback"
+    return processor
+
+
+def test_repeated_text_is_served_from_cache(monkeypatch):
+    processor = make_processor()
+    calls = []
+    analyze = processor._analyze_fallback
+
+    def counting(text):
+        calls.append(text)
+        return analyze(text)
+
+    monkeypatch.setattr(processor, "_analyze_fallback", counting)
+
+    async def run():
+        first = await processor.analyze_text("おはよう ございます")
+        second = await processor.analyze_text("  おはよう   ございます ")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert calls == ["おはよう ございます"]
+    stats = processor.cache_stats()
+    assert stats["hits"] == 1
+    assert stats["bytes"] > 0
+
+
+def test_cache_key_includes_dictionary_version():
+    processor = make_processor()
+
+    async def run():
+        first = await processor.analyze_text("水")
+        processor.dictionary_version = "other"
+        second = await processor.analyze_text("水")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is not second
+    assert first == second
+
+
+def test_batch_results_follow_input_order():
+    processor = make_processor()
+    texts = ["水", "hello", "", "山です", "水"] * 7
+
+    results = asyncio.run(processor.analyze_batch(texts))
+
+    assert [r["original_text"] for r in results] == [
+        processor._clean_text(t) if processor._contains_japanese(t) else t for t in texts
+    ]
+
+
+def test_stream_accepts_async_iterables_and_bounds_read_ahead():
+    processor = make_processor()
+    consumed = []
+
+    async def texts():
+        for i in range(100):
+            consumed.append(i)
+            yield f"文{i}"
+
+    async def run():
+        stream = processor.analyze_stream(texts(), chunk_size=5, max_in_flight=2)
+        first = await stream.__anext__()
+        read_ahead = len(consumed)
+        rest = [analysis async for analysis in stream]
+        return first, read_ahead, rest
+
+    first, read_ahead, rest = asyncio.run(run())
+
+    assert first["original_text"] == "文0"
+    assert read_ahead <= 10
+    assert [r["original_text"] for r in rest] == [f"文{i}" for i in range(1, 100)]
+
+
+def test_tokenizer_failures_fall_back_without_caching(monkeypatch):
+    processor = make_processor()
+    monkeypatch.setattr(processor, "_tokenize_chunk", lambda texts: [None] * len(texts))
+
+    analysis = asyncio.run(processor.analyze_text("水"))
+
+    assert analysis["tokens"][0]["surface"] == "水"
+    assert len(processor.analysis_cache) == 0
+
+
+def test_tokenizer_pool_matches_in_process_analysis():
+    processor = make_processor()
+    processor.tokenizer_pool = TokenizerPool("fallback", workers=2)
+    texts = [f"日本語の文{i}です" for i in range(40)]
+
+    try:
+        pooled = asyncio.run(processor.analyze_batch(texts))
+    finally:
+        processor.close()
+
+    expected = asyncio.run(make_processor().analyze_batch(texts))
+    assert pooled == expected
+    assert processor.pool_stats()["texts"] == 40
+
+
+def test_romanize_batch_reads_off_the_event_loop(monkeypatch):
+    processor = make_processor()
+    threads = []
+    token_readings = processor._token_readings
+
+    def recording(text):
+        threads.append(threading.current_thread())
+        return token_readings(text)
+
+    monkeypatch.setattr(processor, "_token_readings", recording)
+
+    romanized = asyncio.run(processor.romanize_batch(["すし", "カメラ"]))
+    processor.close()
+
+    assert romanized == ["sushi", "kamera"]
+    assert threads and threading.main_thread() not in threads
+
+
+def test_romanize_batch_uses_the_tokenizer_pool():
+    processor = make_processor()
+    processor.tokenizer_pool = TokenizerPool("fallback", workers=1)
+
+    try:
+        romanized = asyncio.run(processor.romanize_batch(["すし", "カメラ"]))
+    finally:
+        processor.close()
+
+    assert romanized == ["sushi", "kamera"]
+    assert processor.pool_stats()["texts"] == 2
@@ -0,0 +1,44 @@
+"""Tests for shared script classification."""
+
+from ai_nihongo.services.japanese_scripts import (
+    HIRAGANA, KANJI, KATAKANA, LATIN, MARK, OTHER, SPACE,
+    classify, classify_text, contains_japanese, contains_kanji, is_japanese, is_kanji, script_profile
+)
+
+
+def test_classify_characters():
+    assert classify("あ") == HIRAGANA
+    assert classify("ア") == KATAKANA
+    assert classify("ｱ") == KATAKANA
+    assert classify("ー") == KATAKANA
+    assert classify("水") == KANJI
+    assert classify("㐀") == KANJI
+    assert classify("𠮷") == KANJI
+    assert classify("々") == MARK
+    assert classify("a") == LATIN
+    assert classify(" ") == SPACE
+    assert classify("。") == OTHER
+    assert classify("\U0010fffd") == OTHER
+
+
+def test_predicates():
+    assert is_kanji("水") and not is_kanji("み") and not is_kanji("々")
+    assert is_japanese("々") and not is_japanese("a")
+    assert contains_japanese("I like すし") and not contains_japanese("sushi")
+    assert contains_kanji("日本語を") and not contains_kanji("にほんご")
+
+
+def test_profile_counts_every_script_in_one_pass():
+    text = "人々は東京へ行く。Tokyo 2024"
+
+    profile = script_profile(text)
+
+    assert len(classify_text(text)) == len(text)
+    assert (profile.hiragana, profile.katakana, profile.kanji, profile.marks) == (3, 0, 4, 1)
+    assert profile.latin == 5
+    assert profile.digits == 4
+    assert profile.spaces == 1
+    assert profile.letters == sum(1 for ch in text if ch.isalpha())
+    assert profile.kanji_chars() == ["人", "東", "京", "行"]
+    assert profile.kanji_positions() == [0, 3, 4, 6]
+    assert profile.kanji_ratio == 4 / (len(text) - 1)
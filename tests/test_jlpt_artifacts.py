@@ -0,0 +1,94 @@
+"""Tests for offline JLPT artifact bundles."""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from ai_nihongo.services import jlpt_artifacts, jlpt_rag_service
+from ai_nihongo.services.embedding_backends import HashingNgramEmbedder
+from ai_nihongo.services.jlpt_artifacts import build_artifact_bundle, load_artifact_bundle
+from ai_nihongo.services.vocabulary_store import VocabularyStore
+
+
+@pytest.fixture
+def vocabulary():
+    return VocabularyStore(
+        ["食べる", "飲む", "経済"], ["たべる", "のむ", "けいざい"],
+        ["to eat", "to drink", "economy"], ["N5", "N5", "N3"]
+    )
+
+
+@pytest.fixture
+def bundle_path(tmp_path, vocabulary):
+    model = HashingNgramEmbedder(dimension=32)
+    embeddings = model.encode(vocabulary.english)
+    return build_artifact_bundle(vocabulary, embeddings, model, model.model_name, str(tmp_path), version="test")
+
+
+def test_build_and_load_round_trip(bundle_path, vocabulary):
+    bundle = load_artifact_bundle(str(bundle_path), verify=True)
+
+    assert bundle_path.name == "jlpt-test"
+    assert bundle.version == "test"
+    assert bundle.model_name == "hashing-ngram-1-3-d32"
+    assert bundle.manifest["entries"] == 3
+    assert bundle.vocabulary.entry(2) == vocabulary.entry(2)
+    assert bundle.embeddings.shape == (3, 32)
+    assert (bundle.model_path / HashingNgramEmbedder.CONFIG_FILE).is_file()
+
+
+def test_build_rejects_misaligned_vectors(tmp_path, vocabulary):
+    with pytest.raises(ValueError):
+        build_artifact_bundle(vocabulary, np.zeros((2, 4), dtype=np.float32), None, "m", str(tmp_path))
+
+
+def test_checksum_mismatch_is_caught_by_verify(bundle_path):
+    # Same size, different content: only the checksum pass notices
+    embeddings_path = bundle_path / jlpt_artifacts.EMBEDDINGS_FILE
+    data = bytearray(embeddings_path.read_bytes())
+    data[-1] ^= 0xFF
+    embeddings_path.write_bytes(bytes(data))
+
+    load_artifact_bundle(str(bundle_path))
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        load_artifact_bundle(str(bundle_path), verify=True)
+
+
+def test_default_load_skips_hashing(bundle_path, monkeypatch):
+    def fail(path):
+        raise AssertionError(f"hashed {path}")
+
+    monkeypatch.setattr(jlpt_artifacts, "_sha256_file", fail)
+
+    assert load_artifact_bundle(str(bundle_path)).version == "test"
+
+
+def test_size_mismatch_fails_without_verify(bundle_path):
+    vocabulary_path = bundle_path / jlpt_artifacts.VOCABULARY_FILE
+    vocabulary_path.write_bytes(vocabulary_path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError, match="Size mismatch"):
+        load_artifact_bundle(str(bundle_path))
+
+
+def test_unsupported_format_version(bundle_path):
+    manifest_path = bundle_path / jlpt_artifacts.MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["format"] = jlpt_artifacts.BUNDLE_FORMAT + 1
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unsupported artifact bundle format"):
+        load_artifact_bundle(str(bundle_path))
+
+
+def test_bundle_start_does_not_fill_the_collection(bundle_path, tmp_path):
+    rag = jlpt_rag_service.JLPTVocabularyRAG(
+        data_dir=str(tmp_path / "data"), embedding_cache_dir="", search_backend="numpy",
+        artifact_path=str(bundle_path), field_vectors=False
+    )
+    asyncio.run(rag.initialize())
+
+    assert rag.collection.count() == 0
+    assert rag.search_vocabulary("economics", n_results=1)[0]["original"] == "経済"
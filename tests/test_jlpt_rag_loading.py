@@ -0,0 +1,105 @@
+"""Tests for loading the shared JLPT RAG instance."""
+
+import asyncio
+import time
+
+import pytest
+
+from ai_nihongo.services import jlpt_rag_service
+
+
+class _Builds(list):
+    """Built instances, plus queued build errors in ``failures``."""
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Replace the real build with a slow fake; returns the list of built instances."""
+    built = _Builds()
+    failures = []
+
+    def fake_build():
+        time.sleep(0.05)
+        if failures:
+            raise RuntimeError(failures.pop())
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setattr(jlpt_rag_service, "_build_jlpt_rag", fake_build)
+    monkeypatch.setattr(jlpt_rag_service, "_jlpt_rag_instance", None)
+    monkeypatch.setattr(jlpt_rag_service, "_jlpt_rag_warmup_task", None)
+    monkeypatch.setattr(jlpt_rag_service, "_jlpt_rag_status", {
+        'state': 'idle', 'started_at': None, 'finished_at': None,
+        'load_seconds': None, 'attempts': 0, 'error': None
+    })
+    built.failures = failures
+    return built
+
+
+def test_concurrent_callers_share_one_build(builds):
+    async def run():
+        jlpt_rag_service.start_jlpt_rag_warmup()
+        return await asyncio.gather(
+            *(jlpt_rag_service.get_jlpt_rag() for _ in range(5)),
+            jlpt_rag_service.start_jlpt_rag_warmup()
+        )
+
+    results = asyncio.run(run())
+
+    assert len(builds) == 1
+    assert all(result is builds[0] for result in results)
+
+
+def test_status_moves_from_idle_to_loading_to_ready(builds):
+    assert jlpt_rag_service.get_jlpt_rag_status()['state'] == 'idle'
+
+    async def run():
+        task = jlpt_rag_service.start_jlpt_rag_warmup()
+        await asyncio.sleep(0.01)
+        loading = jlpt_rag_service.get_jlpt_rag_status()
+        await task
+        return loading
+
+    loading = asyncio.run(run())
+    ready = jlpt_rag_service.get_jlpt_rag_status()
+
+    assert loading['state'] == 'loading'
+    assert ready['state'] == 'ready'
+    assert ready['attempts'] == 1
+    assert ready['load_seconds'] is not None
+    assert jlpt_rag_service.get_jlpt_rag_if_ready() is builds[0]
+
+
+def test_failed_warmup_is_retried(builds):
+    builds.failures.append("download failed")
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await jlpt_rag_service.start_jlpt_rag_warmup()
+        failed = jlpt_rag_service.get_jlpt_rag_status()
+        rag = await jlpt_rag_service.start_jlpt_rag_warmup()
+        return failed, rag
+
+    failed, rag = asyncio.run(run())
+
+    assert failed['state'] == 'failed'
+    assert failed['error'] == "download failed"
+    assert rag is builds[0]
+    status = jlpt_rag_service.get_jlpt_rag_status()
+    assert status['state'] == 'ready' and status['attempts'] == 2 and status['error'] is None
+
+
+def test_zero_timeout_waits_when_no_warmup_is_running(builds):
+    rag = asyncio.run(jlpt_rag_service.get_jlpt_rag(timeout=0))
+
+    assert rag is builds[0]
+
+
+def test_zero_timeout_skips_a_warmup_in_flight(builds):
+    async def run():
+        task = jlpt_rag_service.start_jlpt_rag_warmup()
+        with pytest.raises(asyncio.TimeoutError):
+            await jlpt_rag_service.get_jlpt_rag(timeout=0)
+        return await task
+
+    assert asyncio.run(run()) is builds[0]
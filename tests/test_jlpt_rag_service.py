@@ -0,0 +1,209 @@
+"""Tests for the JLPT vocabulary RAG service, run on a small CSV with hashing embeddings."""
+
+import asyncio
+import csv
+import threading
+import time
+
+import pytest
+
+from ai_nihongo.services import jlpt_rag_service
+from ai_nihongo.services.jlpt_rag_service import JLPTVocabularyRAG
+
+ENTRIES = [
+    ("食べる", "たべる", "to eat", "N5"),
+    ("水", "みず", "water", "N5"),
+    ("峰", "みね", "peak; summit", "N1"),
+    ("果て", "はて", "the end; the limit", "N1"),
+    ("鉱山", "こうざん", "mine (e.g. coal mine)", "N2"),
+    ("憎む", "にくむ", "to hate", "N2"),
+    ("鮫", "さめ", "shark", "N1"),
+    ("テレビ", "テレビ", "television", "N5"),
+]
+
+
+def write_dataset(directory, entries):
+    with open(directory / "jlpt_vocab.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Original", "Furigana", "English", "JLPT Level"])
+        writer.writerows(entries)
+
+
+@pytest.fixture
+def dataset_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "dataset"
+    directory.mkdir()
+    write_dataset(directory, ENTRIES)
+    monkeypatch.setattr(jlpt_rag_service.kagglehub, "dataset_download", lambda name: str(directory))
+    return directory
+
+
+def make_rag(tmp_path, **options):
+    options = {
+        "embedding_cache_dir": "",
+        "embedding_backend": "hashing",
+        "search_backend": "numpy",
+        "field_vectors": False,
+        **options,
+    }
+    rag = JLPTVocabularyRAG(data_dir=str(tmp_path / "data"), **options)
+    asyncio.run(rag.initialize())
+    return rag
+
+
+def originals(results):
+    return [result["original"] for result in results]
+
+
+def test_romaji_queries_find_kana_spellings(tmp_path, dataset_dir):
+    rag = make_rag(tmp_path)
+
+    assert originals(rag.search_vocabulary("taberu", 3))[0] == "食べる"
+    assert originals(rag.search_vocabulary("terebi", 3))[0] == "テレビ"
+
+
+@pytest.mark.parametrize("query, english_match, romaji_match", [
+    ("mine", "鉱山", "峰"),
+    ("hate", "憎む", "果て"),
+])
+def test_english_words_that_spell_romaji_stay_english(tmp_path, dataset_dir, query, english_match, romaji_match):
+    rag = make_rag(tmp_path)
+
+    results = rag.search_vocabulary(query, 4)
+    found = originals(results)
+
+    assert found[0] == english_match
+    if romaji_match in found:
+        romaji_result = results[found.index(romaji_match)]
+        assert found.index(romaji_match) > found.index(english_match)
+        assert romaji_result["similarity_score"] <= results[0]["similarity_score"]
+
+
+def test_batch_search_ranks_english_above_romaji(tmp_path, dataset_dir):
+    rag = make_rag(tmp_path)
+
+    results = rag.search_vocabulary_batch(["mine", "taberu"], 3)
+
+    assert originals(results[0])[0] == "鉱山"
+    assert originals(results[1])[0] == "食べる"
+
+
+def test_async_batch_runs_one_vector_query(tmp_path, dataset_dir):
+    rag = make_rag(tmp_path)
+    queries = ["drinking water", "summit", "taberu", "shark fin"]
+    expected = rag.search_vocabulary_batch(queries, 3)
+
+    calls = []
+    query = rag.search_backend.query
+
+    def counting(embeddings, *args):
+        calls.append(len(embeddings))
+        return query(embeddings, *args)
+
+    rag.search_backend.query = counting
+    results = asyncio.run(rag.search_vocabulary_batch_async(queries, 3))
+
+    assert [originals(r) for r in results] == [originals(r) for r in expected]
+    assert len(calls) == 1 and calls[0] == 2
+
+
+def test_async_search_queries_the_index_off_the_event_loop(tmp_path, dataset_dir):
+    rag = make_rag(tmp_path)
+    expected = rag.search_vocabulary("drinking water", 3)
+    threads = []
+    query = rag.search_backend.query
+
+    def recording(*args):
+        threads.append(threading.current_thread())
+        return query(*args)
+
+    rag.search_backend.query = recording
+    results = asyncio.run(rag.search_vocabulary_async("drinking water", 3))
+
+    assert originals(results) == originals(expected)
+    assert threads and threading.main_thread() not in threads
+
+
+def test_sync_applies_only_edited_rows(tmp_path, dataset_dir):
+    rag = make_rag(tmp_path)
+    assert rag.collection.count() == len(ENTRIES)
+    assert asyncio.run(rag._sync_vector_index(rag.index_rows)) == {"embedded": 0, "relabeled": 0, "deleted": 0}
+
+    # Re-gloss 水, drop 鮫 and insert 猫 at the top: the five other entries
+    # before 鮫 move down one row, while テレビ keeps its row id
+    edited = [("猫", "ねこ", "cat", "N5")] + [
+        (original, furigana, "drinking water" if original == "水" else english, level)
+        for original, furigana, english, level in ENTRIES
+        if original != "鮫"
+    ]
+    write_dataset(dataset_dir, edited)
+    rag = JLPTVocabularyRAG(data_dir=str(tmp_path / "data"), embedding_cache_dir="", embedding_backend="hashing",
+                            search_backend="numpy", field_vectors=False)
+    asyncio.run(rag._download_and_load_data())
+    rag.index_rows = rag._prepare_index_rows()
+
+    counts = asyncio.run(rag._sync_vector_index(rag.index_rows))
+
+    assert counts == {"embedded": 2, "relabeled": 5, "deleted": 1}
+    assert rag.collection.count() == len(edited)
+    stored = rag.collection.get(include=["metadatas"])
+    row_ids = {metadata["original"]: metadata["row_id"] for metadata in stored["metadatas"]}
+    assert row_ids == {original: row_id for row_id, (original, _, _, _) in enumerate(edited)}
+    assert asyncio.run(rag._sync_vector_index(rag.index_rows)) == {"embedded": 0, "relabeled": 0, "deleted": 0}
+
+
+def test_interrupted_build_resumes_from_checkpoint(tmp_path, dataset_dir):
+    rag = make_rag(tmp_path)
+    # As if the build died after writing five rows' chunks and no manifest
+    rag.manifest_path.unlink()
+    rag._reset_checkpoint()
+    rag._append_checkpoint(rag.index_rows[:3])
+    rag._append_checkpoint(rag.index_rows[3:5])
+
+    counts = asyncio.run(rag._sync_vector_index(rag.index_rows))
+
+    assert counts == {"embedded": len(ENTRIES) - 5, "relabeled": 0, "deleted": 0}
+    assert not rag.checkpoint_path.exists()
+    assert asyncio.run(rag._sync_vector_index(rag.index_rows))["embedded"] == 0
+
+
+def test_checkpoint_stops_at_a_torn_line(tmp_path, dataset_dir):
+    rag = make_rag(tmp_path)
+    rag._reset_checkpoint()
+    rag._append_checkpoint(rag.index_rows[:2])
+    with open(rag.checkpoint_path, "a", encoding="utf-8") as f:
+        f.write('{"entries": {"jlpt_')
+
+    assert set(rag._load_checkpoint()) == {row["id"] for row in rag.index_rows[:2]}
+
+    rag.model_name = "another-model"
+    assert rag._load_checkpoint() is None
+
+
+def test_worker_times_only_its_own_encoding(monkeypatch):
+    class SlowModel:
+        def encode(self, documents, show_progress_bar=False):
+            time.sleep(0.05)
+            return [[1.0, 0.0]] * len(documents)
+
+    monkeypatch.setattr(jlpt_rag_service, "_worker_model", SlowModel())
+
+    embeddings, seconds = jlpt_rag_service._encode_in_worker(["a", "b"])
+
+    assert embeddings.shape == (2, 2)
+    assert 0.05 <= seconds < 1.0
+
+
+def test_neighbor_graph_is_skipped_above_the_size_limit(tmp_path, dataset_dir, monkeypatch):
+    monkeypatch.setattr(jlpt_rag_service.settings, "jlpt_neighbor_max_entries", len(ENTRIES) - 1)
+
+    rag = make_rag(tmp_path)
+
+    assert rag.neighbor_graph is None
+    assert rag.get_similar_words("水", n_results=3)
+
+    # A graph saved while the corpus was within the limit is still used
+    monkeypatch.setattr(jlpt_rag_service.settings, "jlpt_neighbor_max_entries", 0)
+    make_rag(tmp_path)
+    monkeypatch.setattr(jlpt_rag_service.settings, "jlpt_neighbor_max_entries", len(ENTRIES) - 1)
+    assert make_rag(tmp_path).neighbor_graph is not None
@@ -0,0 +1,62 @@
+"""Tests for kana folding and romanization."""
+
+from ai_nihongo.services.kana import (
+    fold_kana,
+    is_romaji,
+    kana_to_romaji,
+    romaji_query_to_kana,
+    romaji_to_kana,
+)
+
+
+def test_fold_kana_maps_katakana_and_long_vowels():
+    assert fold_kana("コーヒー") == "こおひい"
+    assert fold_kana("ﾗｰﾒﾝ") == "らあめん"
+    assert fold_kana("たべる") == "たべる"
+    assert fold_kana("食べる") == "食べる"
+
+
+def test_kana_to_romaji_hepburn():
+    assert kana_to_romaji("たべる") == "taberu"
+    assert kana_to_romaji("がっこう") == "gakkou"
+    assert kana_to_romaji("まっちゃ") == "matcha"
+    assert kana_to_romaji("しゃしん") == "shashin"
+    assert kana_to_romaji("きんえん") == "kin'en"
+    assert kana_to_romaji("テレビ") == "terebi"
+
+
+def test_kana_to_romaji_kunrei():
+    assert kana_to_romaji("しんぶん", "kunrei") == "sinbun"
+    assert kana_to_romaji("まっちゃ", "kunrei") == "mattya"
+
+
+def test_romaji_to_kana_hepburn_and_kunrei():
+    assert romaji_to_kana("taberu") == "たべる"
+    assert romaji_to_kana("shinbun") == romaji_to_kana("sinbun") == "しんぶん"
+    assert romaji_to_kana("chotto") == romaji_to_kana("tyotto") == "ちょっと"
+    assert romaji_to_kana("jisho") == romaji_to_kana("zisyo") == "じしょ"
+    assert romaji_to_kana("terebi", katakana=True) == "テレビ"
+
+
+def test_romaji_to_kana_sokuon_and_hatsuon():
+    assert romaji_to_kana("gakkou") == "がっこう"
+    assert romaji_to_kana("matcha") == romaji_to_kana("maccha") == "まっちゃ"
+    assert romaji_to_kana("konnichiwa") == "こんにちわ"
+    assert romaji_to_kana("kin'en") == "きんえん"
+    assert romaji_to_kana("kinen") == "きねん"
+    assert romaji_to_kana("shimbun") == "しんぶん"
+    assert romaji_to_kana("hon") == "ほん"
+    assert romaji_to_kana("tōkyō") == "とうきょう"
+
+
+def test_romaji_query_to_kana_requires_full_conversion():
+    assert romaji_query_to_kana("benkyou") == "べんきょう"
+    assert romaji_query_to_kana("water") == ""
+    assert romaji_query_to_kana("") == ""
+
+
+def test_is_romaji():
+    assert is_romaji("taberu")
+    assert is_romaji("gakkou")
+    assert not is_romaji("water")
+    assert not is_romaji("")
@@ -0,0 +1,92 @@
+"""Tests for the lexical inverted index."""
+
+from ai_nihongo.services.lexical_index import LexicalIndex, char_ngrams, reciprocal_rank_fusion
+
+
+ENTRIES = [
+    ("食べる", "たべる", "to eat", "N5"),
+    ("食べ物", "たべもの", "food", "N5"),
+    ("飲む", "のむ", "to drink", "N5"),
+    ("食堂", "しょくどう", "dining hall; cafeteria", "N4"),
+    ("経済", "けいざい", "economy; economics", "N3"),
+    ("経済学", "けいざいがく", "economics (study)", "N2"),
+]
+
+
+def make_index():
+    rows = [
+        {
+            "id": f"jlpt_{i}",
+            "document": original,
+            "metadata": {"original": original, "furigana": furigana, "english": english, "jlpt_level": level}
+        }
+        for i, (original, furigana, english, level) in enumerate(ENTRIES)
+    ]
+    return LexicalIndex(rows)
+
+
+class TestLexicalIndex:
+    """Test cases for LexicalIndex lookups."""
+
+    def test_exact_hits_on_every_field(self):
+        index = make_index()
+
+        assert index.exact("食べる") == [0]
+        assert index.exact("たべる") == [0]
+        assert index.exact("To Eat") == [0]
+        # Dictionary-style lookup without the infinitive marker
+        assert index.exact("drink") == [2]
+        # Each gloss of a multi-meaning entry is its own key
+        assert index.exact("cafeteria") == [3]
+        assert index.exact("economics") == [4]
+        assert index.exact("ＥＣＯＮＯＭＹ") == [4]
+        assert index.exact("eating") == []
+
+    def test_ngram_recall_for_japanese_substrings(self):
+        index = make_index()
+
+        positions = [p for p, _ in index.search("食べ")]
+        assert sorted(positions) == [0, 1]
+        # One-character queries are served by unigrams
+        assert sorted(p for p, _ in index.search("食")) == [0, 1, 3]
+        assert sorted(p for p, _ in index.search("ざい")) == [4, 5]
+
+    def test_full_field_matches_rank_first(self):
+        index = make_index()
+
+        results = index.search("経済")
+
+        assert [p for p, _ in results] == [4, 5]
+        assert results[0][1] == 1.0
+        assert 0.0 < results[1][1] < 1.0
+
+    def test_english_substrings_need_every_word(self):
+        index = make_index()
+
+        assert [p for p, _ in index.search("dining hall")] == [3]
+        assert index.search("dining room") == []
+
+    def test_level_filtering(self):
+        index = make_index()
+
+        assert index.exact("economics", jlpt_levels=["N2"]) == []
+        assert [p for p, _ in index.search("経済", jlpt_levels=["N2"])] == [5]
+        assert sorted(p for p, _ in index.search("食", jlpt_levels=["N4"])) == [3]
+
+    def test_limit(self):
+        assert len(make_index().search("食", limit=2)) == 2
+
+
+def test_char_ngrams():
+    assert char_ngrams("たべる") == {"たべ", "べる"}
+    assert char_ngrams("水") == {"水"}
+    assert char_ngrams("") == set()
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "c", "d"]])
+
+    assert [item_id for item_id, _ in fused] == ["b", "c", "a", "d"]
+    assert fused[0][1] == 1 / 61 + 1 / 62
+    # A single first place scores below ids both lists ranked
+    assert fused[2][1] == 1 / 61
@@ -0,0 +1,46 @@
+"""Tests for the precomputed nearest-neighbour graph."""
+
+import numpy as np
+
+from ai_nihongo.services.neighbor_graph import NeighborGraph
+
+
+def brute_force(embeddings, k):
+    matrix = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    scores = matrix @ matrix.T
+    np.fill_diagonal(scores, -np.inf)
+    return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+
+def test_matches_brute_force_across_blocks():
+    embeddings = np.random.default_rng(0).normal(size=(50, 8)).astype(np.float32)
+
+    graph = NeighborGraph.build(embeddings, k=5, block_rows=7)
+
+    assert graph.neighbors.dtype == np.int32
+    assert graph.scores.dtype == np.float16
+    assert graph.neighbors.shape == (50, 5)
+    np.testing.assert_array_equal(graph.neighbors, brute_force(embeddings, 5))
+    assert np.all(np.diff(graph.scores.astype(np.float32), axis=1) <= 0)
+
+
+def test_rows_are_never_their_own_neighbour():
+    embeddings = np.ones((4, 3), dtype=np.float32)
+
+    graph = NeighborGraph.build(embeddings, k=10)
+
+    assert graph.k == 3
+    for row in range(4):
+        neighbors, _ = graph.neighbors_of(row)
+        assert row not in neighbors
+
+
+def test_persisted_graph_is_reused_only_for_same_fingerprint(tmp_path):
+    path = str(tmp_path / "neighbors.npz")
+    graph = NeighborGraph.build(np.eye(4, dtype=np.float32) + 0.1, k=2)
+    graph.save(path, "v1")
+
+    loaded = NeighborGraph.load(path, "v1")
+    np.testing.assert_array_equal(loaded.neighbors, graph.neighbors)
+    assert NeighborGraph.load(path, "v2") is None
+    assert NeighborGraph.load(str(tmp_path / "missing.npz"), "v1") is None
@@ -0,0 +1,67 @@
+"""Tests for the compact token and analysis records."""
+
+import json
+import pickle
+
+from ai_nihongo.services.text_analysis import TextAnalysis, Token
+
+
+def make_analysis():
+    tokens = [
+        Token("本", "名詞", "普通名詞", "本", "ホン", "ホン"),
+        Token("を", "助詞", "格助詞", reading="ヲ", pronunciation="オ"),
+        Token("読む", "動詞", "一般", "読む", "ヨム"),
+        Token("!", "記号"),
+    ]
+    return TextAnalysis("本を読む!", tokens, "beginner", grammar_patterns=["verb_particle_construction"])
+
+
+def test_token_reads_like_the_dict_schema():
+    token = Token("を", "助詞", reading="ヲ")
+
+    assert token["surface"] == "を"
+    assert token["base_form"] == "を"
+    assert token.get("missing") is None
+    assert dict(token) == {
+        "surface": "を", "pos": "助詞", "pos_detail": "", "base_form": "を", "reading": "ヲ", "pronunciation": ""
+    }
+    assert not hasattr(token, "__dict__")
+
+
+def test_pos_strings_are_interned():
+    first = Token("本", "".join(["名", "詞"]))
+    second = Token("水", "".join(["名", "詞"]))
+
+    assert first.pos is second.pos
+
+
+def test_parallel_lists_are_derived_from_tokens():
+    analysis = make_analysis()
+
+    assert analysis["pos_tags"] == ["名詞", "助詞", "動詞", "記号"]
+    assert analysis["pronunciations"] == ["ホン", "オ", "ヨム", "!"]
+    assert list(analysis) == [
+        "original_text", "tokens", "pos_tags", "pronunciations",
+        "meanings", "difficulty_level", "kanji_info", "grammar_patterns"
+    ]
+
+
+def test_to_dict_is_json_ready_and_matches_repr():
+    analysis = make_analysis()
+    materialized = analysis.to_dict()
+
+    assert json.loads(json.dumps(materialized, ensure_ascii=False)) == materialized
+    assert materialized["tokens"][1] == {
+        "surface": "を", "pos": "助詞", "pos_detail": "格助詞", "base_form": "を", "reading": "ヲ", "pronunciation": "オ"
+    }
+    assert repr(analysis) == repr(materialized)
+    assert analysis == materialized
+
+
+def test_records_survive_pickling():
+    analysis = make_analysis()
+
+    restored = pickle.loads(pickle.dumps(analysis))
+
+    assert restored == analysis
+    assert isinstance(restored["tokens"][0], Token)
@@ -0,0 +1,121 @@
+"""Tests for the in-memory vector search backends."""
+
+import numpy as np
+import pytest
+
+from ai_nihongo.services.vector_backends import (
+    CompressedNumpySearchBackend,
+    IVFSearchBackend,
+    NumpySearchBackend,
+)
+
+
+def make_corpus(n=500, dim=64, rank=12, seed=0):
+    # Sentence embeddings concentrate in a low-rank subspace; mimic that
+    rng = np.random.default_rng(seed)
+    latent = rng.normal(size=(n, rank)) @ rng.normal(size=(rank, dim))
+    embeddings = (latent + 0.1 * rng.normal(size=(n, dim))).astype(np.float32)
+    ids = [f"jlpt_{i}" for i in range(n)]
+    metadatas = [{"jlpt_level": f"N{i % 5 + 1}"} for i in range(n)]
+    documents = [f"doc {i}" for i in range(n)]
+    return ids, embeddings, metadatas, documents
+
+
+class TestNumpySearchBackend:
+    """Test cases for exact in-memory search."""
+
+    def test_matches_brute_force(self):
+        ids, embeddings, metadatas, documents = make_corpus()
+        backend = NumpySearchBackend(ids, embeddings, metadatas, documents)
+        query = embeddings[:3] + 0.1
+
+        results = backend.query(query, n_results=5)
+
+        normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        expected = np.argsort(-(query @ normalized.T), axis=1)[:, :5]
+        assert results["ids"] == [[ids[i] for i in row] for row in expected]
+
+    def test_level_filter(self):
+        backend = NumpySearchBackend(*make_corpus())
+        results = backend.query(np.ones((1, 64), dtype=np.float32), n_results=10, jlpt_levels=["N3"])
+
+        assert len(results["ids"][0]) == 10
+        assert all(m["jlpt_level"] == "N3" for m in results["metadatas"][0])
+
+
+class TestCompressedNumpySearchBackend:
+    """Test cases for compressed candidate generation with float32 re-ranking."""
+
+    @pytest.mark.parametrize("compression", ["int8", "pca"])
+    def test_recall_against_exact_search(self, compression):
+        ids, embeddings, metadatas, documents = make_corpus()
+        backend = CompressedNumpySearchBackend(ids, embeddings, metadatas, documents, compression=compression)
+
+        report = backend.recall_at_k(embeddings[:50] + 0.05, k=10)
+
+        assert report["queries"] == 50
+        assert report["recall_at_k"] >= 0.95
+
+    def test_memory_mapped_rerank_vectors(self, tmp_path):
+        ids, embeddings, metadatas, documents = make_corpus(n=2000)
+        backend = CompressedNumpySearchBackend(
+            ids, embeddings, metadatas, documents,
+            compression="int8",
+            rerank_store=str(tmp_path / "rerank.npy")
+        )
+
+        report = backend.memory_report()
+        assert report["rerank_vectors"] == "mmap"
+        assert report["compression_ratio"] >= 3.9
+
+        exact = NumpySearchBackend(ids, embeddings, metadatas, documents)
+        query = embeddings[:5]
+        assert backend.query(query, n_results=3)["ids"] == exact.query(query, n_results=3)["ids"]
+
+    def test_small_corpus_memory_report(self, tmp_path):
+        ids, embeddings, metadatas, documents = make_corpus(n=20, dim=384)
+
+        pca = CompressedNumpySearchBackend(
+            ids, embeddings, metadatas, documents,
+            compression="pca", rerank_store=str(tmp_path / "pca.npy")
+        ).memory_report()
+        int8 = CompressedNumpySearchBackend(
+            ids, embeddings, metadatas, documents,
+            compression="int8", rerank_store=str(tmp_path / "int8.npy")
+        ).memory_report()
+
+        # PCA sizes its projection so the whole index still saves 4x
+        assert pca["compression_ratio"] >= 4.0
+        assert pca["index_dimension"] < 384 // 4
+        # The int8 scale vector is a fixed cost that small corpora don't amortize
+        assert int8["row_compression_ratio"] == 4.0
+        assert int8["compression_ratio"] < 4.0
+        assert int8["overhead_bytes"] == 384 * 4
+
+    def test_unknown_compression(self):
+        with pytest.raises(ValueError):
+            CompressedNumpySearchBackend(*make_corpus(), compression="int4")
+
+
+class TestIVFSearchBackend:
+    """Test cases for the level-aware IVF index."""
+
+    def test_recall_and_level_filter(self):
+        ids, embeddings, metadatas, documents = make_corpus(n=2000)
+        backend = IVFSearchBackend(ids, embeddings, metadatas, documents, nprobe=4)
+
+        assert backend.recall_at_k(embeddings[:50] + 0.05, k=10)["recall_at_k"] >= 0.9
+
+        results = backend.query(embeddings[:2], n_results=20, jlpt_levels=["N2", "N4"])
+        assert all(len(row) == 20 for row in results["ids"])
+        assert all(m["jlpt_level"] in ("N2", "N4") for row in results["metadatas"] for m in row)
+
+    def test_layout_is_persisted(self, tmp_path):
+        ids, embeddings, metadatas, documents = make_corpus()
+        path = str(tmp_path / "ivf.npz")
+
+        first = IVFSearchBackend(ids, embeddings, metadatas, documents, index_path=path)
+        second = IVFSearchBackend(ids, embeddings, metadatas, documents, index_path=path)
+
+        assert second.ids == first.ids
+        np.testing.assert_array_equal(second.centroids, first.centroids)
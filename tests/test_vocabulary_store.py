@@ -0,0 +1,69 @@
+"""Tests for the columnar JLPT vocabulary store."""
+
+from ai_nihongo.services.vocabulary_store import VocabularyStore
+
+
+CSV_CONTENT = """Original,Furigana,English,JLPT Level
+食べる,たべる,to eat,N5
+飲む,のむ,to drink,N5
+経済,けいざい,economy,N3
+政治,,politics,N2
+淡水,たんすい,fresh water,N2
+"""
+
+
+class TestVocabularyStore:
+    """Test cases for VocabularyStore."""
+
+    def test_from_csv_drops_incomplete_rows(self, tmp_path):
+        """Test that rows with missing values are skipped."""
+        csv_path = tmp_path / "jlpt_vocab.csv"
+        csv_path.write_text(CSV_CONTENT, encoding="utf-8")
+
+        store = VocabularyStore.from_csv(str(csv_path))
+
+        assert len(store) == 4
+        assert store.level_names == ["N2", "N3", "N5"]
+        assert store.entry(3) == {
+            "original": "淡水",
+            "furigana": "たんすい",
+            "english": "fresh water",
+            "jlpt_level": "N2"
+        }
+
+    def test_entries_for_level(self):
+        """Test level listing keeps dataset order and honours the limit."""
+        store = VocabularyStore(
+            ["食べる", "経済", "飲む"], ["たべる", "けいざい", "のむ"],
+            ["to eat", "economy", "to drink"], ["N5", "N3", "N5"]
+        )
+
+        assert [e["original"] for e in store.entries_for_level("N5")] == ["食べる", "飲む"]
+        assert len(store.entries_for_level("N5", limit=1)) == 1
+        assert store.entries_for_level("N1") == []
+
+    def test_sample_is_distinct_and_filtered(self):
+        """Test random sampling within a level."""
+        store = VocabularyStore(
+            ["食べる", "経済", "飲む"], ["たべる", "けいざい", "のむ"],
+            ["to eat", "economy", "to drink"], ["N5", "N3", "N5"]
+        )
+
+        sample = store.sample(jlpt_level="N5", count=10)
+
+        assert len(sample) == 2
+        assert {e["original"] for e in sample} == {"食べる", "飲む"}
+        assert store.sample(jlpt_level="N1") == []
+
+    def test_statistics(self):
+        """Test precomputed level statistics."""
+        store = VocabularyStore(
+            ["食べる", "経済", "飲む", "淡水"], ["たべる", "けいざい", "のむ", "たんすい"],
+            ["to eat", "economy", "to drink", "fresh water"], ["N5", "N3", "N5", "N2"]
+        )
+
+        stats = store.statistics()
+
+        assert stats["total_vocabulary"] == 4
+        assert stats["levels"]["N5"] == {"count": 2, "percentage": 50.0}
+        assert stats["levels"]["N2"] == {"count": 1, "percentage": 25.0}